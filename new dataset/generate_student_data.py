@@ -1,11 +1,9 @@
 import pandas as pd
 import numpy as np
 from scipy.stats import truncnorm
-import random
 
 # Set random seed for reproducibility (you can change this)
-np.random.seed(42)
-random.seed(42)
+rng = np.random.default_rng(42)
 
 # Load data
 print("Loading data...")
@@ -14,6 +12,7 @@ domain_df = pd.read_csv('domain.csv')
 
 # Extract department from roll number
 students_df['dept'] = students_df['roll_no'].str[2:4]
+dept = students_df['dept'].to_numpy()
 
 print(f"Total students: {len(students_df)}")
 print(f"\nDepartment distribution:")
@@ -25,14 +24,16 @@ non_core_depts = ['CS', 'MA', 'CY', 'PH', 'AE', 'NA', 'AG', 'BT', 'HS']
 quant_preferred_depts = ['CS', 'MA', 'EC', 'EE', 'IM', 'ME']
 
 # Parse domain data
-domain_skills = {}
-for _, row in domain_df.iterrows():
-    domain = row['domain']
-    skills = row['skills_for_domain']
-    domain_skills[domain] = skills
+domain_skills = dict(zip(domain_df['domain'], domain_df['skills_for_domain']))
 
 print(f"\nAvailable domains: {list(domain_skills.keys())}")
 
+
+def sample(indices, k):
+    """k indices drawn without replacement, in random order (at most all of them)"""
+    indices = np.asarray(indices, dtype=np.int64)
+    return rng.choice(indices, size=min(k, len(indices)), replace=False)
+
 # =============================================================================
 # STEP 1: Generate CGPA using truncated normal distribution
 # =============================================================================
@@ -61,40 +62,32 @@ b = (upper_bound - mean_cgpa) / std_cgpa
 cgpa_dist = truncnorm(a, b, loc=mean_cgpa, scale=std_cgpa)
 
 # Generate base CGPA for all students
-base_cgpas = cgpa_dist.rvs(total_students)
+base_cgpas = cgpa_dist.rvs(total_students, random_state=rng)
 
-# Initialize CGPA array
+# Initialize CGPA array (0 = not yet assigned)
 cgpas = np.zeros(total_students)
 
 # Get indices by department
-cs_indices = students_df[students_df['dept'] == 'CS'].index.tolist()
-ma_indices = students_df[students_df['dept'] == 'MA'].index.tolist()
-other_indices = students_df[~students_df['dept'].isin(['CS', 'MA'])].index.tolist()
+cs_indices = np.flatnonzero(dept == 'CS')
+ma_indices = np.flatnonzero(dept == 'MA')
+other_indices = np.flatnonzero(~np.isin(dept, ['CS', 'MA']))
 
 print(f"CS students: {len(cs_indices)}")
 print(f"MA students: {len(ma_indices)}")
 print(f"Other students: {len(other_indices)}")
 
-# Sort base CGPAs to allocate high CGPAs strategically
-sorted_cgpas = np.sort(base_cgpas)[::-1]  # Sort in descending order
+
+def allocate_high_cgpas(indices, n_high, n_top):
+    """Give n_top of the sampled students CGPA in [9.5, 10) and the next ones up to n_high [9.0, 9.5)"""
+    top, high = indices[:n_top], indices[n_top:n_high]
+    cgpas[top] = rng.uniform(9.5, 10.0, size=len(top))
+    cgpas[high] = rng.uniform(9.0, 9.5, size=len(high))
 
 # Allocate top CGPAs to CS students (40 students with 9+, 16 with 9.5+)
-cs_high_cgpa_indices = random.sample(cs_indices, min(40, len(cs_indices)))
-# 16 with 9.5+
-for i, idx in enumerate(cs_high_cgpa_indices[:16]):
-    cgpas[idx] = np.random.uniform(9.5, 10.0)
-# Remaining 24 with 9.0-9.5
-for idx in cs_high_cgpa_indices[16:40]:
-    cgpas[idx] = np.random.uniform(9.0, 9.5)
+allocate_high_cgpas(sample(cs_indices, 40), 40, 16)
 
 # Allocate to MA students (18 students with 9+, 6 with 9.5+)
-ma_high_cgpa_indices = random.sample(ma_indices, min(18, len(ma_indices)))
-# 6 with 9.5+
-for idx in ma_high_cgpa_indices[:6]:
-    cgpas[idx] = np.random.uniform(9.5, 10.0)
-# Remaining 12 with 9.0-9.5
-for idx in ma_high_cgpa_indices[6:18]:
-    cgpas[idx] = np.random.uniform(9.0, 9.5)
+allocate_high_cgpas(sample(ma_indices, 18), 18, 6)
 
 # Calculate remaining high CGPA slots
 # Target: ~37 total with 9.5+, we've assigned 16+6=22, need ~15 more
@@ -103,25 +96,17 @@ remaining_95plus_needed = 15
 # We have 40+18=58 from CS and MA, need ~40 more from others
 
 # Allocate remaining high CGPAs to other departments
-high_cgpa_other = random.sample(other_indices, min(50, len(other_indices)))
-for idx in high_cgpa_other[:remaining_95plus_needed]:
-    cgpas[idx] = np.random.uniform(9.5, 10.0)
-for idx in high_cgpa_other[remaining_95plus_needed:40]:
-    cgpas[idx] = np.random.uniform(9.0, 9.5)
-
-# Fill remaining students with base distribution
-unassigned_indices = [i for i in range(total_students) if cgpas[i] == 0]
-remaining_cgpas = [c for c in base_cgpas if c < 9.0]
-random.shuffle(remaining_cgpas)
-
-for i, idx in enumerate(unassigned_indices):
-    if i < len(remaining_cgpas):
-        cgpas[idx] = remaining_cgpas[i]
-    else:
-        # Generate new CGPA if needed
-        cgpas[idx] = cgpa_dist.rvs(1)[0]
-        while cgpas[idx] >= 9.0:  # Ensure it's below 9
-            cgpas[idx] = cgpa_dist.rvs(1)[0]
+allocate_high_cgpas(sample(other_indices, 50), 40, remaining_95plus_needed)
+
+# Fill remaining students with the base draws below 9.0 (shuffled), then fresh draws below 9.0
+unassigned_indices = np.flatnonzero(cgpas == 0)
+remaining_cgpas = rng.permutation(base_cgpas[base_cgpas < 9.0])
+n_from_base = min(len(unassigned_indices), len(remaining_cgpas))
+cgpas[unassigned_indices[:n_from_base]] = remaining_cgpas[:n_from_base]
+if n_from_base < len(unassigned_indices):
+    below_9_dist = truncnorm(a, (9.0 - mean_cgpa) / std_cgpa, loc=mean_cgpa, scale=std_cgpa)
+    cgpas[unassigned_indices[n_from_base:]] = below_9_dist.rvs(len(unassigned_indices) - n_from_base,
+                                                               random_state=rng)
 
 # Round to 2 decimal places
 cgpas = np.round(cgpas, 2)
@@ -150,23 +135,22 @@ print("\n" + "="*80)
 print("STEP 2: Assigning Domains and Skills")
 print("="*80)
 
-# Initialize columns
-students_df['domain_1'] = ''
-students_df['skills_for_domain_1'] = ''
-students_df['domain_2'] = ''
-students_df['skills_for_domain_2'] = ''
+# Domain columns ('' = none); skills are filled from the domains at the end
+domain_1 = np.full(total_students, '', dtype=object)
+domain_2 = np.full(total_students, '', dtype=object)
 
-# Track assignments
-domain_stats = {'SDE': 0, 'Quant': 0, 'Data': 0, 'Finance': 0, 'CONSULTING': 0, 'Core': 0}
-students_with_one_domain = 0
+# Core domain of each student's department (only used for core-eligible departments)
+core_eligible = np.isin(dept, core_eligible_depts)
+core_domain = np.array([f'Core_{d}' for d in dept], dtype=object)
 
-# Get students with 9+ CGPA (eligible for Quant)
-high_cgpa_students = students_df[students_df['cgpa'] >= 9.0].index.tolist()
-print(f"\nTotal students with CGPA >= 9.0: {len(high_cgpa_students)}")
+
+def sde_or_data(n):
+    """n uniform picks between SDE and Data"""
+    return np.where(rng.random(n) < 0.5, 'SDE', 'Data').astype(object)
 
 # Get students with 9+ CGPA (eligible for Quant)
-high_cgpa_students = students_df[students_df['cgpa'] >= 9.0].index.tolist()
-print(f"\nTotal students with CGPA >= 9.0: {len(high_cgpa_students)}")
+is_high_cgpa = cgpas >= 9.0
+print(f"\nTotal students with CGPA >= 9.0: {is_high_cgpa.sum()}")
 
 # For quant, we need ~98 students, so ensure we have enough high CGPA students
 # If not enough from preferred depts, we'll also consider other students with 9+ CGPA
@@ -174,145 +158,94 @@ target_quant = int(0.08 * total_students)
 print(f"Target quant students: {target_quant}")
 
 # Prioritize quant candidates from preferred departments
-quant_preferred_candidates = []
-for idx in high_cgpa_students:
-    dept = students_df.loc[idx, 'dept']
-    if dept in quant_preferred_depts:
-        quant_preferred_candidates.append(idx)
-
-# Add other high CGPA students if needed
-quant_other_candidates = []
-for idx in high_cgpa_students:
-    dept = students_df.loc[idx, 'dept']
-    if dept not in quant_preferred_depts and idx not in quant_preferred_candidates:
-        quant_other_candidates.append(idx)
+is_quant_preferred = np.isin(dept, quant_preferred_depts)
+quant_preferred_candidates = np.flatnonzero(is_high_cgpa & is_quant_preferred)
+quant_other_candidates = np.flatnonzero(is_high_cgpa & ~is_quant_preferred)
 
 print(f"Quant candidates from preferred depts (CS,MA,EC,EE,IM,ME): {len(quant_preferred_candidates)}")
 print(f"Quant candidates from other depts: {len(quant_other_candidates)}")
 
 # Select quant students
 # Try to get as many as possible from preferred depts, fill rest from others
-quant_students = []
-
-# Distribute among preferred departments
-cs_quant_candidates = [idx for idx in quant_preferred_candidates if students_df.loc[idx, 'dept'] == 'CS']
-ma_quant_candidates = [idx for idx in quant_preferred_candidates if students_df.loc[idx, 'dept'] == 'MA']
-other_pref_quant_candidates = [idx for idx in quant_preferred_candidates if students_df.loc[idx, 'dept'] in ['EC', 'EE', 'IM', 'ME']]
+cs_quant_candidates = np.flatnonzero(is_high_cgpa & (dept == 'CS'))
+ma_quant_candidates = np.flatnonzero(is_high_cgpa & (dept == 'MA'))
+other_pref_quant_candidates = np.flatnonzero(is_high_cgpa & np.isin(dept, ['EC', 'EE', 'IM', 'ME']))
 
 # Calculate target distribution
 cs_quant_count = min(int(target_quant * 0.35), len(cs_quant_candidates))
 ma_quant_count = min(int(target_quant * 0.25), len(ma_quant_candidates))
 other_quant_count = min(target_quant - cs_quant_count - ma_quant_count, len(other_pref_quant_candidates))
 
-quant_students.extend(random.sample(cs_quant_candidates, cs_quant_count))
-quant_students.extend(random.sample(ma_quant_candidates, ma_quant_count))
-quant_students.extend(random.sample(other_pref_quant_candidates, other_quant_count))
+quant_students = np.concatenate([sample(cs_quant_candidates, cs_quant_count),
+                                 sample(ma_quant_candidates, ma_quant_count),
+                                 sample(other_pref_quant_candidates, other_quant_count)])
 
 # If still short, add from other departments
 if len(quant_students) < target_quant and len(quant_other_candidates) > 0:
-    remaining_needed = target_quant - len(quant_students)
-    quant_students.extend(random.sample(quant_other_candidates, min(remaining_needed, len(quant_other_candidates))))
+    quant_students = np.concatenate([quant_students,
+                                     sample(quant_other_candidates, target_quant - len(quant_students))])
 
 print(f"Actual quant students selected: {len(quant_students)}")
 
 # Assign Quant as domain_1, SDE as domain_2 for quant students
-for idx in quant_students:
-    students_df.loc[idx, 'domain_1'] = 'Quant'
-    students_df.loc[idx, 'skills_for_domain_1'] = domain_skills['Quant']
-    students_df.loc[idx, 'domain_2'] = 'SDE'
-    students_df.loc[idx, 'skills_for_domain_2'] = domain_skills['SDE']
-    domain_stats['Quant'] += 1
-    domain_stats['SDE'] += 1
+domain_1[quant_students] = 'Quant'
+domain_2[quant_students] = 'SDE'
 
 # Remaining students
-remaining_students = [idx for idx in students_df.index if idx not in quant_students]
-print(f"Remaining students to assign: {len(remaining_students)}")
+is_remaining = np.ones(total_students, dtype=bool)
+is_remaining[quant_students] = False
+print(f"Remaining students to assign: {is_remaining.sum()}")
+
+
+def assign_with_partner(students, domain):
+    """
+    Give each student the domain as domain_1 or domain_2 (50/50).
+    As domain_1 it is paired with the student's core domain (core-eligible departments)
+    or SDE/Data; as domain_2 it follows SDE/Data.
+    """
+    first = rng.random(len(students)) < 0.5
+    lead, follow = students[first], students[~first]
+    domain_1[lead] = domain
+    domain_2[lead] = np.where(core_eligible[lead], core_domain[lead], sde_or_data(len(lead)))
+    domain_1[follow] = sde_or_data(len(follow))
+    domain_2[follow] = domain
 
 # Select ~100 students for Finance domain (70% from HS)
 target_finance = 100
-hs_students = students_df[students_df['dept'] == 'HS'].index.tolist()
 hs_finance_count = int(target_finance * 0.7)
 non_hs_finance_count = target_finance - hs_finance_count
 
-hs_finance_candidates = [idx for idx in hs_students if idx in remaining_students]
-non_hs_finance_candidates = [idx for idx in remaining_students if idx not in hs_students]
-
-finance_students = []
-finance_students.extend(random.sample(hs_finance_candidates, min(hs_finance_count, len(hs_finance_candidates))))
-finance_students.extend(random.sample(non_hs_finance_candidates, min(non_hs_finance_count, len(non_hs_finance_candidates))))
+is_hs = dept == 'HS'
+finance_students = np.concatenate([sample(np.flatnonzero(is_remaining & is_hs), hs_finance_count),
+                                   sample(np.flatnonzero(is_remaining & ~is_hs), non_hs_finance_count)])
 
 print(f"Finance students: {len(finance_students)}")
 
 # Assign Finance domain randomly as domain_1 or domain_2
-for idx in finance_students:
-    if random.random() < 0.5:  # 50% chance domain_1
-        students_df.loc[idx, 'domain_1'] = 'Finance'
-        students_df.loc[idx, 'skills_for_domain_1'] = domain_skills['Finance']
-        # Assign domain_2 (SDE or Data or Core based on dept)
-        dept = students_df.loc[idx, 'dept']
-        if dept in core_eligible_depts:
-            students_df.loc[idx, 'domain_2'] = f'Core_{dept}'
-            students_df.loc[idx, 'skills_for_domain_2'] = domain_skills.get(f'Core_{dept}', domain_skills.get('CORE_' + dept, ''))
-            domain_stats['Core'] += 1
-        else:
-            choice = random.choice(['SDE', 'Data'])
-            students_df.loc[idx, 'domain_2'] = choice
-            students_df.loc[idx, 'skills_for_domain_2'] = domain_skills[choice]
-            domain_stats[choice] += 1
-    else:  # domain_2
-        # Assign domain_1 first (SDE or Data)
-        choice = random.choice(['SDE', 'Data'])
-        students_df.loc[idx, 'domain_1'] = choice
-        students_df.loc[idx, 'skills_for_domain_1'] = domain_skills[choice]
-        students_df.loc[idx, 'domain_2'] = 'Finance'
-        students_df.loc[idx, 'skills_for_domain_2'] = domain_skills['Finance']
-        domain_stats[choice] += 1
-    
-    domain_stats['Finance'] += 1
+assign_with_partner(finance_students, 'Finance')
 
 # Select ~125 students for Consulting domain
 target_consulting = 125
-consulting_candidates = [idx for idx in remaining_students if idx not in finance_students]
-consulting_students = random.sample(consulting_candidates, min(target_consulting, len(consulting_candidates)))
+is_consulting_candidate = is_remaining.copy()
+is_consulting_candidate[finance_students] = False
+consulting_students = sample(np.flatnonzero(is_consulting_candidate), target_consulting)
 
 print(f"Consulting students: {len(consulting_students)}")
 
 # Assign Consulting domain randomly
-for idx in consulting_students:
-    if random.random() < 0.5:  # domain_1
-        students_df.loc[idx, 'domain_1'] = 'CONSULTING'
-        students_df.loc[idx, 'skills_for_domain_1'] = domain_skills['CONSULTING']
-        # Assign domain_2
-        dept = students_df.loc[idx, 'dept']
-        if dept in core_eligible_depts:
-            students_df.loc[idx, 'domain_2'] = f'Core_{dept}'
-            students_df.loc[idx, 'skills_for_domain_2'] = domain_skills.get(f'Core_{dept}', domain_skills.get('CORE_' + dept, ''))
-            domain_stats['Core'] += 1
-        else:
-            choice = random.choice(['SDE', 'Data'])
-            students_df.loc[idx, 'domain_2'] = choice
-            students_df.loc[idx, 'skills_for_domain_2'] = domain_skills[choice]
-            domain_stats[choice] += 1
-    else:  # domain_2
-        choice = random.choice(['SDE', 'Data'])
-        students_df.loc[idx, 'domain_1'] = choice
-        students_df.loc[idx, 'skills_for_domain_1'] = domain_skills[choice]
-        students_df.loc[idx, 'domain_2'] = 'CONSULTING'
-        students_df.loc[idx, 'skills_for_domain_2'] = domain_skills['CONSULTING']
-        domain_stats[choice] += 1
-    
-    domain_stats['CONSULTING'] += 1
-
-# Process remaining students
-assigned_students = set(quant_students + finance_students + consulting_students)
-truly_remaining = [idx for idx in remaining_students if idx not in assigned_students]
+assign_with_partner(consulting_students, 'CONSULTING')
+
+# Process remaining students (in roll order)
+is_truly_remaining = is_consulting_candidate.copy()
+is_truly_remaining[consulting_students] = False
+truly_remaining = np.flatnonzero(is_truly_remaining)
 
 print(f"Truly remaining students: {len(truly_remaining)}")
 
 # Target: 70% should have SDE as one of their domains
 # We already assigned some SDE, need to reach ~857 (70% of 1225)
 target_sde_total = int(0.70 * total_students)
-current_sde = domain_stats['SDE']
+current_sde = int((domain_1 == 'SDE').sum() + (domain_2 == 'SDE').sum())
 additional_sde_needed = target_sde_total - current_sde
 
 print(f"Target SDE students: {target_sde_total}")
@@ -322,81 +255,54 @@ print(f"Additional SDE needed: {additional_sde_needed}")
 # Target: 200-300 students with only 1 domain
 target_single_domain = 250
 
-# Assign remaining students
-for idx in truly_remaining:
-    dept = students_df.loc[idx, 'dept']
-    cgpa = students_df.loc[idx, 'cgpa']
-    
-    # Decide if single domain or dual domain
-    if students_with_one_domain < target_single_domain and random.random() < 0.3:
-        # Single domain student
-        # Prioritize SDE if needed
-        if domain_stats['SDE'] < target_sde_total:
-            students_df.loc[idx, 'domain_1'] = 'SDE'
-            students_df.loc[idx, 'skills_for_domain_1'] = domain_skills['SDE']
-            domain_stats['SDE'] += 1
-        elif dept in core_eligible_depts:
-            students_df.loc[idx, 'domain_1'] = f'Core_{dept}'
-            students_df.loc[idx, 'skills_for_domain_1'] = domain_skills.get(f'Core_{dept}', domain_skills.get('CORE_' + dept, ''))
-            domain_stats['Core'] += 1
-        else:
-            choice = random.choice(['SDE', 'Data'])
-            students_df.loc[idx, 'domain_1'] = choice
-            students_df.loc[idx, 'skills_for_domain_1'] = domain_skills[choice]
-            domain_stats[choice] += 1
-        
-        students_with_one_domain += 1
-    
-    else:
-        # Dual domain student
-        # Check if student should have core based on department
-        should_have_core = (dept in core_eligible_depts) and (dept not in non_core_depts)
-        
-        if should_have_core and random.random() < 0.6:  # 60% of core-eligible get core
-            # Assign SDE or Data as domain_1, Core as domain_2
-            if domain_stats['SDE'] < target_sde_total:
-                students_df.loc[idx, 'domain_1'] = 'SDE'
-                students_df.loc[idx, 'skills_for_domain_1'] = domain_skills['SDE']
-                domain_stats['SDE'] += 1
-            else:
-                students_df.loc[idx, 'domain_1'] = 'Data'
-                students_df.loc[idx, 'skills_for_domain_1'] = domain_skills['Data']
-                domain_stats['Data'] += 1
-            
-            students_df.loc[idx, 'domain_2'] = f'Core_{dept}'
-            students_df.loc[idx, 'skills_for_domain_2'] = domain_skills.get(f'Core_{dept}', domain_skills.get('CORE_' + dept, ''))
-            domain_stats['Core'] += 1
-        
-        else:
-            # Assign SDE as domain_1, Data/other as domain_2
-            if domain_stats['SDE'] < target_sde_total:
-                students_df.loc[idx, 'domain_1'] = 'SDE'
-                students_df.loc[idx, 'skills_for_domain_1'] = domain_skills['SDE']
-                domain_stats['SDE'] += 1
-                
-                # Domain 2: Data or Core (if eligible)
-                if dept in core_eligible_depts and random.random() < 0.3:
-                    students_df.loc[idx, 'domain_2'] = f'Core_{dept}'
-                    students_df.loc[idx, 'skills_for_domain_2'] = domain_skills.get(f'Core_{dept}', domain_skills.get('CORE_' + dept, ''))
-                    domain_stats['Core'] += 1
-                else:
-                    students_df.loc[idx, 'domain_2'] = 'Data'
-                    students_df.loc[idx, 'skills_for_domain_2'] = domain_skills['Data']
-                    domain_stats['Data'] += 1
-            else:
-                # Use Data as domain_1
-                students_df.loc[idx, 'domain_1'] = 'Data'
-                students_df.loc[idx, 'skills_for_domain_1'] = domain_skills['Data']
-                domain_stats['Data'] += 1
-                
-                if dept in core_eligible_depts:
-                    students_df.loc[idx, 'domain_2'] = f'Core_{dept}'
-                    students_df.loc[idx, 'skills_for_domain_2'] = domain_skills.get(f'Core_{dept}', domain_skills.get('CORE_' + dept, ''))
-                    domain_stats['Core'] += 1
-                else:
-                    students_df.loc[idx, 'domain_2'] = 'SDE'
-                    students_df.loc[idx, 'skills_for_domain_2'] = domain_skills['SDE']
-                    domain_stats['SDE'] += 1
+# Students are taken in order: each one below the SDE target gets SDE (every rule
+# below picks SDE while the target is not reached), so the first additional_sde_needed
+# students are the SDE phase. About 30% take a single domain until 250 have one.
+n = len(truly_remaining)
+sde_phase = np.arange(n) < additional_sde_needed
+wants_single = rng.random(n) < 0.3
+single = wants_single & (np.cumsum(wants_single) <= target_single_domain)
+rows_core_eligible = core_eligible[truly_remaining]
+should_have_core = rows_core_eligible & ~np.isin(dept[truly_remaining], non_core_depts)
+core_second = should_have_core & (rng.random(n) < 0.6)  # 60% of core-eligible get core
+core_after_sde = rows_core_eligible & (rng.random(n) < 0.3)
+rows_core = core_domain[truly_remaining]
+none = np.full(n, '', dtype=object)
+
+first = np.select(
+    [single & sde_phase, single & rows_core_eligible, single,
+     sde_phase, core_second],
+    ['SDE', rows_core, sde_or_data(n),
+     'SDE', 'Data'],
+    default='Data')
+second = np.select(
+    [single, core_second,
+     sde_phase & core_after_sde, sde_phase,
+     rows_core_eligible],
+    [none, rows_core,
+     rows_core, 'Data',
+     rows_core],
+    default='SDE')
+domain_1[truly_remaining] = first
+domain_2[truly_remaining] = second
+students_with_one_domain = int(single.sum())
+
+
+def skills_for(domains):
+    """Skills string of each domain (core domains also looked up as CORE_<dept>)"""
+    lookup = {d: domain_skills.get(d, domain_skills.get('CORE_' + d[5:], '')) if d.startswith('Core_')
+              else domain_skills.get(d, '') for d in set(domains)}
+    return np.array([lookup[d] for d in domains], dtype=object)
+
+students_df['domain_1'] = domain_1
+students_df['skills_for_domain_1'] = skills_for(domain_1)
+students_df['domain_2'] = domain_2
+students_df['skills_for_domain_2'] = skills_for(domain_2)
+
+# Domain counts (a student counts once per domain slot)
+domain_stats = {name: int((domain_1 == name).sum() + (domain_2 == name).sum())
+                for name in ['SDE', 'Quant', 'Data', 'Finance', 'CONSULTING']}
+domain_stats['Core'] = int(sum(pd.Series(d).str.startswith('Core_').sum() for d in (domain_1, domain_2)))
 
 # =============================================================================
 # STEP 3: Final Statistics and Save
@@ -0,0 +1,253 @@
+"""
+Benchmark suite for the placement simulation pipeline.
+Times the loaders, each PlacementSimulation step, a full simulate_day, Monte
+Carlo throughput and the main dashboard endpoints on fixed synthetic fixtures
+(small/medium/large, see FIXTURES) and reports the results as JSON.
+"""
+
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import importlib.util
+from pathlib import Path
+from datetime import datetime
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from placement_simulation import STUDENTS_FILE_NAME, load_dataset, dataset_fingerprint
+from run_simulation import Scenario, SILENT_LOGGER, STEP_NAMES
+from monte_carlo import run_monte_carlo, spawn_seeds
+from synthetic_data import generate_dataset
+
+BENCHMARK_VERSION = 1
+
+# Fixture name -> number of students (companies and shortlists scale with the cohort)
+FIXTURES = {'S': 2_000, 'M': 20_000, 'L': 100_000}
+FIXTURE_SEED = 0
+DEFAULT_FIXTURE_DIR = Path(__file__).parent / '.bench_fixtures'
+SOURCE_DIR = Path(__file__).parent.parent
+
+SIMULATION_SEED = 42
+MONTE_CARLO_ROOT_SEED = 100
+
+# (method, path, JSON body); the results endpoints need the simulation run before them
+DASHBOARD_REQUESTS = [
+    ('GET', '/api/data/load', None),
+    ('GET', '/api/students?limit=100', None),
+    ('GET', '/api/companies', None),
+    ('GET', '/api/stats/summary', None),
+    ('GET', '/api/stats/department', None),
+    ('GET', '/api/stats/cgpa', None),
+    ('GET', '/api/stats/companies', None),
+    ('GET', '/api/stats/domain', None),
+    ('POST', '/api/simulation/run', {'random_seed': SIMULATION_SEED}),
+    ('GET', '/api/results/placements', None),
+    ('GET', '/api/results/company-wise', None),
+]
+
+
+# ============================================================================
+# TIMING
+# ============================================================================
+
+def summarize_times(times: Sequence[float]) -> Dict[str, float]:
+    """{repeat, mean_s, median_s, min_s, max_s} of a list of wall times"""
+    times = np.asarray(times, dtype=np.float64)
+    return {
+        'repeat': len(times),
+        'mean_s': float(times.mean()),
+        'median_s': float(np.median(times)),
+        'min_s': float(times.min()),
+        'max_s': float(times.max()),
+    }
+
+
+def measure(fn: Callable, repeat: int = 5, setup: Callable = None, warmup: int = 0) -> Dict[str, float]:
+    """Wall time of fn() (or fn(setup()) with an untimed setup per repetition)"""
+    times = []
+    for i in range(warmup + repeat):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        fn() if setup is None else fn(state)
+        if i >= warmup:
+            times.append(time.perf_counter() - start)
+    return summarize_times(times)
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def fixture_dir(size: str, root=DEFAULT_FIXTURE_DIR, source_dir=SOURCE_DIR) -> Path:
+    """Dataset directory of a fixture, generated on first use (fixed seed, so always the same data)"""
+    if size not in FIXTURES:
+        raise ValueError(f"Unknown fixture {size!r}; expected one of {sorted(FIXTURES)}")
+    path = Path(root) / f"{size}-{FIXTURES[size]}-seed{FIXTURE_SEED}"
+    marker = path / 'fixture.json'
+    if not marker.exists():
+        summary = generate_dataset(source_dir, path, FIXTURES[size], seed=FIXTURE_SEED)
+        marker.write_text(json.dumps(summary, indent=2))
+    return path
+
+
+# ============================================================================
+# STAGES
+# ============================================================================
+
+def bench_loaders(data_dir: Path, work_dir: Path, repeat: int) -> Tuple[Dict, Scenario, Path]:
+    """CSV parsing, parse cache, scenario build and snapshot save/open; returns (stages, scenario, snapshot)"""
+    cache_dir = work_dir / 'parse_cache'
+    snapshot = work_dir / 'scenario.snapshot'
+    stages = {
+        'load_dataset.parse': measure(lambda: load_dataset(data_dir, use_cache=False), repeat),
+        'load_dataset.cached': measure(lambda: load_dataset(data_dir, cache_dir=cache_dir), repeat, warmup=1),
+    }
+    dataset = load_dataset(data_dir, cache_dir=cache_dir)
+    stages['scenario.build'] = measure(lambda: Scenario(*dataset), repeat)
+    scenario = Scenario(*dataset)
+    fingerprint = dataset_fingerprint(data_dir)
+    stages['scenario.save'] = measure(lambda: scenario.save(snapshot, fingerprint=fingerprint), repeat)
+    stages['scenario.open'] = measure(lambda: Scenario.open(snapshot, data_dir=data_dir), repeat)
+    return stages, scenario, snapshot
+
+
+def bench_simulation(scenario: Scenario, repeat: int, day: int = 1) -> Dict:
+    """new_simulation, each step (summed over the day's serials) and a full simulate_day"""
+    def new_simulation():
+        return scenario.new_simulation(SIMULATION_SEED, logger=SILENT_LOGGER)
+
+    def simulate_day(sim):
+        sim.simulate_day(day)
+        day_times.append(sim.stats['timings']['days'][day])
+
+    # Step times are the ones the engine records in stats['timings']
+    day_times = []
+    stages = {'new_simulation': measure(new_simulation, repeat),
+              'simulate_day': measure(simulate_day, repeat, setup=new_simulation)}
+    for step in STEP_NAMES:
+        stages[step] = summarize_times([t[step] for t in day_times])
+    return stages
+
+
+def bench_monte_carlo(scenario: Scenario, runs: int, workers: int = 1) -> Dict:
+    """Throughput of run_monte_carlo (Day 1 replicates) in runs per second"""
+    start = time.perf_counter()
+    run_monte_carlo(scenario, spawn_seeds(MONTE_CARLO_ROOT_SEED, runs), workers=workers)
+    seconds = time.perf_counter() - start
+    return {'runs': runs, 'workers': workers, 'seconds': seconds, 'runs_per_s': runs / seconds}
+
+
+def load_dashboard_app():
+    """The dashboard module (dashboard/main.py), or None if FastAPI is not installed"""
+    try:
+        import fastapi  # noqa: F401
+    except ImportError:
+        return None
+    spec = importlib.util.spec_from_file_location('dashboard_main', Path(__file__).parent / 'dashboard' / 'main.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def bench_dashboard(data_dir: Path, snapshot: Path, repeat: int) -> Dict:
+    """Response time of the main dashboard endpoints served from the fixture (FastAPI TestClient)"""
+    dashboard = load_dashboard_app()
+    if dashboard is None:
+        return {'skipped': 'fastapi is not installed'}
+    from fastapi.testclient import TestClient
+
+    # Point the dashboard at the fixture instead of the bundled dataset
+    dashboard.BASE_DIR = data_dir
+    dashboard.STUDENTS_FILE = data_dir / STUDENTS_FILE_NAME
+    dashboard.COMPANIES_FILE = data_dir / 'companies.csv'
+    dashboard.SHORTLIST_DIR = data_dir / 'company shortlists(csv)'
+    dashboard.COMPANY_ORDER_FILE = data_dir / 'company_order.csv'
+    dashboard.SCENARIO_FILE = snapshot
+
+    stages = {}
+    with TestClient(dashboard.app) as client:
+        for method, path, body in DASHBOARD_REQUESTS:
+            def call():
+                response = client.request(method, path, json=body)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{method} {path} returned {response.status_code}: {response.text[:200]}")
+                if path == '/api/simulation/run':
+                    # Background tasks run before the TestClient returns; make sure it succeeded
+                    if dashboard.simulation_state['status'] != 'completed':
+                        raise RuntimeError(f"Dashboard simulation failed: {dashboard.simulation_state['message']}")
+            stages[f"{method} {path}"] = measure(call, repeat)
+    return stages
+
+
+# ============================================================================
+# SUITE
+# ============================================================================
+
+def run_benchmarks(sizes: Sequence[str] = ('S', 'M'), fixture_root=DEFAULT_FIXTURE_DIR, repeat: int = 5,
+                   mc_runs: int = 20, workers: int = 1, dashboard: bool = True, log=print) -> Dict:
+    """Run every stage on each fixture; returns the JSON-serializable report"""
+    report = {
+        'version': BENCHMARK_VERSION,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'machine': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+        },
+        'settings': {'repeat': repeat, 'mc_runs': mc_runs, 'workers': workers,
+                     'simulation_seed': SIMULATION_SEED, 'fixture_seed': FIXTURE_SEED},
+        'fixtures': {},
+    }
+    for size in sizes:
+        log(f"[{size}] preparing fixture ({FIXTURES[size]} students)")
+        data_dir = fixture_dir(size, fixture_root)
+        with tempfile.TemporaryDirectory() as tmp:
+            log(f"[{size}] loaders")
+            loaders, scenario, snapshot = bench_loaders(data_dir, Path(tmp), repeat)
+            log(f"[{size}] simulation steps")
+            simulation = bench_simulation(scenario, repeat)
+            log(f"[{size}] monte carlo ({mc_runs} runs)")
+            monte_carlo = bench_monte_carlo(scenario, mc_runs, workers)
+            if dashboard:
+                log(f"[{size}] dashboard endpoints")
+            report['fixtures'][size] = {
+                'students': len(scenario.student_table),
+                'companies': len(scenario.company_table),
+                'loaders': loaders,
+                'simulation': simulation,
+                'monte_carlo': monte_carlo,
+                'dashboard': bench_dashboard(data_dir, snapshot, repeat) if dashboard else {'skipped': 'disabled'},
+            }
+    return report
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the placement simulation pipeline")
+    parser.add_argument('--sizes', nargs='+', default=['S', 'M'], choices=sorted(FIXTURES),
+                        help="fixtures to run (S=2k, M=20k, L=100k students)")
+    parser.add_argument('--repeat', type=int, default=5, help="repetitions per timed stage")
+    parser.add_argument('--mc-runs', type=int, default=20, help="Monte Carlo runs for the throughput stage")
+    parser.add_argument('--workers', type=int, default=1, help="Monte Carlo worker processes")
+    parser.add_argument('--fixtures', default=str(DEFAULT_FIXTURE_DIR), help="fixture cache directory")
+    parser.add_argument('--no-dashboard', action='store_true', help="skip the dashboard endpoints")
+    parser.add_argument('--out', default=None, help="write the JSON report here (default: stdout)")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.sizes, args.fixtures, repeat=args.repeat, mc_runs=args.mc_runs,
+                            workers=args.workers, dashboard=not args.no_dashboard,
+                            log=lambda message: print(message, file=sys.stderr))
+    output = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(output + '\n')
+        print(f"Benchmark report written to: {args.out}", file=sys.stderr)
+    else:
+        print(output)
@@ -22,7 +22,8 @@ import asyncio
 sys.path.append(str(Path(__file__).parent.parent))
 
 from placement_simulation import *
-from run_simulation import PlacementSimulation
+from placement_simulation import SimulationConfig as EngineConfig
+from run_simulation import PlacementSimulation, Scenario, SILENT_LOGGER
 
 # Initialize FastAPI app
 app = FastAPI(title="Placement Simulation Dashboard", version="1.0.0")
@@ -45,6 +46,7 @@ STUDENTS_FILE = BASE_DIR / "analysis_data.csv"
 COMPANIES_FILE = BASE_DIR / "companies.csv"
 SHORTLIST_DIR = BASE_DIR / "company shortlists(csv)"
 COMPANY_ORDER_FILE = BASE_DIR / "company_order.csv"
+SCENARIO_FILE = BASE_DIR / "placement_simulation_model" / "scenario.snapshot"
 
 # Simulation state
 simulation_state = {
@@ -71,6 +73,8 @@ class SimulationConfig(BaseModel):
     over_offer_multiplier: float = 1.5
     use_dep_score: bool = True
     enforce_min_hires: bool = True
+    acceptance_mode: str = "random"  # "random" or "deferred" (stable matching, no over-offer)
+    full_season: bool = False
 
 class FilterParams(BaseModel):
     departments: Optional[List[str]] = None
@@ -471,44 +475,36 @@ async def run_simulation(config: SimulationConfig, background_tasks: BackgroundT
 async def execute_simulation(config: SimulationConfig):
     """Execute the simulation (runs in background)"""
     try:
-        # Update configuration
-        global W1_CGPA_PROFILE, W2_SKILL_PROFILE, W3_RANDOM_PROFILE, W4_DEP_SCORE_PROFILE
-        global W5_PROFILE_INTERVIEW, W6_CGPA_INTERVIEW, W7_RANDOM_INTERVIEW, P_OPT_OUT
-        
-        import placement_simulation
-        placement_simulation.W1_CGPA_PROFILE = config.w1_cgpa
-        placement_simulation.W2_SKILL_PROFILE = config.w2_skill
-        placement_simulation.W3_RANDOM_PROFILE = config.w3_random
-        placement_simulation.W4_DEP_SCORE_PROFILE = config.w4_dep_score
-        placement_simulation.W5_PROFILE_INTERVIEW = config.w5_profile
-        placement_simulation.W6_CGPA_INTERVIEW = config.w6_cgpa_interview
-        placement_simulation.W7_RANDOM_INTERVIEW = config.w7_random_interview
-        placement_simulation.P_OPT_OUT = config.p_opt_out
-        
-        # Set random seed
-        random.seed(config.random_seed)
-        np.random.seed(config.random_seed)
+        # Model parameters for this run only (no shared module state is modified)
+        engine_config = EngineConfig(**config.dict(exclude={'random_seed', 'full_season'}))
         
         simulation_state["message"] = "Loading data..."
         simulation_state["progress"] = 10
         
-        # Load data
-        students = load_students(STUDENTS_FILE)
-        companies = load_companies(COMPANIES_FILE, SHORTLIST_DIR)
-        company_order = load_company_order(COMPANY_ORDER_FILE)
+        # Attach to the compiled scenario if it matches the data, else load the CSVs
+        # (parsed columns are reused while the dataset files are unchanged)
+        scenario = None
+        if SCENARIO_FILE.exists():
+            try:
+                scenario = Scenario.open(SCENARIO_FILE, data_dir=BASE_DIR)
+            except ValueError:
+                scenario = None
+        if scenario is None:
+            scenario = Scenario(*load_dataset(BASE_DIR))
         
         simulation_state["message"] = "Initializing simulation..."
         simulation_state["progress"] = 20
         
         # Initialize simulation
-        sim = PlacementSimulation(students, companies, company_order)
+        sim = scenario.new_simulation(seed=config.random_seed, logger=SILENT_LOGGER, config=engine_config)
         simulation_state["simulation_instance"] = sim
         
-        simulation_state["message"] = "Running Day 1..."
-        simulation_state["progress"] = 30
-        
-        # Run simulation
-        sim.simulate_day(day=1)
+        # Run simulation (Day 1 only, or every arrival day)
+        days = sim.season_days() if config.full_season else [1]
+        for i, day in enumerate(days):
+            simulation_state["message"] = f"Running Day {day}..."
+            simulation_state["progress"] = 30 + int(60 * i / len(days))
+            sim.simulate_day(day=day)
         
         simulation_state["message"] = "Processing results..."
         simulation_state["progress"] = 90
@@ -0,0 +1,430 @@
+"""
+In-process Monte Carlo runner for the placement simulation.
+Data is parsed once into a Scenario; runs execute in a process pool (or inline)
+and their summaries are streamed, in run order, into running statistics.
+Each run draws from its own spawned SeedSequence stream (see spawn_seeds) and
+results are always folded in run order, so aggregates are bit-identical for
+any number of workers.
+"""
+
+import os
+import contextlib
+from statistics import NormalDist
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Iterable, Iterator, Sequence
+
+import numpy as np
+
+from placement_simulation import (STATUS_PLACED, STATUS_OPTED_OUT, STATUS_UNPLACED,
+                                  SimulationConfig, DEFAULT_CONFIG, ACCEPTANCE_MODES)
+from run_simulation import (Scenario, PlacementSimulation, CommonRandomNumbers, SILENT_LOGGER,
+                            spawn_seeds, seed_label)
+
+
+# ============================================================================
+# MODEL PARAMETERS
+# ============================================================================
+
+# Tunable parameters (SimulationConfig fields, same names as the dashboard's config)
+PARAMETERS = SimulationConfig.field_names()
+
+# Parameters taking one of a fixed set of strings instead of a number
+CHOICE_PARAMETERS = {'acceptance_mode': ACCEPTANCE_MODES}
+
+
+def make_config(params: Dict[str, float] = None, base: SimulationConfig = DEFAULT_CONFIG) -> SimulationConfig:
+    """Config with the given parameters (keys from PARAMETERS) changed"""
+    params = params or {}
+    unknown = set(params) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {sorted(unknown)}")
+    flags = {'use_dep_score', 'enforce_min_hires'}
+    return base.replace(**{p: bool(v) if p in flags else v if p in CHOICE_PARAMETERS else float(v)
+                           for p, v in params.items()})
+
+
+# ============================================================================
+# RUN SUMMARY
+# ============================================================================
+
+def summarize_run(sim: PlacementSimulation, run_number: int = None, seed: int = None) -> Dict:
+    """Per-run statistics (same fields as the old CSV-based aggregation)"""
+    table = sim.student_table
+    total = len(table)
+    placed = table.status == STATUS_PLACED
+    n_placed = int(placed.sum())
+    n_opted_out = table.count(STATUS_OPTED_OUT)
+
+    company_hires = np.bincount(table.placed_company[placed], minlength=len(table.company_ids))
+    dept_hires = np.bincount(table.dept_code[placed], minlength=len(table.dept_names))
+
+    return {
+        'run_number': run_number,
+        'seed': seed_label(seed),
+        'total_students': total,
+        'total_placed': n_placed,
+        'total_opted_out': n_opted_out,
+        'total_unplaced': table.count(STATUS_UNPLACED),
+        'placement_rate': (n_placed / total) * 100 if total else 0.0,
+        'opt_out_rate': (n_opted_out / total) * 100 if total else 0.0,
+        'companies_hired': int(np.count_nonzero(company_hires)),
+        'company_counts': {table.company_ids[i]: int(c) for i, c in enumerate(company_hires) if c},
+        'dept_counts': {table.dept_names[i]: int(c) for i, c in enumerate(dept_hires) if c},
+    }
+
+
+def run_single(scenario: Scenario, seed: int, run_number: int = None, days: Sequence[int] = (1,),
+               quiet: bool = True, params: Dict[str, float] = None, crn: bool = False,
+               antithetic: bool = False, openings_draws: np.ndarray = None) -> Dict:
+    """
+    Simulate the given days for one seed (optionally with overridden parameters) and summarize.
+    crn, antithetic or openings_draws switch to decision-keyed CommonRandomNumbers draws.
+    """
+    common = None
+    if crn or antithetic or openings_draws is not None:
+        common = CommonRandomNumbers(seed, len(scenario.student_table), antithetic, openings_draws)
+    sim = scenario.new_simulation(seed, crn=common, logger=SILENT_LOGGER if quiet else None,
+                                  config=make_config(params))
+    for day in days:
+        sim.simulate_day(day)
+    return summarize_run(sim, run_number, seed)
+
+
+# ============================================================================
+# STREAMING AGGREGATION
+# ============================================================================
+
+SCALAR_METRICS = ['total_students', 'total_placed', 'total_opted_out', 'total_unplaced',
+                  'placement_rate', 'opt_out_rate', 'companies_hired']
+KEYED_METRICS = ['company_counts', 'dept_counts']
+
+
+class RunningStats:
+    """
+    Welford running mean/variance with min/max for a vector of metrics.
+    Keys can appear at any time; a key missing from a run counts as 0 for it.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.keys: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.mean = np.zeros(0)
+        self.m2 = np.zeros(0)
+        self.min = np.zeros(0)
+        self.max = np.zeros(0)
+
+    def _grow(self, keys: Iterable[str]):
+        new = [k for k in keys if k not in self._index]
+        if not new:
+            return
+        for k in new:
+            self._index[k] = len(self.keys)
+            self.keys.append(k)
+        # A new key had the value 0 in all n earlier runs: mean 0, M2 0, min = max = 0
+        pad = np.zeros(len(new))
+        self.mean = np.concatenate([self.mean, pad])
+        self.m2 = np.concatenate([self.m2, pad])
+        self.min = np.concatenate([self.min, pad if self.n else np.full(len(new), np.inf)])
+        self.max = np.concatenate([self.max, pad if self.n else np.full(len(new), -np.inf)])
+
+    def add(self, values: Dict[str, float]):
+        """Fold one observation (key -> value) into the statistics"""
+        self._grow(values)
+        x = np.zeros(len(self.keys))
+        for k, v in values.items():
+            x[self._index[k]] = v
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        np.minimum(self.min, x, out=self.min)
+        np.maximum(self.max, x, out=self.max)
+
+    def merge(self, other: 'RunningStats'):
+        """Combine with statistics gathered elsewhere (Chan et al. pairwise update)"""
+        if other.n == 0:
+            return
+        self._grow(other.keys)
+        idx = np.array([self._index[k] for k in other.keys], dtype=np.intp)
+        mean_b = np.zeros(len(self.keys))
+        m2_b = np.zeros(len(self.keys))
+        min_b = np.zeros(len(self.keys))
+        max_b = np.zeros(len(self.keys))
+        mean_b[idx], m2_b[idx], min_b[idx], max_b[idx] = other.mean, other.m2, other.min, other.max
+        n = self.n + other.n
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * other.n / n
+        self.m2 = self.m2 + m2_b + delta ** 2 * self.n * other.n / n
+        self.min = np.minimum(self.min, min_b)
+        self.max = np.maximum(self.max, max_b)
+        self.n = n
+
+    def std(self, ddof: int = 0) -> np.ndarray:
+        if self.n - ddof <= 0:
+            return np.zeros(len(self.keys))
+        return np.sqrt(self.m2 / (self.n - ddof))
+
+    def summary(self, ddof: int = 0) -> Dict[str, Dict[str, float]]:
+        """key -> {mean, std, min, max}"""
+        std = self.std(ddof)
+        return {k: {'mean': float(self.mean[i]), 'std': float(std[i]),
+                    'min': float(self.min[i]), 'max': float(self.max[i])}
+                for i, k in enumerate(self.keys)}
+
+
+class MonteCarloAggregator:
+    """
+    Folds run summaries (see summarize_run) into running statistics for the
+    overall, per-company and per-department metrics. Memory does not grow with
+    the number of runs and summary() can be called at any time.
+    """
+
+    def __init__(self):
+        self.n_runs = 0
+        self.overall = RunningStats()
+        self.keyed = {metric: RunningStats() for metric in KEYED_METRICS}
+
+    def add(self, run: Dict):
+        self.n_runs += 1
+        self.overall.add({m: run[m] for m in SCALAR_METRICS})
+        for metric, stats in self.keyed.items():
+            stats.add(run[metric])
+
+    def merge(self, other: 'MonteCarloAggregator'):
+        self.n_runs += other.n_runs
+        self.overall.merge(other.overall)
+        for metric, stats in self.keyed.items():
+            stats.merge(other.keyed[metric])
+
+    def summary(self, ddof: int = 0) -> Dict:
+        """Current statistics: {'n_runs', 'overall', 'company_counts', 'dept_counts'}"""
+        result = {'n_runs': self.n_runs, 'overall': self.overall.summary(ddof)}
+        for metric, stats in self.keyed.items():
+            result[metric] = stats.summary(ddof)
+        return result
+
+
+# ============================================================================
+# PARALLEL RUNNER
+# ============================================================================
+
+# Root of the spawned per-run streams when none is given
+DEFAULT_ROOT_SEED = 100
+
+# Runs per batch for sequential stopping (fixed, so the stopping point does not depend on workers)
+DEFAULT_BATCH_SIZE = 32
+
+_WORKER_SCENARIO = None
+
+
+def _init_worker(scenario: Scenario):
+    """Install the scenario once per worker process"""
+    global _WORKER_SCENARIO
+    _WORKER_SCENARIO = scenario
+
+
+def _run_job(job: Dict) -> Dict:
+    return run_replicate(_WORKER_SCENARIO, **job)
+
+
+@contextlib.contextmanager
+def scenario_pool(scenario: Scenario, workers: int = None):
+    """
+    Yields map_jobs(jobs) -> iterator of run_replicate(scenario, **job) results in job order.
+    workers=None uses os.cpu_count(); workers=1 runs in the current process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield lambda jobs: (run_replicate(scenario, **job) for job in jobs)
+        return
+
+    def map_jobs(jobs):
+        jobs = list(jobs)
+        chunksize = max(1, min(64, len(jobs) // (workers * 4)))
+        return pool.map(_run_job, jobs, chunksize=chunksize)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(scenario,)) as pool:
+        yield map_jobs
+
+
+def iter_monte_carlo(scenario: Scenario, seeds: Iterable[int], workers: int = None,
+                     days: Sequence[int] = (1,), sobol: bool = False, **options) -> Iterator[Dict]:
+    """
+    Run one replicate per seed (ints or SeedSequences, e.g. from spawn_seeds) and
+    yield the summaries in seed order, whichever worker finishes first.
+    options are passed to run_replicate (params, crn, antithetic, compare_params);
+    sobol takes each run's openings draws from the next point of one scrambled
+    Sobol sequence. The mean stays unbiased, but the runs are no longer
+    independent, so use run_until_precise for a confidence interval.
+    """
+    jobs = [dict(seed=seed, run_number=i + 1, days=tuple(days), **options) for i, seed in enumerate(seeds)]
+    if sobol and jobs:
+        points = sobol_points(len(jobs), len(scenario.company_table), sobol_scramble_seed(jobs[0]['seed']))
+        for job, point in zip(jobs, points):
+            job['openings_draws'] = point
+    with scenario_pool(scenario, min(workers or os.cpu_count() or 1, max(1, len(jobs)))) as map_jobs:
+        yield from map_jobs(jobs)
+
+
+def run_monte_carlo(scenario: Scenario, seeds: Iterable[int], workers: int = None,
+                    days: Sequence[int] = (1,), **options) -> List[Dict]:
+    """Run one replicate per seed and return the summaries in seed order"""
+    return list(iter_monte_carlo(scenario, seeds, workers, days, **options))
+
+
+def aggregate_monte_carlo(scenario: Scenario, seeds: Iterable[int], workers: int = None,
+                          days: Sequence[int] = (1,), on_run=None, **options) -> MonteCarloAggregator:
+    """Stream runs into a MonteCarloAggregator; on_run(summary, aggregator) is called after each"""
+    aggregator = MonteCarloAggregator()
+    for run in iter_monte_carlo(scenario, seeds, workers, days, **options):
+        aggregator.add(run)
+        if on_run is not None:
+            on_run(run, aggregator)
+    return aggregator
+
+
+# ============================================================================
+# VARIANCE REDUCTION
+# ============================================================================
+
+def combine_runs(runs: List[Dict], weights: Sequence[float]) -> Dict:
+    """Weighted sum of run summaries (metrics and per-company/department counts)"""
+    combined = {'run_number': runs[0]['run_number'], 'seed': runs[0]['seed']}
+    for metric in SCALAR_METRICS:
+        combined[metric] = sum(w * r[metric] for w, r in zip(weights, runs))
+    for metric in KEYED_METRICS:
+        totals = {}
+        for w, r in zip(weights, runs):
+            for key, value in r[metric].items():
+                totals[key] = totals.get(key, 0) + w * value
+        combined[metric] = totals
+    return combined
+
+
+def run_replicate(scenario: Scenario, seed: int, run_number: int = None, days: Sequence[int] = (1,),
+                  params: Dict[str, float] = None, crn: bool = False, antithetic: bool = False,
+                  openings_draws: np.ndarray = None, compare_params: Dict[str, float] = None) -> Dict:
+    """
+    One independent Monte Carlo observation.
+    antithetic averages the run with its antithetic twin (1 - u for every draw).
+    compare_params returns the difference params - compare_params, both simulated
+    with the same common random numbers.
+    """
+    crn = crn or antithetic or compare_params is not None
+
+    def observe(run_params):
+        runs = [run_single(scenario, seed, run_number, days, params=run_params, crn=crn,
+                           openings_draws=openings_draws)]
+        if antithetic:
+            runs.append(run_single(scenario, seed, run_number, days, params=run_params, antithetic=True,
+                                   openings_draws=openings_draws))
+            return combine_runs(runs, [0.5, 0.5])
+        return runs[0]
+
+    result = observe(params)
+    if compare_params is not None:
+        result = combine_runs([result, observe(compare_params)], [1, -1])
+    return result
+
+
+# Last spawn key entry of Sobol scramble seeds; CRN stages start at 1, so these
+# never coincide with a run's decision streams
+SOBOL_SCRAMBLE_KEY = 0
+
+
+def sobol_scramble_seed(seed, randomization: int = 0) -> np.random.SeedSequence:
+    """
+    Seed of Sobol scramble number randomization: child (randomization, 0) of an
+    int root seed, or child 0 of a spawned run stream
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return np.random.SeedSequence(seed.entropy, spawn_key=(*seed.spawn_key, SOBOL_SCRAMBLE_KEY))
+    return np.random.SeedSequence(seed, spawn_key=(randomization, SOBOL_SCRAMBLE_KEY))
+
+
+def sobol_points(n_points: int, n_companies: int, seed) -> np.ndarray:
+    """
+    (n_points, n_companies) openings draws: the first n_points of a scrambled
+    Sobol sequence (requires scipy), one point per run, for randomized
+    quasi-Monte Carlo. Use a power of two for n_points to keep its balance.
+    """
+    try:
+        from scipy.stats import qmc
+    except ImportError as e:
+        raise ImportError("Sobol sampling requires scipy (pip install scipy)") from e
+    sobol = qmc.Sobol(d=max(1, n_companies), scramble=True, seed=np.random.default_rng(seed))
+    points = sobol.random_base2(max(0, n_points - 1).bit_length())
+    return points[:n_points, :n_companies]
+
+
+def run_until_precise(scenario: Scenario, metric: str = 'placement_rate', ci_width: float = 1.0,
+                      confidence: float = 0.95, root_seed: int = DEFAULT_ROOT_SEED, min_runs: int = 10,
+                      max_runs: int = 10000, batch_size: int = None, workers: int = None,
+                      days: Sequence[int] = (1,), sobol: bool = False, on_batch=None, **options) -> Dict:
+    """
+    Sequential stopping: run replicates in batches until the confidence interval
+    of the mean of metric is narrower than ci_width (or max_runs is reached).
+    Run k uses stream k spawned from root_seed; batches have a fixed size
+    (DEFAULT_BATCH_SIZE or min_runs), so the result does not depend on workers.
+    options go to run_replicate (params, crn, antithetic, compare_params); with
+    compare_params the interval is for the difference between the two configs.
+    With sobol each batch (rounded up to a power of two) is one independent
+    scramble of a Sobol sequence supplying the openings draws, and the interval
+    comes from the spread of the batch means (at least two batches).
+    """
+    if metric not in SCALAR_METRICS:
+        raise ValueError(f"metric must be one of {SCALAR_METRICS}")
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    workers = workers or os.cpu_count() or 1
+    batch_size = batch_size or max(min_runs, DEFAULT_BATCH_SIZE)
+    if sobol:
+        batch_size = 1 << (batch_size - 1).bit_length()
+        if max_runs < 2 * batch_size:
+            raise ValueError(f"sobol needs max_runs >= {2 * batch_size} (two scrambles of {batch_size} runs)")
+        max_runs -= max_runs % batch_size
+    batch_means = RunningStats()
+
+    aggregator = MonteCarloAggregator()
+    half_width = float('inf')
+    with scenario_pool(scenario, workers) as map_jobs:
+        while aggregator.n_runs < max_runs:
+            start = aggregator.n_runs
+            count = min(batch_size, max_runs - start)
+            jobs = [dict(seed=seed, run_number=start + i + 1, days=tuple(days), **options)
+                    for i, seed in enumerate(spawn_seeds(root_seed, count, start))]
+            if sobol:
+                points = sobol_points(count, len(scenario.company_table),
+                                      sobol_scramble_seed(root_seed, start // batch_size))
+                for job, point in zip(jobs, points):
+                    job['openings_draws'] = point
+            values = []
+            for run in map_jobs(jobs):
+                aggregator.add(run)
+                values.append(run[metric])
+
+            stats = aggregator.overall
+            i = stats.keys.index(metric)
+            if sobol:
+                # Runs within a scramble are dependent; the scrambles themselves are independent
+                batch_means.add({metric: float(np.mean(values))})
+                half_width = (z * float(batch_means.std(ddof=1)[0]) / float(np.sqrt(batch_means.n))
+                              if batch_means.n > 1 else float('inf'))
+            else:
+                half_width = z * float(stats.std(ddof=1)[i]) / float(np.sqrt(stats.n))
+            if on_batch is not None:
+                on_batch(aggregator, float(stats.mean[i]), half_width)
+            if aggregator.n_runs >= min_runs and 2 * half_width <= ci_width:
+                break
+
+    estimate = aggregator.summary(ddof=1)['overall'][metric]['mean']
+    return {
+        'metric': metric,
+        'estimate': estimate,
+        'half_width': half_width,
+        'ci': (estimate - half_width, estimate + half_width),
+        'n_replicates': aggregator.n_runs,
+        'n_scrambles': batch_means.n if sobol else None,
+        'converged': bool(2 * half_width <= ci_width),
+        'aggregator': aggregator,
+    }
@@ -3,17 +3,24 @@ Placement Simulation Model
 Multi-stage placement process simulation with test shortlisting and interviews
 """
 
-import pandas as pd
 import numpy as np
 import random
-from typing import List, Dict, Set, Tuple
+import json
+import csv
+import hashlib
+import re
+import heapq
+from typing import List, Dict, Set, Tuple, Sequence
+from dataclasses import dataclass, fields, replace
 import os
 from pathlib import Path
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
-# Set random seed for reproducibility (can be overridden)
+# Default simulation seed (can be overridden). Importing this module does no I/O
+# and does not seed any global RNG; see initialize(). pandas is only imported by
+# the CSV loaders.
 RANDOM_SEED = int(os.environ.get('RANDOM_SEED', 42))
-random.seed(RANDOM_SEED)
-np.random.seed(RANDOM_SEED)
 
 # ============================================================================
 # CONFIGURATION & CONSTANTS
@@ -30,22 +37,85 @@ W6_CGPA_INTERVIEW = 0.5  # Weight for CGPA in InterviewScore
 W7_RANDOM_INTERVIEW = 0.2  # Weight for Random factor in InterviewScore
 
 P_OPT_OUT = 0.05  # Probability of student opting out
+OVER_OFFER_MULTIPLIER = 1.5  # Offers made per opening (students may reject)
 
-# Load department scores
-DEP_SCORES = {}
-def load_dep_scores():
-    """Load department scores from dep_score.csv"""
-    global DEP_SCORES
-    dep_score_file = Path(__file__).parent.parent / 'dep_score.csv'
+# How a serial's offers are resolved: 'random' (over-offer, each student picks one of
+# their offers at random) or 'deferred' (stable matching that fills the openings exactly)
+ACCEPTANCE_MODES = ('random', 'deferred')
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """
+    Model parameters for one simulation (defaults are the constants above).
+    Immutable, so differently configured simulations can share a process.
+    """
+    w1_cgpa: float = W1_CGPA_PROFILE
+    w2_skill: float = W2_SKILL_PROFILE
+    w3_random: float = W3_RANDOM_PROFILE
+    w4_dep_score: float = W4_DEP_SCORE_PROFILE
+    w5_profile: float = W5_PROFILE_INTERVIEW
+    w6_cgpa_interview: float = W6_CGPA_INTERVIEW
+    w7_random_interview: float = W7_RANDOM_INTERVIEW
+    p_opt_out: float = P_OPT_OUT
+    over_offer_multiplier: float = OVER_OFFER_MULTIPLIER
+    use_dep_score: bool = True  # False drops the department term from ProfileScore
+    enforce_min_hires: bool = True  # Offer at least min_hires whenever enough candidates exist
+    acceptance_mode: str = 'random'  # One of ACCEPTANCE_MODES
+
+    def __post_init__(self):
+        if self.acceptance_mode not in ACCEPTANCE_MODES:
+            raise ValueError(f"acceptance_mode must be one of {ACCEPTANCE_MODES}, got {self.acceptance_mode!r}")
+
+    def replace(self, **changes) -> 'SimulationConfig':
+        """Copy with some fields changed"""
+        return replace(self, **changes)
+
+    @classmethod
+    def field_names(cls) -> List[str]:
+        return [f.name for f in fields(cls)]
+
+
+DEFAULT_CONFIG = SimulationConfig()
+
+# Department scores (module attribute DEP_SCORES, read from dep_score.csv on first use)
+_DEP_SCORES = None
+def read_dep_scores(filepath) -> Dict[str, float]:
+    """Department code -> score from a dep_score.csv file"""
+    # csv keeps every field as text, so 'NA' stays a department code rather than a missing value
+    with open(filepath, newline='', encoding='utf-8') as f:
+        return {row['department_code']: float(row['score']) for row in csv.DictReader(f)}
+
+def load_dep_scores(data_dir=None) -> Dict[str, float]:
+    """Load department scores from dep_score.csv (in the dataset directory by default)"""
+    global _DEP_SCORES
+    dep_score_file = Path(__file__).parent.parent / 'dep_score.csv' if data_dir is None else \
+        Path(data_dir) / 'dep_score.csv'
     if dep_score_file.exists():
-        df = pd.read_csv(dep_score_file)
-        DEP_SCORES = dict(zip(df['department_code'], df['score']))
+        _DEP_SCORES = read_dep_scores(dep_score_file)
     else:
         print(f"Warning: dep_score.csv not found at {dep_score_file}")
-        DEP_SCORES = {}
+        _DEP_SCORES = {}
+    return _DEP_SCORES
+
+def default_dep_scores() -> Dict[str, float]:
+    """Department scores used when none are passed in (loaded once, on first use)"""
+    return load_dep_scores() if _DEP_SCORES is None else _DEP_SCORES
+
+def __getattr__(name):
+    if name == 'DEP_SCORES':
+        return default_dep_scores()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Load department scores at module initialization
-load_dep_scores()
+def initialize(seed: int = None, data_dir=None):
+    """
+    Explicit process-wide setup: seed the global random and np.random streams
+    (used by the scalar scoring helpers) and load department scores.
+    """
+    seed = RANDOM_SEED if seed is None else seed
+    random.seed(seed)
+    np.random.seed(seed)
+    load_dep_scores(data_dir)
 
 # Department mappings
 DEPT_MAPPINGS = {
@@ -209,69 +279,789 @@ DOMAIN_JOB_ROLE_MAPPING = {
 }
 
 
+# Common skill abbreviations (abbreviation -> expansions)
+SKILL_ABBREVIATIONS = {
+    'dsa': ['data structures', 'algorithms', 'data structure'],
+    'ml': ['machine learning'],
+    'dl': ['deep learning'],
+    'oop': ['object-oriented programming', 'object oriented programming'],
+    'oops': ['object-oriented programming', 'object oriented programming'],
+    'os': ['operating systems', 'operating system'],
+    'dbms': ['database management systems', 'database'],
+    'cp': ['competitive programming'],
+}
+
+
 # ============================================================================
-# STUDENT CLASS
+# SKILL VOCABULARY
 # ============================================================================
 
+class SkillAutomaton:
+    """Aho-Corasick automaton reporting every pattern that occurs in a text"""
+
+    def __init__(self, patterns: List[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                node = nxt
+            self.output[node].append(pattern_id)
+
+        # Breadth-first construction of failure links
+        queue = list(self.goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+    def find_all(self, text: str) -> Set[int]:
+        """Return IDs of all patterns occurring as substrings of text"""
+        found = set()
+        node = 0
+        for ch in text:
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+            if self.output[node]:
+                found.update(self.output[node])
+        return found
+
+
+class SkillVocabulary:
+    """
+    Canonical skill vocabulary with a compiled substring/synonym matcher.
+    Skills are lowercased into term IDs. Compiling runs every term through an
+    Aho-Corasick automaton once to get the full containment graph, from which the
+    set of student terms satisfying each required term is derived (same rules as
+    the original bidirectional substring + abbreviation matching).
+    """
+
+    def __init__(self, abbreviations: Dict[str, List[str]] = None):
+        self.abbreviations = SKILL_ABBREVIATIONS if abbreviations is None else abbreviations
+        self.terms: List[str] = []
+        self.term_ids: Dict[str, int] = {}
+        self._related: List[Set[int]] = []
+        self._match_sets: Dict[int, frozenset] = {}
+        self._satisfies = np.zeros((0, 1), dtype=np.uint64)
+        self.n_words = 1
+        self._compiled_size = -1
+
+        for abbrev, expansions in self.abbreviations.items():
+            self.add(abbrev)
+            self.add_all(expansions)
+
+    def add(self, skill: str) -> int:
+        """Return the term ID for a skill, adding it to the vocabulary if new"""
+        term = skill.lower()
+        term_id = self.term_ids.get(term)
+        if term_id is None:
+            term_id = len(self.terms)
+            self.term_ids[term] = term_id
+            self.terms.append(term)
+        return term_id
+
+    def add_all(self, skills) -> List[int]:
+        """Return term IDs for several skills"""
+        return [self.add(s) for s in skills]
+
+    def compile(self):
+        """Build the containment graph for the current vocabulary"""
+        automaton = SkillAutomaton(self.terms)
+        empty_id = self.term_ids.get('')
+
+        contains = []
+        for term in self.terms:
+            found = automaton.find_all(term)
+            if empty_id is not None:
+                found.add(empty_id)
+            contains.append(found)
+
+        # related(a, b) <=> a in b or b in a
+        related = [set(c) for c in contains]
+        for term_id, found in enumerate(contains):
+            for other in found:
+                related[other].add(term_id)
+
+        self._related = related
+        self._match_sets = {}
+        self._compiled_size = len(self.terms)
+
+        # satisfies[s] = bitset of required terms that a student holding s matches
+        self.n_words = max(1, (len(self.terms) + 63) // 64)
+        satisfied_by = [[] for _ in self.terms]
+        for term_id in range(len(self.terms)):
+            for student_term in self.match_set(term_id):
+                satisfied_by[student_term].append(term_id)
+        self._satisfies = np.stack([self.pack(ids) for ids in satisfied_by])
+
+    def load_skill_files(self, data_dir):
+        """Add every skill string from analysis_data.csv, domain.csv and companies.csv"""
+        import pandas as pd
+        data_dir = Path(data_dir)
+
+        students_df = pd.read_csv(data_dir / 'analysis_data.csv')
+        for col in ['skills_for_domain_1', 'skills_for_domain_2']:
+            for value in students_df[col].dropna().unique():
+                self.add_all(s.strip() for s in str(value).split(','))
+
+        domain_file = data_dir / 'domain.csv'
+        if domain_file.exists():
+            domain_df = pd.read_csv(domain_file)
+            for value in domain_df['skills_for_domain'].dropna().unique():
+                self.add_all(s.strip() for s in str(value).split(','))
+
+        companies_df = pd.read_csv(data_dir / 'companies.csv')
+        for value in companies_df['required_skills'].dropna().unique():
+            self.add_all(parse_skills(value))
+
+        self.compile()
+
+    def match_set(self, term_id: int) -> frozenset:
+        """Term IDs a student may hold for the required term to count as matched"""
+        if self._compiled_size != len(self.terms):
+            self.compile()
+
+        matches = self._match_sets.get(term_id)
+        if matches is None:
+            term = self.terms[term_id]
+            matches = set(self._related[term_id])
+
+            # Company needs an abbreviation, student has an expansion
+            for expanded in self.abbreviations.get(term, []):
+                matches |= self._related[self.term_ids[expanded]]
+
+            # Company needs the full name, student has the abbreviation
+            for abbrev, expansions in self.abbreviations.items():
+                if term in expansions:
+                    matches.add(self.term_ids[abbrev])
+
+            matches = frozenset(matches)
+            self._match_sets[term_id] = matches
+        return matches
+
+    def pack(self, term_ids) -> np.ndarray:
+        """Pack term IDs into a uint64 bit vector"""
+        bits = np.zeros(self.n_words * 64, dtype=bool)
+        bits[list(term_ids)] = True
+        return np.packbits(bits, bitorder='little').view(np.uint64)
+
+    def closure_bits(self, student_term_ids) -> np.ndarray:
+        """Bit vector of every required term satisfied by a student skill set"""
+        if self._compiled_size != len(self.terms):
+            self.compile()
+        if not student_term_ids:
+            return np.zeros(self.n_words, dtype=np.uint64)
+        return np.bitwise_or.reduce(self._satisfies[list(student_term_ids)], axis=0)
+
+    def required_layers(self, required_term_ids) -> np.ndarray:
+        """
+        Pack a required-skills list into bit vectors, one layer per multiplicity,
+        so popcount over all layers counts duplicated requirements like the list does
+        """
+        if self._compiled_size != len(self.terms):
+            self.compile()
+        layers = []
+        remaining = list(required_term_ids)
+        while remaining:
+            layer = list(dict.fromkeys(remaining))
+            for term_id in layer:
+                remaining.remove(term_id)
+            layers.append(self.pack(layer))
+        if not layers:
+            return np.zeros((1, self.n_words), dtype=np.uint64)
+        return np.stack(layers)
+
+    def match_score(self, student_term_ids, required_term_ids) -> float:
+        """Skill match score (0-10) for canonical student and required term IDs"""
+        if not required_term_ids:
+            return 10.0
+
+        closure = self.closure_bits(student_term_ids)
+        matched_count = int(popcount(closure & self.required_layers(required_term_ids)).sum())
+        return matched_count / len(required_term_ids) * 10.0
+
+
+def popcount(bits: np.ndarray) -> np.ndarray:
+    """Per-element population count of a uint64 array"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(bits)
+    return np.unpackbits(bits.view(np.uint8), axis=-1).reshape(*bits.shape, 64).sum(axis=-1)
+
+
+# Shared vocabulary (grows as students and companies are created)
+SKILL_VOCABULARY = SkillVocabulary()
+
+
+# ============================================================================
+# SKILL PROFILES
+# ============================================================================
+
+class SkillProfileRegistry:
+    """
+    Hash-conses canonical skill sets into integer profile IDs.
+    Students mostly share the same domain skill strings and many companies share
+    identical required skills, so match scores are memoized per
+    (student profile, company profile) pair and reused across serials and runs.
+    """
+
+    def __init__(self, vocabulary: SkillVocabulary = None):
+        self.vocabulary = SKILL_VOCABULARY if vocabulary is None else vocabulary
+        self.student_profiles: Dict[frozenset, int] = {}
+        self.company_profiles: Dict[Tuple[int, ...], int] = {}
+        self.student_term_sets: List[frozenset] = []
+        self.company_term_lists: List[Tuple[int, ...]] = []
+        self.scores: Dict[Tuple[int, int], float] = {}
+
+    def student_profile_id(self, skills) -> int:
+        """Return the profile ID for a student skill set"""
+        key = frozenset(self.vocabulary.add_all(skills))
+        profile_id = self.student_profiles.get(key)
+        if profile_id is None:
+            profile_id = len(self.student_term_sets)
+            self.student_profiles[key] = profile_id
+            self.student_term_sets.append(key)
+        return profile_id
+
+    def company_profile_id(self, required_skills) -> int:
+        """Return the profile ID for a company required-skills list (order and duplicates kept)"""
+        key = tuple(self.vocabulary.add_all(required_skills or []))
+        profile_id = self.company_profiles.get(key)
+        if profile_id is None:
+            profile_id = len(self.company_term_lists)
+            self.company_profiles[key] = profile_id
+            self.company_term_lists.append(key)
+        return profile_id
+
+    def match_score(self, student_profile: int, company_profile: int) -> float:
+        """Skill match score for a profile pair, computed once and cached"""
+        key = (student_profile, company_profile)
+        score = self.scores.get(key)
+        if score is None:
+            score = self.vocabulary.match_score(self.student_term_sets[student_profile],
+                                                self.company_term_lists[company_profile])
+            self.scores[key] = score
+        return score
+
+
+# Shared registry (persists across simulations in the same process)
+SKILL_PROFILES = SkillProfileRegistry()
+
+
+# ============================================================================
+# STUDENT TABLE & STUDENT CLASS
+# ============================================================================
+
+# Student status codes (stored as int8 in StudentTable.status)
+STATUS_UNPLACED = 0
+STATUS_OFFERED = 1
+STATUS_PLACED = 2
+STATUS_OPTED_OUT = 3
+STATUS_NAMES = ['Unplaced', 'Offered', 'Placed', 'Opted_Out']
+STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+
+def encode_categories(values) -> Tuple[List, np.ndarray]:
+    """Encode values as (categories, int16 codes); None maps to -1"""
+    categories = []
+    index = {}
+    codes = np.empty(len(values), dtype=np.int16)
+    for i, value in enumerate(values):
+        if value is None:
+            codes[i] = -1
+            continue
+        code = index.get(value)
+        if code is None:
+            code = len(categories)
+            index[value] = code
+            categories.append(value)
+        codes[i] = code
+    return categories, codes
+
+
+class StudentTable:
+    """
+    Columnar (struct-of-arrays) storage for a cohort of students.
+    Static attributes are encoded once (float32 CGPA, categorical department and
+    domain codes, hash-consed skill sets); placement state is an int8 status array
+    with a maintained unplaced mask. Student objects are thin views onto a row.
+    """
+
+    def __init__(self, roll_no: List[str], name: List[str], cgpa, department: List[str],
+                 domain_1: List[str], domain_2: List[str], skills: List[Set[str]]):
+        n = len(roll_no)
+        self.roll_no = list(roll_no)
+        self.name = list(name)
+        self.cgpa = np.asarray(cgpa, dtype=np.float32)
+        self.dept_names, self.dept_code = encode_categories(list(department))
+
+        # Domains share one category list; missing domain_2 is -1
+        self.domain_names, codes = encode_categories(list(domain_1) + [
+            d if not _is_missing(d) and d != '' else None for d in domain_2])
+        self.domain_codes = np.stack([codes[:n], codes[n:]], axis=1) if n else np.zeros((0, 2), dtype=np.int16)
+
+        # Distinct skill sets and their skill profile IDs
+        skill_sets, self.skill_set_code = encode_categories([frozenset(s) for s in skills])
+        self.skill_sets: List[frozenset] = skill_sets
+        self.skill_set_code = self.skill_set_code.astype(np.int32)
+        set_profiles = np.array([SKILL_PROFILES.student_profile_id(s) for s in skill_sets], dtype=np.int32)
+        self.skill_profile = set_profiles[self.skill_set_code] if n else np.zeros(0, dtype=np.int32)
+
+        # Placement state
+        self.status = np.zeros(n, dtype=np.int8)
+        self.unplaced_mask = np.ones(n, dtype=bool)
+        self.placed_company = np.full(n, -1, dtype=np.int32)
+        self.company_ids: List[str] = []
+        self._company_codes: Dict[str, int] = {}
+
+        # Applications of the current serial: (company_id, applicant rows)
+        self.applications: List[Tuple[str, np.ndarray]] = []
+        self.kept_applications: Dict[int, List[str]] = {}
+
+        self._views: List['Student'] = [None] * n
+
+    def __len__(self):
+        return len(self.roll_no)
+
+    # Encoded, seed-independent columns (skill profile IDs are per-process and rebuilt)
+    STATIC_COLUMNS = ('roll_no', 'name', 'cgpa', 'dept_names', 'dept_code', 'domain_names', 'domain_codes',
+                      'skill_sets', 'skill_set_code')
+
+    def static_columns(self) -> Dict:
+        """The encoded static columns, as accepted by from_static"""
+        return {key: getattr(self, key) for key in self.STATIC_COLUMNS}
+
+    @classmethod
+    def from_static(cls, columns: Dict) -> 'StudentTable':
+        """Table over already encoded static columns (arrays may be read-only memory maps)"""
+        table = cls.__new__(cls)
+        table.__dict__.update(columns)
+        table.roll_no, table.name = list(columns['roll_no']), list(columns['name'])
+        table.skill_sets = [frozenset(s) for s in columns['skill_sets']]
+        set_profiles = np.array([SKILL_PROFILES.student_profile_id(s) for s in table.skill_sets], dtype=np.int32)
+        table.skill_profile = set_profiles[table.skill_set_code] if len(table.roll_no) else np.zeros(0, dtype=np.int32)
+        return table.copy()
+
+    @classmethod
+    def bind(cls, students: List['Student']) -> 'StudentTable':
+        """
+        Return a table whose rows are exactly the given students, in order.
+        Views from another table are copied into a new table and re-pointed to it.
+        """
+        tables = {id(s._table) for s in students}
+        if len(tables) == 1:
+            table = students[0]._table
+            if len(table) == len(students) and all(s._row == i for i, s in enumerate(students)):
+                return table
+
+        table = cls([s.roll_no for s in students], [s.name for s in students],
+                    [s.cgpa for s in students], [s.department for s in students],
+                    [s.domain_1 for s in students], [s.domain_2 for s in students],
+                    [s.skills for s in students])
+        for i, s in enumerate(students):
+            table.status[i] = s._table.status[s._row]
+            if s.placed_company:
+                table.placed_company[i] = table.company_code(s.placed_company)
+            if s.current_applications:
+                table.kept_applications[i] = list(s.current_applications)
+        table.unplaced_mask = table.status == STATUS_UNPLACED
+        for i, s in enumerate(students):
+            s._table, s._row = table, i
+            table._views[i] = s
+        return table
+
+    def copy(self) -> 'StudentTable':
+        """New table sharing the static columns with fresh placement state"""
+        table = StudentTable.__new__(StudentTable)
+        table.__dict__.update(self.__dict__)
+        table.status = np.zeros(len(self), dtype=np.int8)
+        table.unplaced_mask = np.ones(len(self), dtype=bool)
+        table.placed_company = np.full(len(self), -1, dtype=np.int32)
+        table.company_ids = []
+        table._company_codes = {}
+        table.applications = []
+        table.kept_applications = {}
+        table._views = [None] * len(self)
+        return table
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_views'] = [None] * len(self)
+        return state
+
+    def view(self, row: int) -> 'Student':
+        """Student view for a row (created once, then reused)"""
+        student = self._views[row]
+        if student is None:
+            student = Student.__new__(Student)
+            student._table, student._row = self, row
+            self._views[row] = student
+        return student
+
+    def views(self, rows=None) -> List['Student']:
+        """Student views for the given rows (all rows by default)"""
+        if rows is None:
+            rows = range(len(self))
+        return [self.view(int(r)) for r in rows]
+
+    def company_code(self, company_id: str) -> int:
+        """Integer code for a company ID in placed_company"""
+        code = self._company_codes.get(company_id)
+        if code is None:
+            code = len(self.company_ids)
+            self._company_codes[company_id] = code
+            self.company_ids.append(company_id)
+        return code
+
+    def set_status(self, rows, code: int):
+        """Set status for rows, keeping the unplaced mask in sync"""
+        self.status[rows] = code
+        self.unplaced_mask[rows] = code == STATUS_UNPLACED
+
+    def unplaced_rows(self) -> np.ndarray:
+        """Row indices of unplaced students"""
+        return np.flatnonzero(self.unplaced_mask)
+
+    def count(self, code: int) -> int:
+        """Number of students with the given status code"""
+        return int(np.count_nonzero(self.status == code))
+
+    def cgpa_values(self) -> np.ndarray:
+        """CGPA as float64 decimals (shortest values that round-trip through float32)"""
+        return self.cgpa.astype(str).astype(np.float64)
+
+    def current_applications(self, row: int) -> List[str]:
+        """Company IDs the student applied to in the current serial"""
+        kept = self.kept_applications.get(row)
+        if kept is not None:
+            return kept
+        return [company_id for company_id, rows in self.applications
+                if len(rows) and rows[min(np.searchsorted(rows, row), len(rows) - 1)] == row]
+
+    def clear_applications(self, keep_rows):
+        """Drop the current serial's applications, keeping them only for keep_rows"""
+        for row in keep_rows:
+            self.kept_applications[int(row)] = self.current_applications(int(row))
+        self.applications = []
+
+
 class Student:
-    """Represents a student in the placement process"""
+    """Represents a student in the placement process (a view onto a StudentTable row)"""
+    
+    __slots__ = ('_table', '_row')
     
     def __init__(self, roll_no: str, name: str, cgpa: float, 
                  department: str, domain_1: str, skills_1: List[str],
                  domain_2: str = None, skills_2: List[str] = None):
-        self.roll_no = roll_no
-        self.name = name
-        self.cgpa = cgpa
-        self.department = department
-        self.domain_1 = domain_1
-        self.domain_2 = domain_2
-        
         # Combine all skills
-        self.skills = set(skills_1) if skills_1 else set()
+        skills = set(skills_1) if skills_1 else set()
         if skills_2:
-            self.skills.update(skills_2)
+            skills.update(skills_2)
         
-        # All domains
-        self.domains = [domain_1]
-        if domain_2 and pd.notna(domain_2) and domain_2 != '':
-            self.domains.append(domain_2)
-        
-        # Status tracking
-        self.status = 'Unplaced'
-        self.current_applications = []  # List of companies applied to
-        self.placed_company = None
+        self._table = StudentTable([roll_no], [name], [cgpa], [department], [domain_1], [domain_2], [skills])
+        self._row = 0
+        self._table._views[0] = self
+    
+    @property
+    def row(self) -> int:
+        return self._row
+    
+    @property
+    def roll_no(self) -> str:
+        return self._table.roll_no[self._row]
+    
+    @property
+    def name(self) -> str:
+        return self._table.name[self._row]
+    
+    @property
+    def cgpa(self) -> float:
+        return float(str(self._table.cgpa[self._row]))
+    
+    @property
+    def department(self) -> str:
+        return self._table.dept_names[self._table.dept_code[self._row]]
+    
+    @property
+    def domain_1(self) -> str:
+        code = self._table.domain_codes[self._row, 0]
+        return self._table.domain_names[code] if code >= 0 else None
+    
+    @property
+    def domain_2(self) -> str:
+        code = self._table.domain_codes[self._row, 1]
+        return self._table.domain_names[code] if code >= 0 else None
+    
+    @property
+    def domains(self) -> List[str]:
+        """All domains"""
+        return [self._table.domain_names[c] if c >= 0 else None
+                for k, c in enumerate(self._table.domain_codes[self._row]) if k == 0 or c >= 0]
+    
+    @property
+    def skills(self) -> frozenset:
+        return self._table.skill_sets[self._table.skill_set_code[self._row]]
+    
+    @property
+    def skill_profile_id(self) -> int:
+        return int(self._table.skill_profile[self._row])
+    
+    @property
+    def status(self) -> str:
+        return STATUS_NAMES[self._table.status[self._row]]
+    
+    @status.setter
+    def status(self, value: str):
+        self._table.set_status(self._row, STATUS_CODES[value])
+    
+    @property
+    def placed_company(self) -> str:
+        code = self._table.placed_company[self._row]
+        return self._table.company_ids[code] if code >= 0 else None
+    
+    @placed_company.setter
+    def placed_company(self, value: str):
+        self._table.placed_company[self._row] = -1 if value is None else self._table.company_code(value)
+    
+    @property
+    def current_applications(self) -> List[str]:
+        return self._table.current_applications(self._row)
+    
+    @current_applications.setter
+    def current_applications(self, value: List[str]):
+        self._table.kept_applications[self._row] = list(value)
         
     def __repr__(self):
         return f"Student({self.roll_no}, {self.name}, CGPA:{self.cgpa}, Status:{self.status})"
 
 
 # ============================================================================
-# COMPANY CLASS
+# COMPANY TABLE & COMPANY CLASS
 # ============================================================================
 
+FUNNEL_STAGES = ['applicants', 'test_invited', 'shortlisted', 'offered', 'hired']
+
+
+class CompanyTable:
+    """
+    Columnar storage for companies.
+    Funnel stages (applicants, test_invited, shortlisted, offered, hired) are
+    arrays of StudentTable row indices per company. Company objects are thin views.
+    """
+
+    def __init__(self, company_name: List[str], job_role: List[str], allowed_departments: List[List[str]],
+                 min_cgpa, required_skills: List[List[str]], visit_day, min_hires, max_hires,
+                 interview_slots):
+        n = len(company_name)
+        self.company_name = list(company_name)
+        self.job_role = list(job_role)
+        self.allowed_departments = list(allowed_departments)
+        self.min_cgpa = np.asarray(min_cgpa, dtype=np.float64)
+        self.required_skills = list(required_skills)
+        self.skill_profile = np.array([SKILL_PROFILES.company_profile_id(r) for r in self.required_skills],
+                                      dtype=np.int32)
+        self.visit_day = np.asarray(visit_day, dtype=np.int16)
+        self.min_hires = np.asarray(min_hires, dtype=np.int32)
+        self.max_hires = np.asarray(max_hires, dtype=np.int32)
+        self.interview_slots = np.asarray(interview_slots, dtype=np.int32)
+
+        # Funnel stages and per-company hiring state
+        empty = np.zeros(0, dtype=np.intp)
+        for stage in FUNNEL_STAGES:
+            setattr(self, stage, [empty] * n)
+        self.profile_scores: List[np.ndarray] = [np.zeros(0)] * n  # aligned with shortlisted
+        self.target_hires = np.zeros(n, dtype=np.int32)
+        self.student_table: StudentTable = None
+
+        self._views: List['Company'] = [None] * n
+
+    def __len__(self):
+        return len(self.company_name)
+
+    # Static columns (skill profile IDs are per-process and rebuilt)
+    STATIC_COLUMNS = ('company_name', 'job_role', 'allowed_departments', 'min_cgpa', 'required_skills',
+                      'visit_day', 'min_hires', 'max_hires', 'interview_slots')
+
+    def static_columns(self) -> Dict:
+        """The static columns, as accepted by from_static"""
+        return {key: getattr(self, key) for key in self.STATIC_COLUMNS}
+
+    @classmethod
+    def from_static(cls, columns: Dict) -> 'CompanyTable':
+        """Table over static columns (arrays may be read-only memory maps) with an empty funnel"""
+        table = cls.__new__(cls)
+        table.__dict__.update(columns)
+        for key in ('company_name', 'job_role', 'allowed_departments', 'required_skills'):
+            setattr(table, key, list(columns[key]))
+        table.skill_profile = np.array([SKILL_PROFILES.company_profile_id(r) for r in table.required_skills],
+                                       dtype=np.int32)
+        table.student_table = None
+        return table.copy()
+
+    @classmethod
+    def bind(cls, companies: List['Company'], student_table: StudentTable) -> 'CompanyTable':
+        """Return a table whose rows are the given companies, linked to a student table"""
+        tables = {id(c._table) for c in companies}
+        if len(tables) == 1:
+            table = companies[0]._table
+            if len(table) == len(companies) and all(c._row == j for j, c in enumerate(companies)):
+                table.student_table = student_table
+                return table
+
+        table = cls([c.company_name for c in companies], [c.job_role for c in companies],
+                    [c.allowed_departments for c in companies], [c.min_cgpa for c in companies],
+                    [c.required_skills for c in companies], [c.visit_day for c in companies],
+                    [c.min_hires for c in companies], [c.max_hires for c in companies],
+                    [c.interview_slots for c in companies])
+        table.student_table = student_table
+        for j, c in enumerate(companies):
+            c._table, c._row = table, j
+            table._views[j] = c
+        return table
+
+    def copy(self) -> 'CompanyTable':
+        """New table sharing the static columns with an empty funnel"""
+        table = CompanyTable.__new__(CompanyTable)
+        table.__dict__.update(self.__dict__)
+        empty = np.zeros(0, dtype=np.intp)
+        for stage in FUNNEL_STAGES:
+            setattr(table, stage, [empty] * len(self))
+        table.profile_scores = [np.zeros(0)] * len(self)
+        table.target_hires = np.zeros(len(self), dtype=np.int32)
+        table._views = [None] * len(self)
+        return table
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_views'] = [None] * len(self)
+        return state
+
+    def view(self, row: int) -> 'Company':
+        """Company view for a row (created once, then reused)"""
+        company = self._views[row]
+        if company is None:
+            company = Company.__new__(Company)
+            company._table, company._row = self, row
+            self._views[row] = company
+        return company
+
+    def views(self) -> List['Company']:
+        return [self.view(j) for j in range(len(self))]
+
+
+def _funnel_property(stage: str):
+    """Company attribute exposing a funnel stage as a list of Student views"""
+    def getter(self) -> List[Student]:
+        rows = getattr(self._table, stage)[self._row]
+        if self._table.student_table is None:
+            return []
+        return self._table.student_table.views(rows)
+
+    def setter(self, students):
+        rows = np.array([s.row for s in students], dtype=np.intp)
+        if len(students):
+            self._table.student_table = students[0]._table
+        getattr(self._table, stage)[self._row] = rows
+
+    return property(getter, setter, doc=f"Students at the {stage} stage")
+
+
 class Company:
-    """Represents a company in the placement process"""
+    """Represents a company in the placement process (a view onto a CompanyTable row)"""
+    
+    __slots__ = ('_table', '_row')
     
     def __init__(self, company_name: str, job_role: str, 
                  allowed_departments: List[str], min_cgpa: float,
                  required_skills: List[str], visit_day: int,
                  min_hires: int, max_hires: int, interview_slots: int):
-        self.company_name = company_name
-        self.job_role = job_role
-        self.allowed_departments = allowed_departments
-        self.min_cgpa = min_cgpa
-        self.required_skills = required_skills
-        self.visit_day = visit_day
-        self.min_hires = min_hires
-        self.max_hires = max_hires
-        self.interview_slots = interview_slots
-        
-        # Application tracking
-        self.applicants = []  # Students who applied
-        self.test_invited = []  # Students invited for test
-        self.shortlisted = []  # Students shortlisted for interview
-        self.offered = []  # Students who received offers
-        self.hired = []  # Students who accepted offers
+        self._table = CompanyTable([company_name], [job_role], [allowed_departments], [min_cgpa],
+                                   [required_skills], [visit_day], [min_hires], [max_hires], [interview_slots])
+        self._row = 0
+        self._table._views[0] = self
+    
+    # Application tracking
+    applicants = _funnel_property('applicants')  # Students who applied
+    test_invited = _funnel_property('test_invited')  # Students invited for test
+    shortlisted = _funnel_property('shortlisted')  # Students shortlisted for interview
+    offered = _funnel_property('offered')  # Students who received offers
+    hired = _funnel_property('hired')  # Students who accepted offers
+    
+    @property
+    def row(self) -> int:
+        return self._row
+    
+    @property
+    def company_name(self) -> str:
+        return self._table.company_name[self._row]
+    
+    @property
+    def job_role(self) -> str:
+        return self._table.job_role[self._row]
+    
+    @property
+    def allowed_departments(self) -> List[str]:
+        return self._table.allowed_departments[self._row]
+    
+    @property
+    def min_cgpa(self) -> float:
+        return float(self._table.min_cgpa[self._row])
+    
+    @property
+    def required_skills(self) -> List[str]:
+        return self._table.required_skills[self._row]
+    
+    @property
+    def skill_profile_id(self) -> int:
+        return int(self._table.skill_profile[self._row])
+    
+    @property
+    def visit_day(self) -> int:
+        return int(self._table.visit_day[self._row])
+    
+    @property
+    def min_hires(self) -> int:
+        return int(self._table.min_hires[self._row])
+    
+    @property
+    def max_hires(self) -> int:
+        return int(self._table.max_hires[self._row])
+    
+    @property
+    def interview_slots(self) -> int:
+        return int(self._table.interview_slots[self._row])
+    
+    @property
+    def target_hires(self) -> int:
+        return int(self._table.target_hires[self._row])
+    
+    @target_hires.setter
+    def target_hires(self, value: int):
+        self._table.target_hires[self._row] = value
+    
+    @property
+    def profile_scores(self) -> Dict[str, float]:
+        """Profile scores of shortlisted students by roll number"""
+        return {s.roll_no: float(score) for s, score in zip(self.shortlisted, self._table.profile_scores[self._row])}
         
     def get_unique_id(self):
         """Returns unique identifier for company"""
@@ -285,9 +1075,14 @@ class Company:
 # UTILITY FUNCTIONS
 # ============================================================================
 
+def _is_missing(value) -> bool:
+    """True for None and NaN (what pandas reads for empty cells)"""
+    return value is None or (isinstance(value, float) and value != value)
+
+
 def parse_cgpa_requirement(cgpa_str: str) -> float:
     """Parse CGPA requirement from string"""
-    if pd.isna(cgpa_str) or cgpa_str in ['NONE', 'NA', 'None', '', 'NA ']:
+    if _is_missing(cgpa_str) or cgpa_str in ['NONE', 'NA', 'None', '', 'NA ']:
         return 0.0
     
     cgpa_str = str(cgpa_str).strip()
@@ -295,7 +1090,6 @@ def parse_cgpa_requirement(cgpa_str: str) -> float:
     # Handle conditional CGPA (take the lower value)
     if 'for' in cgpa_str.lower():
         # "7.5+ for Dev, 8.5+ for Advanced Dev" -> extract first number
-        import re
         numbers = re.findall(r'\d+\.?\d*', cgpa_str)
         if numbers:
             return float(numbers[0])
@@ -315,7 +1109,7 @@ def parse_cgpa_requirement(cgpa_str: str) -> float:
 
 def parse_departments(dept_str: str) -> List[str]:
     """Parse allowed departments from string"""
-    if pd.isna(dept_str):
+    if _is_missing(dept_str):
         return []
     
     dept_str = str(dept_str).strip()
@@ -370,7 +1164,7 @@ def parse_departments(dept_str: str) -> List[str]:
 
 def parse_skills(skill_str: str) -> List[str]:
     """Parse required skills from string"""
-    if pd.isna(skill_str) or skill_str == '':
+    if _is_missing(skill_str) or skill_str == '':
         return []
     
     skill_str = str(skill_str).strip()
@@ -393,62 +1187,17 @@ def calculate_skill_match_score(student_skills: Set[str], required_skills: List[
     """
     Calculate skill match score between student and company
     Returns a score between 0 and 10
+    
+    A required skill is matched if it is a substring of a student skill (or vice
+    versa), directly or through SKILL_ABBREVIATIONS. Matching is resolved through
+    the compiled SKILL_VOCABULARY.
     """
     if not required_skills:
         return 10.0  # No skills required, perfect match
     
-    # Convert to lowercase for comparison
-    student_skills_lower = set(s.lower() for s in student_skills)
-    required_skills_lower = [s.lower() for s in required_skills]
-    
-    matched_count = 0
-    
-    # Common abbreviations mapping
-    skill_mappings = {
-        'dsa': ['data structures', 'algorithms', 'data structure'],
-        'ml': ['machine learning'],
-        'dl': ['deep learning'],
-        'oop': ['object-oriented programming', 'object oriented programming'],
-        'oops': ['object-oriented programming', 'object oriented programming'],
-        'os': ['operating systems', 'operating system'],
-        'dbms': ['database management systems', 'database'],
-        'cp': ['competitive programming'],
-    }
-    
-    for req_skill in required_skills_lower:
-        # Check for partial match
-        matched = False
-        
-        # First check direct partial matching
-        for student_skill in student_skills_lower:
-            if req_skill in student_skill or student_skill in req_skill:
-                matched = True
-                break
-        
-        # If not matched, check abbreviation mappings
-        if not matched and req_skill in skill_mappings:
-            for expanded in skill_mappings[req_skill]:
-                for student_skill in student_skills_lower:
-                    if expanded in student_skill or student_skill in expanded:
-                        matched = True
-                        break
-                if matched:
-                    break
-        
-        # Also check reverse mapping (student has abbreviation, company needs full name)
-        if not matched:
-            for abbrev, expansions in skill_mappings.items():
-                if req_skill in expansions:
-                    if abbrev in student_skills_lower:
-                        matched = True
-                        break
-        
-        if matched:
-            matched_count += 1
-    
-    # Calculate percentage and scale to 0-10
-    match_percentage = matched_count / len(required_skills_lower)
-    return match_percentage * 10.0
+    student_term_ids = set(SKILL_VOCABULARY.add_all(student_skills))
+    required_term_ids = SKILL_VOCABULARY.add_all(required_skills)
+    return SKILL_VOCABULARY.match_score(student_term_ids, required_term_ids)
 
 
 def is_department_eligible(student_dept: str, allowed_depts: List[str]) -> bool:
@@ -481,148 +1230,580 @@ def is_domain_match(student_domains: List[str], job_role: str) -> bool:
     return False
 
 
+# ============================================================================
+# ELIGIBILITY MATRIX
+# ============================================================================
+
+class EligibilityMatrix:
+    """
+    Precomputed students x companies eligibility table.
+    Combines department, CGPA and domain checks into one boolean matrix so each
+    serial only needs a masked slice instead of a Python double loop.
+    """
+
+    def __init__(self, students: List[Student], companies: List[Company]):
+        self.student_index = {s.roll_no: i for i, s in enumerate(students)}
+        self.company_index = {c.get_unique_id(): j for j, c in enumerate(companies)}
+
+        n_students = len(students)
+        n_companies = len(companies)
+
+        # Encode departments as integer codes
+        dept_codes = {}
+        student_dept = np.array([dept_codes.setdefault(s.department, len(dept_codes)) for s in students],
+                                dtype=np.int32)
+
+        # Department table: companies x departments
+        dept_table = np.zeros((n_companies, len(dept_codes)), dtype=bool)
+        for j, c in enumerate(companies):
+            if 'ALL' in c.allowed_departments:
+                dept_table[j, :] = True
+            else:
+                for dept in c.allowed_departments:
+                    if dept in dept_codes:
+                        dept_table[j, dept_codes[dept]] = True
+
+        # CGPA check
+        cgpa = np.array([s.cgpa for s in students], dtype=np.float64)
+        min_cgpa = np.array([c.min_cgpa for c in companies], dtype=np.float64)
+
+        # Domain/role compatibility table: one row per distinct domain, one column per company
+        domain_codes = {}
+        student_domains = np.full((n_students, max([len(s.domains) for s in students], default=1)), -1,
+                                  dtype=np.int32)
+        for i, s in enumerate(students):
+            for k, domain in enumerate(s.domains):
+                student_domains[i, k] = domain_codes.setdefault(domain, len(domain_codes))
+
+        domain_table = np.zeros((len(domain_codes) + 1, n_companies), dtype=bool)  # last row = no domain
+        for domain, d in domain_codes.items():
+            for j, c in enumerate(companies):
+                domain_table[d, j] = is_domain_match([domain], c.job_role)
+
+        domain_ok = np.zeros((n_students, n_companies), dtype=bool)
+        for k in range(student_domains.shape[1]):
+            domain_ok |= domain_table[student_domains[:, k]]
+
+        self.matrix = (dept_table.T[student_dept]
+                       & (cgpa[:, None] >= min_cgpa[None, :])
+                       & domain_ok)
+
+    @classmethod
+    def from_matrix(cls, roll_nos: List[str], company_ids: List[str], matrix: np.ndarray) -> 'EligibilityMatrix':
+        """Eligibility over a precomputed matrix (rows follow roll_nos, columns company_ids)"""
+        eligibility = cls.__new__(cls)
+        eligibility.student_index = {r: i for i, r in enumerate(roll_nos)}
+        eligibility.company_index = {c: j for j, c in enumerate(company_ids)}
+        eligibility.matrix = matrix
+        return eligibility
+
+    def eligible_students(self, company: Company, students: List[Student]) -> List[Student]:
+        """Return the students (in given order) eligible for the company"""
+        j = self.company_index[company.get_unique_id()]
+        rows = np.fromiter((self.student_index[s.roll_no] for s in students), dtype=np.intp, count=len(students))
+        mask = self.matrix[rows, j]
+        return [students[k] for k in np.flatnonzero(mask)]
+
+
+class SkillMatchMatrix:
+    """
+    Skill match scores for a whole cohort from packed skill bit vectors.
+    Each student skill set is stored as a uint64 bit vector of the required terms it
+    satisfies; scoring a company is one AND + popcount against its required-skill
+    layers. Bit vectors are built once per distinct skill profile.
+    """
+
+    def __init__(self, students: List[Student], companies: List[Company],
+                 registry: SkillProfileRegistry = None):
+        registry = SKILL_PROFILES if registry is None else registry
+        vocab = registry.vocabulary
+        vocab.compile()
+
+        self.student_index = {s.roll_no: i for i, s in enumerate(students)}
+        self.company_index = {c.get_unique_id(): j for j, c in enumerate(companies)}
+
+        profile_ids = np.array([s.skill_profile_id for s in students], dtype=np.int64)
+        unique_profiles, self.student_profile_row = np.unique(profile_ids, return_inverse=True)
+        self.profile_bits = np.stack([vocab.closure_bits(registry.student_term_sets[p])
+                                      for p in unique_profiles]) if len(students) else \
+            np.zeros((0, vocab.n_words), dtype=np.uint64)
+
+        self.company_layers = [vocab.required_layers(registry.company_term_lists[c.skill_profile_id])
+                               for c in companies]
+        self.required_counts = np.array([len(registry.company_term_lists[c.skill_profile_id])
+                                         for c in companies], dtype=np.float64)
+        self._company_profile = [c.skill_profile_id for c in companies]
+        self._score_cache: Dict[int, np.ndarray] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @classmethod
+    def from_arrays(cls, roll_nos: List[str], company_ids: List[str], company_profiles: List[int],
+                    profile_bits: np.ndarray, student_profile_row: np.ndarray, company_layers: List[np.ndarray],
+                    required_counts: np.ndarray) -> 'SkillMatchMatrix':
+        """Skill match over precomputed bit vectors; company_profiles only key the score cache"""
+        skill_match = cls.__new__(cls)
+        skill_match.student_index = {r: i for i, r in enumerate(roll_nos)}
+        skill_match.company_index = {c: j for j, c in enumerate(company_ids)}
+        skill_match.profile_bits = profile_bits
+        skill_match.student_profile_row = student_profile_row
+        skill_match.company_layers = list(company_layers)
+        skill_match.required_counts = required_counts
+        skill_match._company_profile = list(company_profiles)
+        skill_match._score_cache = {}
+        skill_match.cache_hits = 0
+        skill_match.cache_misses = 0
+        return skill_match
+
+    @property
+    def student_bits(self) -> np.ndarray:
+        """Per-student packed skill bit vectors (students x words)"""
+        return self.profile_bits[self.student_profile_row]
+
+    def _profile_scores(self, j: int) -> np.ndarray:
+        """Scores of every distinct student profile for company j (shared by identical requirements)"""
+        key = self._company_profile[j]
+        scores = self._score_cache.get(key)
+        if scores is not None:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            if self.required_counts[j] == 0:
+                scores = np.full(len(self.profile_bits), 10.0)
+            else:
+                matched = popcount(self.profile_bits[:, None, :] & self.company_layers[j][None, :, :]).sum(axis=(1, 2))
+                scores = matched / self.required_counts[j] * 10.0
+            self._score_cache[key] = scores
+        return scores
+
+    def company_scores(self, company: Company) -> np.ndarray:
+        """Skill match scores of every student for one company"""
+        return self._profile_scores(self.company_index[company.get_unique_id()])[self.student_profile_row]
+
+    def scores_for_rows(self, j: int, rows: np.ndarray) -> np.ndarray:
+        """Skill match scores for company j and the given student rows"""
+        return self._profile_scores(j)[self.student_profile_row[rows]]
+
+    def scores_for(self, company: Company, students: List[Student]) -> np.ndarray:
+        """Skill match scores for the given students (in order) at one company"""
+        rows = np.fromiter((self.student_index[s.roll_no] for s in students), dtype=np.intp, count=len(students))
+        profile_scores = self._profile_scores(self.company_index[company.get_unique_id()])
+        return profile_scores[self.student_profile_row[rows]]
+
+    def score_matrix(self) -> np.ndarray:
+        """Full students x companies skill match score grid"""
+        grid = np.column_stack([self._profile_scores(j) for j in range(len(self.company_layers))]) \
+            if self.company_layers else np.zeros((len(self.profile_bits), 0))
+        return grid[self.student_profile_row]
+
+
 # ============================================================================
 # SCORING FUNCTIONS
 # ============================================================================
 
-def calculate_profile_score(student: Student, company: Company) -> float:
+def calculate_profile_score(student: Student, company: Company, skill_match_score: float = None,
+                            R1: float = None, config: SimulationConfig = None) -> float:
     """
     Calculate ProfileScore for student at company
     ProfileScore = (w1 × CGPA_Score) + (w2 × Skill_Match_Score) + (w3 × R1) + (w4 × Dep_Score)
-    where R1 is random [1, 10]
+    where R1 is random [1, 10] (drawn from the global RNG if not given)
     """
-    # Normalize CGPA to 1-10 scale (assuming CGPA range is 6-10)
-    cgpa_score = ((student.cgpa - 6.0) / 4.0) * 10.0
-    cgpa_score = max(1.0, min(10.0, cgpa_score))
-    
-    # Calculate skill match score (already in 1-10 range)
-    skill_match_score = calculate_skill_match_score(student.skills, company.required_skills)
+    # Calculate skill match score (already in 1-10 range), cached per skill profile pair
+    if skill_match_score is None:
+        skill_match_score = SKILL_PROFILES.match_score(student.skill_profile_id, company.skill_profile_id)
     
     # Random factor
-    R1 = np.random.uniform(1, 10)
+    if R1 is None:
+        R1 = np.random.uniform(1, 10)
     
     # Get department score (default to 5 if not found)
-    dep_score = DEP_SCORES.get(student.department, 5.0)
-    
-    # Calculate profile score with department score
-    profile_score = (W1_CGPA_PROFILE * cgpa_score + 
-                    W2_SKILL_PROFILE * skill_match_score + 
-                    W3_RANDOM_PROFILE * R1 +
-                    W4_DEP_SCORE_PROFILE * dep_score)
+    dep_score = default_dep_scores().get(student.department, 5.0)
     
-    return profile_score
+    return float(calculate_profile_scores(student.cgpa, skill_match_score, dep_score, R1, config))
 
 
-def calculate_interview_score(student: Student, company: Company, profile_score: float) -> float:
+def calculate_interview_score(student: Student, company: Company, profile_score: float,
+                              R2: float = None, config: SimulationConfig = None) -> float:
     """
     Calculate InterviewScore for student
     InterviewScore = (w5 × ProfileScore) + (w6 × CGPA) + (w7 × R2)
-    where R2 is random [0, 10]
+    where R2 is random [0, 10] (drawn from the global RNG if not given)
     """
     # Random factor
-    R2 = np.random.uniform(0, 10)
+    if R2 is None:
+        R2 = np.random.uniform(0, 10)
     
-    # Calculate interview score
-    interview_score = (W5_PROFILE_INTERVIEW * profile_score + 
-                      W6_CGPA_INTERVIEW * student.cgpa + 
-                      W7_RANDOM_INTERVIEW * R2)
+    return float(calculate_interview_scores(profile_score, student.cgpa, R2, config))
+
+
+def calculate_profile_scores(cgpa, skill_match_scores, dep_scores, R1,
+                             config: SimulationConfig = None) -> np.ndarray:
+    """Vectorized ProfileScore over arrays of students (same formula as calculate_profile_score)"""
+    config = DEFAULT_CONFIG if config is None else config
     
-    return interview_score
+    # Normalize CGPA to 1-10 scale (assuming CGPA range is 6-10)
+    cgpa_score = np.clip((np.asarray(cgpa, dtype=np.float64) - 6.0) / 4.0 * 10.0, 1.0, 10.0)
+    
+    score = (config.w1_cgpa * cgpa_score + 
+             config.w2_skill * np.asarray(skill_match_scores, dtype=np.float64) + 
+             config.w3_random * np.asarray(R1, dtype=np.float64))
+    if config.use_dep_score:
+        score = score + config.w4_dep_score * np.asarray(dep_scores, dtype=np.float64)
+    return score
+
+
+def calculate_interview_scores(profile_scores, cgpa, R2, config: SimulationConfig = None) -> np.ndarray:
+    """Vectorized InterviewScore over arrays of students (same formula as calculate_interview_score)"""
+    config = DEFAULT_CONFIG if config is None else config
+    return (config.w5_profile * np.asarray(profile_scores, dtype=np.float64) + 
+            config.w6_cgpa_interview * np.asarray(cgpa, dtype=np.float64) + 
+            config.w7_random_interview * np.asarray(R2, dtype=np.float64))
+
+
+def top_k_indices(scores, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first.
+    Uses partial selection (O(n)) and only sorts the winners; ties are broken by
+    original position, matching a stable descending sort.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    n = len(scores)
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.zeros(0, dtype=np.intp)
+    
+    if k < n:
+        kth = np.partition(scores, n - k)[n - k]  # k-th largest value
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:k - len(above)]
+        winners = np.concatenate([above, ties])
+    else:
+        winners = np.arange(n)
+    
+    return winners[np.lexsort((winners, -scores[winners]))]
+
+
+def deferred_acceptance(candidates: List[np.ndarray], capacities: Sequence[int],
+                        preferences: List[np.ndarray]) -> List[np.ndarray]:
+    """
+    Student-proposing deferred acceptance (Gale-Shapley) over one serial's companies.
+    candidates[c] are the student rows company c ranks, best first; capacities[c] is
+    the number of places it fills; preferences[c] (aligned with candidates[c]) is each
+    candidate's utility for company c, higher preferred (ties go to the earlier company).
+    Each company holds its best proposers in a heap and bumps the worst one when a
+    better student proposes, so the E proposals take O(E log E) overall. Returns the
+    rows each company hires, best first: the student-optimal stable matching, which
+    does not depend on the order in which proposals are processed.
+    """
+    sizes = [len(rows) for rows in candidates]
+    hired = [np.zeros(0, dtype=np.intp) for _ in candidates]
+    if not sum(sizes):
+        return hired
+    
+    student = np.concatenate(candidates).astype(np.intp)
+    company = np.repeat(np.arange(len(candidates)), sizes)
+    rank = np.concatenate([np.arange(n) for n in sizes])
+    utility = np.concatenate([np.asarray(u, dtype=np.float64) for u in preferences])
+    
+    # Proposal lists: each student's companies in decreasing utility, students contiguous
+    order = np.lexsort((company, -utility, student))
+    _, first = np.unique(student[order], return_index=True)
+    next_proposal = first.tolist()
+    end = first[1:].tolist() + [len(order)]
+    proposal_company = company[order].tolist()
+    proposal_rank = rank[order].tolist()
+    capacities = [int(k) for k in capacities]
+    
+    # held[c]: heap of (-rank, proposer), so held[c][0] is the worst student c holds
+    held = [[] for _ in candidates]
+    free = list(range(len(first) - 1, -1, -1))
+    while free:
+        s = free.pop()
+        i = next_proposal[s]
+        if i == end[s]:
+            continue  # rejected by every company on the list: stays unmatched
+        next_proposal[s] = i + 1
+        c = proposal_company[i]
+        entry = (-proposal_rank[i], s)
+        heap = held[c]
+        if len(heap) < capacities[c]:
+            heapq.heappush(heap, entry)
+        elif heap and entry > heap[0]:
+            free.append(heapq.heapreplace(heap, entry)[1])
+        else:
+            free.append(s)
+    
+    for c, heap in enumerate(held):
+        ranks = np.sort(np.array([-r for r, _ in heap], dtype=np.intp))
+        hired[c] = np.asarray(candidates[c], dtype=np.intp)[ranks]
+    return hired
 
 
 # ============================================================================
-# DATA LOADING
+# SHORTLIST STORE
 # ============================================================================
 
-def load_students(filepath: str) -> List[Student]:
-    """Load students from CSV file"""
-    df = pd.read_csv(filepath)
-    
-    students = []
-    for _, row in df.iterrows():
-        # Extract department from roll number
-        roll_no = str(row['roll_no'])
-        dept = roll_no[2:4].upper()
-        
-        # Parse skills
-        skills_1 = []
-        if pd.notna(row.get('skills_for_domain_1')):
-            skills_1 = [s.strip() for s in str(row['skills_for_domain_1']).split(',')]
-        
-        skills_2 = []
-        if pd.notna(row.get('skills_for_domain_2')):
-            skills_2 = [s.strip() for s in str(row['skills_for_domain_2']).split(',')]
+def shortlist_key(file_name: str) -> str:
+    """Normalized shortlist key: 'Adobe (Product).csv' -> 'adobe_(product)'"""
+    return re.sub(r'\s+', '_', Path(file_name.strip()).stem.strip().lower())
+
+
+def read_shortlist(path) -> Tuple[int, List[str]]:
+    """
+    (rows, members) of one shortlist CSV. rows counts the non-blank data rows
+    below the first non-blank line, which is always taken as the header; members are the distinct,
+    upper-cased roll numbers in the first column (a roll number on the first
+    line is kept).
+    """
+    import pandas as pd
+    column = pd.read_csv(path, header=None, dtype=str).iloc[:, 0]  # blank lines are not rows
+    rows = max(0, len(column) - 1)
+    values = column.dropna().str.strip().str.upper()
+    values = values[(values != '') & ~values.str.startswith('ROLL')]
+    return rows, list(dict.fromkeys(values.tolist()))
+
+
+class ShortlistStore:
+    """
+    All shortlist CSVs as one sparse shortlist x roll_no membership store.
+    Shortlists are indexed by normalized key (see shortlist_key); membership is
+    kept in CSR form (indptr, indices into roll_nos).
+    """
+
+    def __init__(self, keys: List[str], files: List[str], rows, roll_nos, indptr, indices):
+        self.keys = list(keys)
+        self.files = list(files)
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.roll_nos = np.asarray(roll_nos, dtype=str)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        self.roll_index = {r: i for i, r in enumerate(self.roll_nos.tolist())}
+    
+    @classmethod
+    def from_directory(cls, shortlist_dir, workers: int = None) -> 'ShortlistStore':
+        """Read every *.csv in shortlist_dir (in a thread pool)"""
+        shortlist_dir = Path(shortlist_dir)
+        paths = sorted(shortlist_dir.glob('*.csv')) if shortlist_dir.is_dir() else []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(read_shortlist, paths))
         
-        # Get domain_2
-        domain_2 = row.get('domain_2')
-        if pd.isna(domain_2) or domain_2 == '':
-            domain_2 = None
+        keys = [shortlist_key(p.name) for p in paths]
+        if len(set(keys)) != len(keys):
+            clashes = sorted({k for k in keys if keys.count(k) > 1})
+            raise ValueError(f"Shortlist files in {shortlist_dir} share normalized keys: {clashes}")
         
-        student = Student(
-            roll_no=roll_no,
-            name=str(row['name']).strip(),
-            cgpa=float(row['cgpa']),
-            department=dept,
-            domain_1=str(row['domain_1']),
-            skills_1=skills_1,
-            domain_2=domain_2,
-            skills_2=skills_2
-        )
-        students.append(student)
-    
-    return students
-
-
-def load_companies(filepath: str, shortlist_dir: str) -> List[Company]:
-    """Load companies from CSV file and match with shortlist files"""
-    df = pd.read_csv(filepath)
+        roll_nos = sorted({r for _, members in parsed for r in members})
+        roll_index = {r: i for i, r in enumerate(roll_nos)}
+        indices = [roll_index[r] for _, members in parsed for r in members]
+        indptr = np.cumsum([0] + [len(members) for _, members in parsed])
+        return cls(keys, [p.name for p in paths],
+                   [rows for rows, _ in parsed], roll_nos, indptr, indices)
     
-    companies = []
-    for _, row in df.iterrows():
-        company_name = str(row['company_name']).strip()
-        job_role = str(row['job_role']).strip()
-        
-        # Parse fields
-        allowed_depts = parse_departments(row['allowed_departments'])
-        min_cgpa = parse_cgpa_requirement(row['min_cgpa'])
-        required_skills = parse_skills(row['required_skills'])
-        visit_day = int(row['arrival_day'])
-        min_hires = int(row['min_offers'])
-        max_hires = int(row['max_offers'])
-        
-        # Get interview slots from shortlist file
-        company_id = f"{company_name}_{job_role}"
+    def __len__(self):
+        return len(self.keys)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+    
+    def key_for(self, company_id: str):
+        """Shortlist key of a company (via COMPANY_SHORTLIST_MAPPING), or None"""
         shortlist_file = COMPANY_SHORTLIST_MAPPING.get(company_id)
-        
-        interview_slots = 0
-        if shortlist_file:
-            shortlist_path = os.path.join(shortlist_dir, shortlist_file)
-            if os.path.exists(shortlist_path):
-                shortlist_df = pd.read_csv(shortlist_path)
-                interview_slots = len(shortlist_df)
-        
-        # FIX #1: If no shortlist or small shortlist, use max_hires * 2 as buffer
-        # This allows companies to interview more candidates than shortlist size
-        if interview_slots == 0:
-            interview_slots = max_hires * 2  # Use 2x max_hires as interview capacity
-        else:
-            # Even with shortlist, ensure minimum interview capacity
-            interview_slots = max(interview_slots, int(max_hires * 1.5))
-        
-        company = Company(
-            company_name=company_name,
-            job_role=job_role,
-            allowed_departments=allowed_depts,
-            min_cgpa=min_cgpa,
-            required_skills=required_skills,
-            visit_day=visit_day,
-            min_hires=min_hires,
-            max_hires=max_hires,
-            interview_slots=interview_slots
-        )
-        companies.append(company)
-    
-    return companies
+        return shortlist_key(shortlist_file) if shortlist_file else None
+    
+    def size(self, key: str) -> int:
+        """Data rows in the shortlist file (0 if there is no such shortlist)"""
+        i = self.index.get(key)
+        return 0 if i is None else int(self.rows[i])
+    
+    def members(self, key: str) -> List[str]:
+        """Distinct roll numbers on a shortlist"""
+        i = self.index.get(key)
+        if i is None:
+            return []
+        return self.roll_nos[self.indices[self.indptr[i]:self.indptr[i + 1]]].tolist()
+    
+    def shortlists_of(self, roll_no: str) -> List[str]:
+        """Keys of the shortlists a roll number appears on"""
+        j = self.roll_index.get(str(roll_no).strip().upper())
+        if j is None:
+            return []
+        owners = np.searchsorted(self.indptr, np.flatnonzero(self.indices == j), side='right') - 1
+        return [self.keys[i] for i in owners.tolist()]
+    
+    def membership_matrix(self, roll_nos: List[str], keys: List[str]) -> np.ndarray:
+        """Boolean (len(roll_nos), len(keys)) matrix: student i is on shortlist j"""
+        rows = np.array([self.roll_index.get(str(r).strip().upper(), -1) for r in roll_nos], dtype=np.int64)
+        matrix = np.zeros((len(roll_nos), len(keys)), dtype=bool)
+        for j, key in enumerate(keys):
+            members = np.zeros(len(self.roll_nos) + 1, dtype=bool)  # trailing False for rows == -1
+            i = self.index.get(key)
+            if i is not None:
+                members[self.indices[self.indptr[i]:self.indptr[i + 1]]] = True
+            matrix[:, j] = members[rows]
+        return matrix
+    
+    def report(self, companies: List[Company], students: List[Student] = None) -> List[str]:
+        """Human-readable warnings about mapped shortlists that are missing or name unknown students"""
+        lines = []
+        known = None if students is None else {s.roll_no.strip().upper() for s in students}
+        for company in companies:
+            company_id = company.get_unique_id()
+            key = self.key_for(company_id)
+            if key is None:
+                continue
+            if key not in self.index:
+                lines.append(f"Company '{company_id}': shortlist {COMPANY_SHORTLIST_MAPPING[company_id]} not found")
+            elif known is not None:
+                unknown = sum(r not in known for r in self.members(key))
+                if unknown:
+                    lines.append(f"Company '{company_id}': {unknown} shortlisted roll numbers are not in the student data")
+        return lines
+    
+    def save(self, path, fingerprint: str = ''):
+        """Write the store to an .npz file (atomically)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            np.savez(f, fingerprint=np.array(fingerprint), keys=np.array(self.keys, dtype=str),
+                     files=np.array(self.files, dtype=str), rows=self.rows, roll_nos=self.roll_nos,
+                     indptr=self.indptr, indices=self.indices)
+        os.replace(tmp, path)
+    
+    @classmethod
+    def load(cls, path) -> Tuple['ShortlistStore', str]:
+        """(store, fingerprint) read from a file written by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            store = cls(data['keys'].tolist(), data['files'].tolist(), data['rows'], data['roll_nos'],
+                        data['indptr'], data['indices'])
+            return store, str(data['fingerprint'])
+
+
+def _hash_files(digest, named_paths):
+    """Feed (name, path) pairs into a hash: name, then the file's content hash (or a marker)"""
+    for name, path in named_paths:
+        digest.update(name.encode() + b'\0')
+        digest.update(hashlib.sha256(path.read_bytes()).digest() if path.exists() else b'<missing>')
+
+
+def load_shortlist_store(shortlist_dir, cache_dir=None, use_cache: bool = True,
+                         workers: int = None) -> ShortlistStore:
+    """
+    ShortlistStore for a shortlist directory, cached in cache_dir (a .parse_cache
+    directory next to shortlist_dir by default) under a hash of the shortlist files.
+    """
+    shortlist_dir = Path(shortlist_dir)
+    if not use_cache:
+        return ShortlistStore.from_directory(shortlist_dir, workers)
+    
+    digest = hashlib.sha256(f"shortlists-v{PARSE_CACHE_VERSION}".encode())
+    paths = sorted(shortlist_dir.glob('*.csv')) if shortlist_dir.is_dir() else []
+    _hash_files(digest, [(p.name, p) for p in paths])
+    fingerprint = digest.hexdigest()
+    cache_dir = shortlist_dir.parent / '.parse_cache' if cache_dir is None else Path(cache_dir)
+    cache_path = cache_dir / f"shortlists_{fingerprint[:32]}.npz"
+    if cache_path.exists():
+        try:
+            store, stored = ShortlistStore.load(cache_path)
+            if stored == fingerprint:
+                return store
+        except (OSError, KeyError, ValueError):
+            pass  # unreadable or outdated cache file: read the shortlists again
+    
+    store = ShortlistStore.from_directory(shortlist_dir, workers)
+    store.save(cache_path, fingerprint)
+    return store
+
+
+# ============================================================================
+# DATA LOADING
+# ============================================================================
+
+def read_student_columns(filepath: str) -> Dict[str, list]:
+    """Parse the student CSV into StudentTable constructor columns (vectorized)"""
+    import pandas as pd
+    df = pd.read_csv(filepath).reset_index(drop=True)
+    n = len(df)
+    
+    # Department from roll number
+    roll_no = df['roll_no'].map(str)
+    
+    # Union of the comma-separated skills of both domains
+    skills = [set() for _ in range(n)]
+    for column in ('skills_for_domain_1', 'skills_for_domain_2'):
+        if column not in df:
+            continue
+        values = df[column]
+        present = np.flatnonzero(values.notna().to_numpy())
+        for i, items in zip(present.tolist(), values.iloc[present].map(str).str.split(',').tolist()):
+            skills[i].update(s.strip() for s in items)
+    
+    domain_2 = df['domain_2'].tolist() if 'domain_2' in df else [None] * n
+    
+    return {
+        'roll_no': roll_no.tolist(),
+        'name': df['name'].map(str).str.strip().tolist(),
+        'cgpa': df['cgpa'].to_numpy(dtype=np.float64),
+        'department': roll_no.str[2:4].str.upper().tolist(),
+        'domain_1': df['domain_1'].map(str).tolist(),
+        'domain_2': [None if _is_missing(d) or d == '' else d for d in domain_2],
+        'skills': skills,
+    }
+
+
+def load_students(filepath: str) -> List[Student]:
+    """Load students from CSV file (views onto one StudentTable)"""
+    return StudentTable(**read_student_columns(filepath)).views()
+
+
+def _parse_unique(values, parse) -> list:
+    """Apply a parser once per distinct value of a column (a pandas Series)"""
+    import pandas as pd
+    codes, uniques = pd.factorize(values)
+    parsed = [parse(u) for u in uniques]
+    missing = parse(np.nan)
+    return [parsed[c] if c >= 0 else missing for c in codes.tolist()]
+
+
+def read_company_columns(filepath: str, shortlist_dir) -> Dict[str, list]:
+    """
+    Parse the company CSV into CompanyTable constructor columns (vectorized).
+    shortlist_dir is a shortlist directory or a ShortlistStore.
+    """
+    import pandas as pd
+    df = pd.read_csv(filepath)
+    company_name = df['company_name'].map(str).str.strip()
+    job_role = df['job_role'].map(str).str.strip()
+    max_hires = df['max_offers'].to_numpy(dtype=np.int64)
+    
+    # Get interview slots from shortlist sizes
+    shortlists = shortlist_dir if isinstance(shortlist_dir, ShortlistStore) else load_shortlist_store(shortlist_dir)
+    company_ids = (company_name + '_' + job_role).tolist()
+    interview_slots = np.array([shortlists.size(shortlists.key_for(cid)) for cid in company_ids], dtype=np.int64)
+    
+    # FIX #1: If no shortlist or small shortlist, use max_hires * 2 as buffer
+    # This allows companies to interview more candidates than shortlist size
+    # Even with shortlist, ensure minimum interview capacity
+    interview_slots = np.where(interview_slots == 0, max_hires * 2,
+                               np.maximum(interview_slots, (max_hires * 1.5).astype(np.int64)))
+    
+    return {
+        'company_name': company_name.tolist(),
+        'job_role': job_role.tolist(),
+        'allowed_departments': _parse_unique(df['allowed_departments'], parse_departments),
+        'min_cgpa': _parse_unique(df['min_cgpa'], parse_cgpa_requirement),
+        'required_skills': _parse_unique(df['required_skills'], parse_skills),
+        'visit_day': df['arrival_day'].to_numpy(dtype=np.int64),
+        'min_hires': df['min_offers'].to_numpy(dtype=np.int64),
+        'max_hires': max_hires,
+        'interview_slots': interview_slots,
+    }
+
+
+def load_companies(filepath: str, shortlist_dir) -> List[Company]:
+    """Load companies from CSV file and match with shortlist files"""
+    return CompanyTable(**read_company_columns(filepath, shortlist_dir)).views()
 
 
 def load_company_order(filepath: str) -> Dict[int, List[str]]:
@@ -649,6 +1830,254 @@ def load_company_order(filepath: str) -> Dict[int, List[str]]:
     return company_order
 
 
+# ============================================================================
+# PARSE CACHE
+# ============================================================================
+
+PARSE_CACHE_VERSION = 2
+STUDENTS_FILE_NAME = 'analysis_data.csv'
+COMPANIES_FILE_NAME = 'companies.csv'
+DEP_SCORE_FILE_NAME = 'dep_score.csv'
+COMPANY_ORDER_FILE_NAME = 'company_order.csv'
+SHORTLIST_DIR_NAME = 'company shortlists(csv)'
+
+
+def dataset_fingerprint(data_dir) -> str:
+    """
+    Content hash of a dataset directory: the student, company, department score
+    and company order CSVs, every shortlist file, and the shortlist mapping.
+    """
+    data_dir = Path(data_dir)
+    digest = hashlib.sha256(f"parse-cache-v{PARSE_CACHE_VERSION}".encode())
+    digest.update(json.dumps(COMPANY_SHORTLIST_MAPPING, sort_keys=True).encode())
+    
+    shortlist_dir = data_dir / SHORTLIST_DIR_NAME
+    shortlists = sorted(shortlist_dir.glob('*.csv')) if shortlist_dir.is_dir() else []
+    _hash_files(digest, [(n, data_dir / n) for n in (STUDENTS_FILE_NAME, COMPANIES_FILE_NAME,
+                                                    DEP_SCORE_FILE_NAME, COMPANY_ORDER_FILE_NAME)] +
+                        [(f"{SHORTLIST_DIR_NAME}/{p.name}", p) for p in shortlists])
+    return digest.hexdigest()
+
+
+def _pack_lists(lists) -> Tuple[np.ndarray, np.ndarray]:
+    """Lists of strings -> (flat values, offsets) arrays"""
+    values = [v for items in lists for v in items]
+    offsets = np.cumsum([0] + [len(items) for items in lists]).astype(np.int64)
+    return np.array(values, dtype=str), offsets
+
+
+def _unpack_lists(values: np.ndarray, offsets: np.ndarray) -> List[List[str]]:
+    values = values.tolist()
+    return [values[a:b] for a, b in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+
+
+def save_parse_cache(path, student_columns: Dict, company_columns: Dict, company_order: Dict[int, List[str]],
+                     dep_scores: Dict[str, float], fingerprint: str):
+    """Write parsed dataset columns to an .npz file (atomically)"""
+    arrays = {'fingerprint': np.array(fingerprint)}
+    for key in ('roll_no', 'name', 'department', 'domain_1'):
+        arrays[f'student_{key}'] = np.array(student_columns[key], dtype=str)
+    arrays['student_domain_2'] = np.array(['' if d is None else d for d in student_columns['domain_2']], dtype=str)
+    arrays['student_cgpa'] = np.asarray(student_columns['cgpa'], dtype=np.float64)
+    arrays['student_skills'], arrays['student_skill_offsets'] = _pack_lists(
+        [sorted(s) for s in student_columns['skills']])
+    
+    for key in ('company_name', 'job_role'):
+        arrays[f'company_{key}'] = np.array(company_columns[key], dtype=str)
+    for key in ('min_cgpa', 'visit_day', 'min_hires', 'max_hires', 'interview_slots'):
+        arrays[f'company_{key}'] = np.asarray(company_columns[key])
+    for key in ('allowed_departments', 'required_skills'):
+        arrays[f'company_{key}'], arrays[f'company_{key}_offsets'] = _pack_lists(company_columns[key])
+    
+    serials = sorted(company_order)
+    arrays['order_serials'] = np.array(serials, dtype=np.int64)
+    arrays['order_companies'], arrays['order_offsets'] = _pack_lists([company_order[k] for k in serials])
+    arrays['dep_codes'] = np.array(list(dep_scores.keys()), dtype=str)
+    arrays['dep_scores'] = np.array(list(dep_scores.values()), dtype=np.float64)
+    
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+
+
+def load_parse_cache(path) -> Tuple[Dict, Dict, Dict[int, List[str]], Dict[str, float], str]:
+    """Read columns written by save_parse_cache (plus the stored fingerprint)"""
+    with np.load(path, allow_pickle=False) as data:
+        student_columns = {key: data[f'student_{key}'].tolist() for key in ('roll_no', 'name', 'department', 'domain_1')}
+        student_columns['domain_2'] = [d if d else None for d in data['student_domain_2'].tolist()]
+        student_columns['cgpa'] = data['student_cgpa']
+        student_columns['skills'] = [set(s) for s in _unpack_lists(data['student_skills'],
+                                                                   data['student_skill_offsets'])]
+        
+        company_columns = {key: data[f'company_{key}'].tolist() for key in ('company_name', 'job_role')}
+        for key in ('min_cgpa', 'visit_day', 'min_hires', 'max_hires', 'interview_slots'):
+            company_columns[key] = data[f'company_{key}']
+        for key in ('allowed_departments', 'required_skills'):
+            company_columns[key] = _unpack_lists(data[f'company_{key}'], data[f'company_{key}_offsets'])
+        
+        company_order = dict(zip(data['order_serials'].tolist(),
+                                 _unpack_lists(data['order_companies'], data['order_offsets'])))
+        dep_scores = dict(zip(data['dep_codes'].tolist(), data['dep_scores'].tolist()))
+        fingerprint = str(data['fingerprint'])
+    return student_columns, company_columns, company_order, dep_scores, fingerprint
+
+
+def load_dataset(data_dir, cache_dir=None, use_cache: bool = True
+                 ) -> Tuple[List[Student], List[Company], Dict[int, List[str]], Dict[str, float]]:
+    """
+    Load students, companies, company order and department scores from a dataset
+    directory. Parsed columns are cached in cache_dir (data_dir/.parse_cache by
+    default) under the dataset's content fingerprint, so unchanged data is not re-parsed.
+    """
+    data_dir = Path(data_dir)
+    cache_path = None
+    if use_cache:
+        fingerprint = dataset_fingerprint(data_dir)
+        cache_dir = data_dir / '.parse_cache' if cache_dir is None else Path(cache_dir)
+        cache_path = cache_dir / f"dataset_{fingerprint[:32]}.npz"
+        if cache_path.exists():
+            try:
+                student_columns, company_columns, company_order, dep_scores, stored = load_parse_cache(cache_path)
+                if stored == fingerprint:
+                    return (StudentTable(**student_columns).views(), CompanyTable(**company_columns).views(),
+                            company_order, dep_scores)
+            except (OSError, KeyError, ValueError):
+                pass  # unreadable or outdated cache file: parse again and overwrite it
+    
+    student_columns = read_student_columns(data_dir / STUDENTS_FILE_NAME)
+    shortlists = load_shortlist_store(data_dir / SHORTLIST_DIR_NAME, cache_dir=cache_dir, use_cache=use_cache)
+    company_columns = read_company_columns(data_dir / COMPANIES_FILE_NAME, shortlists)
+    company_order = load_company_order(data_dir / COMPANY_ORDER_FILE_NAME)
+    dep_score_file = data_dir / DEP_SCORE_FILE_NAME
+    dep_scores = read_dep_scores(dep_score_file) if dep_score_file.exists() else {}
+    
+    if cache_path is not None:
+        save_parse_cache(cache_path, student_columns, company_columns, company_order, dep_scores, fingerprint)
+    
+    return (StudentTable(**student_columns).views(), CompanyTable(**company_columns).views(),
+            company_order, dep_scores)
+
+
+class CompanySchedule:
+    """
+    Immutable (day, serial) -> company index schedule.
+    Resolves the names in company_order.csv against company names once (same
+    case-insensitive, bidirectional substring rule as before) and records order
+    names that match nothing or more than one company.
+    """
+
+    def __init__(self, company_order: Dict[int, List[str]], companies: List[Company]):
+        self.company_ids = tuple(c.get_unique_id() for c in companies)
+        self.serials = tuple(sorted(company_order.keys()))
+
+        # Resolve every order name against every distinct company name once
+        company_names = list(dict.fromkeys(c.company_name for c in companies))
+        name_matches = {}
+        for names in company_order.values():
+            for order_name in names:
+                if order_name not in name_matches:
+                    lowered = order_name.lower()
+                    name_matches[order_name] = frozenset(
+                        n for n in company_names if lowered in n.lower() or n.lower() in lowered)
+
+        slots = {}
+        for day in sorted({c.visit_day for c in companies}):
+            for serial in self.serials:
+                matched = set()
+                for order_name in company_order[serial]:
+                    matched |= name_matches[order_name]
+                slots[(day, serial)] = tuple(j for j, c in enumerate(companies)
+                                             if c.visit_day == day and c.company_name in matched)
+        self._slots = MappingProxyType(slots)
+
+        scheduled = {j for rows in slots.values() for j in rows}
+        self.unmatched = tuple(n for n, m in name_matches.items() if not m)
+        self.ambiguous = MappingProxyType({n: tuple(sorted(m)) for n, m in name_matches.items() if len(m) > 1})
+        self.unscheduled = tuple(self.company_ids[j] for j in range(len(companies)) if j not in scheduled)
+
+    def companies_for(self, day: int, serial: int) -> Tuple[int, ...]:
+        """Company row indices visiting on a day/serial (empty if none)"""
+        return self._slots.get((day, serial), ())
+
+    def report(self, include_unscheduled: bool = True) -> List[str]:
+        """Human-readable warnings about unresolved or ambiguous order names"""
+        lines = []
+        for name in self.unmatched:
+            lines.append(f"Order name '{name}' matches no company")
+        for name, matches in self.ambiguous.items():
+            lines.append(f"Order name '{name}' matches several companies: {', '.join(matches)}")
+        for company_id in (self.unscheduled if include_unscheduled else ()):
+            lines.append(f"Company '{company_id}' is not in any serial")
+        return lines
+
+
+# ============================================================================
+# SNAPSHOT FILES
+# ============================================================================
+
+SNAPSHOT_MAGIC = b'PLCSNAP\0'
+SNAPSHOT_ALIGN = 64
+
+
+def write_snapshot(path, arrays: Dict[str, np.ndarray], meta: Dict):
+    """
+    Write named arrays and JSON metadata to one binary file: magic, header length,
+    JSON header (meta plus dtype/shape/offset of every array), then the raw
+    arrays at 64-byte aligned offsets. Written to a temp file, then renamed.
+    """
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        layout[name] = [array.dtype.str, list(array.shape), offset]
+        offset += -(-array.nbytes // SNAPSHOT_ALIGN) * SNAPSHOT_ALIGN
+    header = json.dumps({'meta': meta, 'arrays': layout}).encode()
+    data_start = -(-(len(SNAPSHOT_MAGIC) + 8 + len(header)) // SNAPSHOT_ALIGN) * SNAPSHOT_ALIGN
+    
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC + np.uint64(len(header)).tobytes() + header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name][2])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp, path)
+
+
+def read_snapshot(path, mmap: bool = True) -> Tuple[Dict[str, np.ndarray], Dict]:
+    """
+    (arrays, meta) from a file written by write_snapshot. With mmap the arrays are
+    read-only views onto one memory map of the file, so processes opening the same
+    snapshot share its pages.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a snapshot file")
+        header_length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+        header = json.loads(f.read(header_length))
+        data_start = -(-(len(SNAPSHOT_MAGIC) + 8 + header_length) // SNAPSHOT_ALIGN) * SNAPSHOT_ALIGN
+        if mmap:
+            size = os.fstat(f.fileno()).st_size
+            buffer = np.memmap(f, dtype=np.uint8, mode='r') if size > data_start else np.zeros(0, dtype=np.uint8)
+        else:
+            f.seek(0)
+            buffer = np.frombuffer(f.read(), dtype=np.uint8)
+    
+    arrays = {}
+    for name, (dtype, shape, offset) in header['arrays'].items():
+        dtype = np.dtype(dtype)
+        start = data_start + offset
+        count = int(np.prod(shape, dtype=np.int64))
+        arrays[name] = buffer[start:start + count * dtype.itemsize].view(dtype).reshape(shape)
+    return arrays, header['meta']
+
+
 # ============================================================================
 # MAIN SIMULATION CODE (to be continued)
 # ============================================================================
@@ -1,132 +1,112 @@
-import subprocess
-import pandas as pd
+import argparse
 import numpy as np
 from pathlib import Path
 import json
-import sys
 
-def run_single_simulation(run_number):
-    """Run a single simulation and return the results"""
-    print(f"\n{'='*80}")
-    print(f"RUNNING SIMULATION {run_number}/10 (Seed: {100 + run_number})")
-    print(f"{'='*80}\n")
-    
-    # Run the simulation with a different seed
-    # Pass the seed as an environment variable or command line argument
-    import os
-    env = os.environ.copy()
-    env['RANDOM_SEED'] = str(100 + run_number)
-    
-    result = subprocess.run(
-        [sys.executable, 'run_simulation.py', '--seed', str(100 + run_number)],
-        capture_output=True,
-        text=True,
-        cwd=Path(__file__).parent,
-        env=env
-    )
-    
-    # Read the results CSV file
-    results_path = Path(__file__).parent.parent / 'day1_placement_results.csv'
-    df = pd.read_csv(results_path)
-    
-    # Calculate statistics
-    placed = df[df['status'] == 'Placed']
-    opted_out = df[df['status'] == 'Opted_Out']
-    unplaced = df[df['status'] == 'Unplaced']
-    
-    stats = {
-        'run_number': run_number,
-        'total_students': len(df),
-        'total_placed': len(placed),
-        'total_opted_out': len(opted_out),
-        'total_unplaced': len(unplaced),
-        'placement_rate': (len(placed) / len(df)) * 100,
-        'opt_out_rate': (len(opted_out) / len(df)) * 100,
-        'companies_hired': placed['placed_company'].nunique() if len(placed) > 0 else 0,
-    }
-    
-    # Get company-wise counts
-    if len(placed) > 0:
-        company_counts = placed['placed_company'].value_counts().to_dict()
-        stats['company_counts'] = company_counts
-    else:
-        stats['company_counts'] = {}
-    
-    # Get department-wise counts
-    if len(placed) > 0:
-        dept_counts = placed['department'].value_counts().to_dict()
-        stats['dept_counts'] = dept_counts
-    else:
-        stats['dept_counts'] = {}
-    
-    print(f"Run {run_number} Results:")
+from run_simulation import Scenario
+from placement_simulation import ACCEPTANCE_MODES
+from monte_carlo import aggregate_monte_carlo, run_until_precise, spawn_seeds, SCALAR_METRICS, DEFAULT_ROOT_SEED
+
+# Runs beyond this count are only aggregated, not listed individually
+MAX_RUN_DETAILS = 100
+RUN_DETAIL_FIELDS = ['run_number', 'seed', 'total_placed', 'total_opted_out', 'placement_rate', 'companies_hired']
+
+def print_run(stats):
+    """Print the headline numbers of one run"""
+    print(f"Run {stats['run_number']} (Seed: {stats['seed']}) Results:")
     print(f"  Placed: {stats['total_placed']}")
     print(f"  Opted Out: {stats['total_opted_out']}")
     print(f"  Placement Rate: {stats['placement_rate']:.2f}%")
-    
-    return stats
 
 def main():
+    parser = argparse.ArgumentParser(description="Run repeated placement simulations")
+    parser.add_argument('--runs', type=int, default=10, help="number of simulations")
+    parser.add_argument('--seed', type=int, default=DEFAULT_ROOT_SEED,
+                        help="root seed; run k uses the k-th stream spawned from it")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument('--antithetic', action='store_true', help="average each run with its antithetic twin")
+    parser.add_argument('--acceptance', default='random', choices=ACCEPTANCE_MODES,
+                        help="offer resolution: over-offer + random choice, or deferred acceptance")
+    parser.add_argument('--sobol', action='store_true', help="openings draws from a scrambled Sobol sequence (needs scipy)")
+    parser.add_argument('--ci-width', type=float, default=None,
+                        help="stop once the confidence interval of --metric is narrower than this (--runs is the cap)")
+    parser.add_argument('--metric', default='placement_rate', choices=SCALAR_METRICS, help="metric for --ci-width")
+    parser.add_argument('--scenario', default=None, help="compiled scenario snapshot (see compile_scenario.py)")
+    args = parser.parse_args()
+    n_runs = args.runs
+    params = {'acceptance_mode': args.acceptance} if args.acceptance != 'random' else None
+    
     print("\n" + "="*80)
-    print("RUNNING 10 SIMULATIONS")
+    print(f"RUNNING {'UP TO ' if args.ci_width is not None else ''}{n_runs} SIMULATIONS")
     print("="*80)
     
-    all_runs = []
-    
-    # Run 10 simulations
-    for i in range(1, 11):
-        stats = run_single_simulation(i)
-        all_runs.append(stats)
+    # Load and preprocess the data once (or attach to a compiled snapshot); every run shares it
+    data_dir = Path(__file__).parent.parent
+    scenario = Scenario.open(args.scenario, data_dir=data_dir) if args.scenario else Scenario.load(data_dir)
+    
+    # Stream runs into running statistics; per-run rows are only kept for small jobs
+    run_rows = []
+    progress_every = max(1, n_runs // 20)
+    
+    def on_run(stats, aggregator):
+        if n_runs <= MAX_RUN_DETAILS:
+            print_run(stats)
+            run_rows.append({k: stats[k] for k in RUN_DETAIL_FIELDS})
+        elif aggregator.n_runs % progress_every == 0:
+            overall = aggregator.summary()['overall']
+            print(f"  {aggregator.n_runs}/{n_runs} runs - placed {overall['total_placed']['mean']:.1f} "
+                  f"± {overall['total_placed']['std']:.1f}")
+    
+    if args.ci_width is not None:
+        def on_batch(aggregator, estimate, half_width):
+            print(f"  {aggregator.n_runs} runs - {args.metric} {estimate:.3f} ± {half_width:.3f}")
+        
+        result = run_until_precise(scenario, args.metric, args.ci_width, root_seed=args.seed, max_runs=n_runs,
+                                   workers=args.workers, antithetic=args.antithetic, sobol=args.sobol, on_batch=on_batch,
+                                   params=params)
+        aggregator = result['aggregator']
+        n_runs = aggregator.n_runs
+        status = "reached" if result['converged'] else "NOT reached"
+        print(f"\nTarget CI width {args.ci_width} {status} after {n_runs} runs: "
+              f"{args.metric} = {result['estimate']:.3f} ± {result['half_width']:.3f}")
+    else:
+        aggregator = aggregate_monte_carlo(scenario, spawn_seeds(args.seed, n_runs), workers=args.workers,
+                                           on_run=on_run, antithetic=args.antithetic, sobol=args.sobol, params=params)
     
     # Calculate averages
     print("\n\n" + "="*80)
     print("CALCULATING AVERAGE STATISTICS")
     print("="*80 + "\n")
     
-    avg_placed = np.mean([r['total_placed'] for r in all_runs])
-    std_placed = np.std([r['total_placed'] for r in all_runs])
-    min_placed = min([r['total_placed'] for r in all_runs])
-    max_placed = max([r['total_placed'] for r in all_runs])
-    
-    avg_opted_out = np.mean([r['total_opted_out'] for r in all_runs])
-    std_opted_out = np.std([r['total_opted_out'] for r in all_runs])
-    
-    avg_placement_rate = np.mean([r['placement_rate'] for r in all_runs])
-    std_placement_rate = np.std([r['placement_rate'] for r in all_runs])
+    summary = aggregator.summary()
+    overall = summary['overall']
     
-    avg_opt_out_rate = np.mean([r['opt_out_rate'] for r in all_runs])
+    avg_placed = overall['total_placed']['mean']
+    std_placed = overall['total_placed']['std']
+    min_placed = int(overall['total_placed']['min'])
+    max_placed = int(overall['total_placed']['max'])
     
-    avg_companies_hired = np.mean([r['companies_hired'] for r in all_runs])
+    avg_opted_out = overall['total_opted_out']['mean']
+    std_opted_out = overall['total_opted_out']['std']
     
-    # Company-wise averages
-    all_companies = set()
-    for run in all_runs:
-        all_companies.update(run['company_counts'].keys())
+    avg_placement_rate = overall['placement_rate']['mean']
+    std_placement_rate = overall['placement_rate']['std']
     
-    company_avg = {}
-    company_std = {}
-    for company in all_companies:
-        counts = [run['company_counts'].get(company, 0) for run in all_runs]
-        company_avg[company] = np.mean(counts)
-        company_std[company] = np.std(counts)
+    avg_opt_out_rate = overall['opt_out_rate']['mean']
     
-    # Department-wise averages
-    all_depts = set()
-    for run in all_runs:
-        all_depts.update(run['dept_counts'].keys())
+    avg_companies_hired = overall['companies_hired']['mean']
     
-    dept_avg = {}
-    dept_std = {}
-    for dept in all_depts:
-        counts = [run['dept_counts'].get(dept, 0) for run in all_runs]
-        dept_avg[dept] = np.mean(counts)
-        dept_std[dept] = np.std(counts)
+    # Company-wise and department-wise averages
+    company_avg = {c: s['mean'] for c, s in summary['company_counts'].items()}
+    company_std = {c: s['std'] for c, s in summary['company_counts'].items()}
+    dept_avg = {d: s['mean'] for d, s in summary['dept_counts'].items()}
+    dept_std = {d: s['std'] for d, s in summary['dept_counts'].items()}
     
     # Print results
     print("="*80)
-    print("OVERALL STATISTICS (10 RUNS)")
+    print(f"OVERALL STATISTICS ({n_runs} RUNS)")
     print("="*80)
-    print(f"\nTotal Students per Run: {all_runs[0]['total_students']}")
+    print(f"\nTotal Students per Run: {int(overall['total_students']['mean'])}")
     print(f"\nPlacements:")
     print(f"  Average: {avg_placed:.1f} ± {std_placed:.1f}")
     print(f"  Min: {min_placed}")
@@ -152,25 +132,27 @@ def main():
     print("DEPARTMENT-WISE AVERAGES (Sorted by Average Placements)")
     print("="*80 + "\n")
     
+    table = scenario.student_table
+    dept_sizes = dict(zip(table.dept_names, np.bincount(table.dept_code, minlength=len(table.dept_names))))
     sorted_depts = sorted(dept_avg.items(), key=lambda x: x[1], reverse=True)
     for dept, avg_count in sorted_depts:
         std_count = dept_std[dept]
-        # Get total students in department from first run
-        total_in_dept = len([s for s in pd.read_csv(Path(__file__).parent.parent / 'day1_placement_results.csv').itertuples() if s.department == dept])
+        total_in_dept = dept_sizes.get(dept, 0)
         if total_in_dept > 0:
             placement_rate = (avg_count / total_in_dept) * 100
             print(f"{dept:<10} : {avg_count:>5.1f} ± {std_count:>4.1f} ({placement_rate:>5.2f}% avg placement rate)")
     
     # Print individual run details
-    print("\n" + "="*80)
-    print("INDIVIDUAL RUN DETAILS")
-    print("="*80 + "\n")
-    
-    print(f"{'Run':<6} {'Placed':<10} {'Opted Out':<12} {'Placement %':<15} {'Companies':<12}")
-    print("-" * 80)
-    for run in all_runs:
-        print(f"{run['run_number']:<6} {run['total_placed']:<10} {run['total_opted_out']:<12} "
-              f"{run['placement_rate']:<14.2f}% {run['companies_hired']:<12}")
+    if run_rows:
+        print("\n" + "="*80)
+        print("INDIVIDUAL RUN DETAILS")
+        print("="*80 + "\n")
+        
+        print(f"{'Run':<6} {'Placed':<10} {'Opted Out':<12} {'Placement %':<15} {'Companies':<12}")
+        print("-" * 80)
+        for run in run_rows:
+            print(f"{run['run_number']:<6} {run['total_placed']:<10} {run['total_opted_out']:<12} "
+                  f"{run['placement_rate']:<14.2f}% {run['companies_hired']:<12}")
     
     print("\n" + "="*80)
     print("ANALYSIS COMPLETE!")
@@ -180,7 +162,8 @@ def main():
     output_file = Path(__file__).parent / 'multiple_runs_results.json'
     with open(output_file, 'w') as f:
         json.dump({
-            'all_runs': all_runs,
+            'n_runs': n_runs,
+            'all_runs': run_rows,
             'summary': {
                 'avg_placed': avg_placed,
                 'std_placed': std_placed,
@@ -197,6 +180,7 @@ def main():
             'company_std': company_std,
             'dept_averages': dept_avg,
             'dept_std': dept_std,
+            'statistics': summary,
         }, f, indent=2, default=str)
     
     print(f"\nDetailed results saved to: {output_file}")
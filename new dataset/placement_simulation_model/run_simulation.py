@@ -6,233 +6,503 @@ Implements the multi-stage placement process
 from placement_simulation import *
 import json
 import sys
-import os
-
-# Check for seed argument
-if len(sys.argv) > 2 and sys.argv[1] == '--seed':
-    seed = int(sys.argv[2])
-    os.environ['RANDOM_SEED'] = str(seed)
-    # Re-import to use new seed
-    import importlib
-    import placement_simulation
-    importlib.reload(placement_simulation)
-    from placement_simulation import *
+import time
+import logging
+
+# ============================================================================
+# LOGGING
+# ============================================================================
+
+# Step banners and per-company lines are INFO, per-student lines DEBUG and
+# unmet hiring minimums WARNING. Unconfigured, only warnings reach stderr.
+LOG = logging.getLogger('placement_simulation')
+
+# Logger that discards everything: messages are never formatted (batch runs)
+SILENT_LOGGER = logging.getLogger('placement_simulation.silent')
+SILENT_LOGGER.setLevel(logging.CRITICAL + 1)
+SILENT_LOGGER.propagate = False
+
+RULE = '=' * 80
+DAY_RULE = '#' * 80
+
+# ============================================================================
+# STEP TIMINGS & COUNTERS
+# ============================================================================
+
+# Steps of one day/serial, in order (wall time of each is recorded in stats['timings'])
+STEP_NAMES = ['step1_initialization', 'step2_application', 'step3_test_invitation',
+              'step4_interview_shortlist', 'step5_interview_hiring', 'step6_offer_acceptance']
+
+# Hot-path counters in stats['counters']:
+#   eligibility_checks       (company, unplaced student) pairs checked in step 2
+#   skill_match_evaluations  skill match scores looked up in step 4
+#   skill_cache_hits/misses  per-company score vectors served from / added to the skill match cache
+#   rng_draws                random numbers consumed (rng stream or common random numbers)
+COUNTER_NAMES = ['eligibility_checks', 'skill_match_evaluations', 'skill_cache_hits', 'skill_cache_misses',
+                 'rng_draws']
+
+
+def empty_timings() -> Dict:
+    """
+    Timing record of a simulation: 'days' (day -> step -> seconds, plus 'total'),
+    'serials' (one {'day', 'serial', step: seconds} record per serial run) and
+    'companies' (company ID -> step -> seconds spent on it in steps 2, 4 and 5)
+    """
+    return {'days': {}, 'serials': [], 'companies': {}}
+
+
+def configure_logging(level=logging.INFO, stream=None):
+    """Send engine messages at or above level to stream (stdout by default) as plain lines"""
+    handler = logging.StreamHandler(sys.stdout if stream is None else stream)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    LOG.handlers = [handler]
+    LOG.setLevel(level)
+    LOG.propagate = False
+
+
+class JsonLinesSink:
+    """Writes one JSON object per line (per-serial and per-day simulation summaries)"""
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+    
+    def write(self, record: Dict):
+        self._file.write(json.dumps(record) + '\n')
+    
+    def close(self):
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ============================================================================
+# SEEDING
+# ============================================================================
+
+# A simulation seed is an int or a numpy SeedSequence. Batch runs use spawned
+# children of one root SeedSequence, so every run (and, with common random
+# numbers, every company decision) gets an independent stream that depends only
+# on its position, never on which worker runs it or how many runs there are.
+
+def spawn_seeds(root_seed: int, n_runs: int, start: int = 0) -> List[np.random.SeedSequence]:
+    """
+    Streams for runs start .. start + n_runs - 1: run k gets child k of
+    SeedSequence(root_seed), the same as SeedSequence(root_seed).spawn(k + 1)[k]
+    """
+    return [np.random.SeedSequence(root_seed, spawn_key=(k,)) for k in range(start, start + n_runs)]
+
+
+def seed_label(seed):
+    """JSON-friendly seed identifier: the int seed, or '<root>/<k>' for a spawned SeedSequence"""
+    if isinstance(seed, np.random.SeedSequence):
+        return '/'.join(str(part) for part in (seed.entropy, *seed.spawn_key))
+    return seed
+
 
 # ============================================================================
 # SIMULATION ENGINE
 # ============================================================================
 
+class CommonRandomNumbers:
+    """
+    Random draws keyed by the decision they feed (stage, company or day/serial)
+    instead of by draw order, so simulations with different parameters but the
+    same seed see the same random numbers for the same decision.
+    antithetic=True replaces every uniform u by 1 - u. openings_draws (one value
+    in [0, 1) per company row, e.g. a Sobol point per run) are used as the
+    openings draws instead of the company's stream.
+    With a SeedSequence seed, each decision's stream is a spawned child of it
+    (spawn key extended by the stage and the company or day/serial key).
+    """
+    
+    STAGES = {'R1': 1, 'R2': 2, 'openings': 3, 'choice': 4, 'opt_out': 5, 'preference': 6}
+    
+    def __init__(self, seed, n_students: int, antithetic: bool = False, openings_draws: np.ndarray = None):
+        self.seed = seed
+        self.n_students = n_students
+        self.antithetic = antithetic
+        self.openings_draws = openings_draws
+    
+    def uniforms(self, stage: str, key: Tuple[int, ...], size: int = None) -> np.ndarray:
+        """U[0, 1) draws for one decision; per-student stages return one value per student row"""
+        size = self.n_students if size is None else size
+        if self.openings_draws is not None and stage == 'openings':
+            u = np.full(size, self.openings_draws[key[0]])
+        else:
+            if isinstance(self.seed, np.random.SeedSequence):
+                stream = np.random.SeedSequence(self.seed.entropy,
+                                                spawn_key=(*self.seed.spawn_key, self.STAGES[stage], *key))
+            else:
+                stream = [self.seed, self.STAGES[stage], *key]
+            u = np.random.default_rng(stream).random(size)
+        if self.antithetic:
+            u = np.minimum(1.0 - u, np.nextafter(1.0, 0.0))
+        return u
+
+
 class PlacementSimulation:
     """Main simulation engine for placement process"""
     
-    def __init__(self, students: List[Student], companies: List[Company], company_order: Dict[int, List[str]]):
-        self.students = {s.roll_no: s for s in students}
-        self.companies = {c.get_unique_id(): c for c in companies}
+    def __init__(self, students: List[Student], companies: List[Company], company_order: Dict[int, List[str]],
+                 seed=None, schedule: CompanySchedule = None, eligibility: EligibilityMatrix = None,
+                 skill_match: SkillMatchMatrix = None, crn: CommonRandomNumbers = None,
+                 logger: logging.Logger = None, summary_sink: JsonLinesSink = None,
+                 config: SimulationConfig = None, dep_scores: Dict[str, float] = None):
+        """
+        students/companies are lists of objects or, to skip rebuilding them, a
+        StudentTable/CompanyTable with fresh state. seed is an int or a
+        SeedSequence (see spawn_seeds). schedule, eligibility and
+        skill_match may be shared between simulations of the same inputs.
+        crn switches the random draws from the sequential rng stream to
+        decision-keyed common random numbers. logger defaults to LOG (pass
+        SILENT_LOGGER for batch runs); summary_sink receives per-serial and
+        per-day summary records. config holds the model parameters
+        (DEFAULT_CONFIG if not given); dep_scores maps department codes to
+        their score (default_dep_scores() if not given).
+        """
         self.company_order = company_order
         self.current_day = 0
+        self.config = DEFAULT_CONFIG if config is None else config
+        
+        # Columnar state: Student/Company objects become views onto these tables
+        if isinstance(students, StudentTable):
+            self.student_table = students
+        else:
+            self.student_table = StudentTable.bind(list({s.roll_no: s for s in students}.values()))
+        if isinstance(companies, CompanyTable):
+            self.company_table = companies
+            self.company_table.student_table = self.student_table
+        else:
+            self.company_table = CompanyTable.bind(list({c.get_unique_id(): c for c in companies}.values()),
+                                                   self.student_table)
+        self._students = None
+        self.companies = {c.get_unique_id(): c for c in self.company_table.views()}
+        
+        # Day/serial -> company schedule (reused if it was resolved for the same company list)
+        if schedule is None or schedule.company_ids != tuple(self.companies.keys()):
+            schedule = CompanySchedule(company_order, list(self.companies.values()))
+        self.schedule = schedule
+        
+        # Per-simulation random stream (independent of the global random / np.random state);
+        # an int seed s gives the same stream as SeedSequence(s)
+        self.seed = RANDOM_SEED if seed is None else seed
+        self.rng = np.random.default_rng(self.seed)
+        self.crn = crn
         
-        # Statistics
+        # Progress messages and structured summaries
+        self.log = LOG if logger is None else logger
+        self.summary_sink = summary_sink
+        
+        # Eligibility (department, CGPA, domain) precomputed once for all pairs
+        if eligibility is None:
+            eligibility = EligibilityMatrix(list(self.students.values()), list(self.companies.values()))
+        self.eligibility = eligibility
+        
+        # Skill match scores from packed skill bit vectors
+        if skill_match is None:
+            skill_match = SkillMatchMatrix(list(self.students.values()), list(self.companies.values()))
+        self.skill_match = skill_match
+        
+        # Department score of every student (default to 5 if not found)
+        dep_scores = default_dep_scores() if dep_scores is None else dep_scores
+        dept_scores = np.array([dep_scores.get(d, 5.0) for d in self.student_table.dept_names], dtype=np.float64)
+        self.dep_scores = dept_scores[self.student_table.dept_code] if len(dept_scores) else np.zeros(0)
+        
+        # Statistics (timings and counters describe the run itself, not its outcome)
         self.stats = {
             'day_wise_placements': {},
             'company_wise_hires': {},
             'unplaced_students': len(students),
-            'opted_out_students': 0
+            'opted_out_students': 0,
+            'timings': empty_timings(),
+            'counters': dict.fromkeys(COUNTER_NAMES, 0),
         }
     
+    @property
+    def students(self) -> Dict[str, Student]:
+        """Students by roll number (views onto student_table, built on first use)"""
+        if self._students is None:
+            self._students = {s.roll_no: s for s in self.student_table.views()}
+        return self._students
+    
+    def _uniform_draws(self, stage: str, companies: List[Company], funnel: List[np.ndarray],
+                       low: float, high: float) -> np.ndarray:
+        """U[low, high) draws for every (company, student in its funnel stage) pair, in company order"""
+        sizes = [len(funnel[c.row]) for c in companies]
+        self.stats['counters']['rng_draws'] += sum(sizes)
+        if self.crn is None:
+            return self.rng.uniform(low, high, size=sum(sizes))
+        if not companies:
+            return np.zeros(0)
+        u = np.concatenate([self.crn.uniforms(stage, (c.row,))[funnel[c.row]] for c in companies])
+        return low + (high - low) * u
+    
+    def _add_company_time(self, company: Company, step: str, seconds: float):
+        """Add wall time spent on one company in a step to stats['timings']['companies']"""
+        times = self.stats['timings']['companies'].setdefault(company.get_unique_id(), {})
+        times[step] = times.get(step, 0.0) + seconds
+    
+    def _run_step(self, step_times: Dict[str, float], step: str, *args):
+        """Call a step method and add its wall time to step_times"""
+        start = time.perf_counter()
+        result = getattr(self, step)(*args)
+        step_times[step] = step_times.get(step, 0.0) + time.perf_counter() - start
+        return result
+    
     def get_unplaced_students(self) -> List[Student]:
         """Get list of unplaced students"""
-        return [s for s in self.students.values() if s.status == 'Unplaced']
+        return self.student_table.views(self.student_table.unplaced_rows())
     
     def get_companies_for_day(self, day: int, serial: int) -> List[Company]:
         """Get companies for a specific day and serial number"""
-        if serial not in self.company_order:
-            return []
-        
-        company_names = self.company_order[serial]
-        day_companies = []
-        
-        for c in self.companies.values():
-            if c.visit_day == day:
-                # Check if company name matches (partial matching)
-                for order_name in company_names:
-                    if order_name.lower() in c.company_name.lower() or c.company_name.lower() in order_name.lower():
-                        day_companies.append(c)
-                        break
-        
-        return day_companies
+        return [self.company_table.view(j) for j in self.schedule.companies_for(day, serial)]
     
     def step1_initialization(self, day: int, serial: int):
-        """Step 1: Initialize for the day/serial"""
-        print(f"\n{'='*80}")
-        print(f"DAY {day} - SERIAL {serial}")
-        print(f"{'='*80}")
+        """Step 1: Initialize for the day/serial; returns the companies and unplaced student rows"""
+        log = self.log
+        log.info("\n%s\nDAY %d - SERIAL %s\n%s", RULE, day, serial, RULE)
         
         companies = self.get_companies_for_day(day, serial)
-        unplaced_students = self.get_unplaced_students()
+        unplaced_rows = self.student_table.unplaced_rows()
         
-        print(f"\nCompanies visiting: {len(companies)}")
+        log.info("\nCompanies visiting: %d", len(companies))
         for c in companies:
-            print(f"  - {c.company_name} ({c.job_role}) - Slots: {c.interview_slots}")
-        print(f"\nUnplaced students: {len(unplaced_students)}")
+            log.info("  - %s (%s) - Slots: %d", c.company_name, c.job_role, c.interview_slots)
+        log.info("\nUnplaced students: %d", len(unplaced_rows))
         
-        return companies, unplaced_students
+        return companies, unplaced_rows
     
-    def step2_application(self, companies: List[Company], unplaced_students: List[Student]):
+    def step2_application(self, companies: List[Company], unplaced_rows: np.ndarray):
         """Step 2: Students apply to eligible companies"""
-        print(f"\n[STEP 2] Application Phase")
-        print("-" * 80)
+        log = self.log
+        log.info("\n[STEP 2] Application Phase\n%s", '-' * 80)
+        
+        candidates = np.zeros(len(self.student_table), dtype=bool)
+        candidates[unplaced_rows] = True
         
+        self.student_table.applications = []
         for company in companies:
-            company.applicants = []
+            start = time.perf_counter()
+            # Eligible = department, CGPA and domain checks (precomputed matrix slice)
+            rows = np.flatnonzero(self.eligibility.matrix[:, company.row] & candidates)
+            self.company_table.applicants[company.row] = rows
+            self.student_table.applications.append((company.get_unique_id(), rows))
+            self._add_company_time(company, 'step2_application', time.perf_counter() - start)
             
-            for student in unplaced_students:
-                # Check eligibility
-                dept_eligible = is_department_eligible(student.department, company.allowed_departments)
-                cgpa_eligible = is_cgpa_eligible(student.cgpa, company.min_cgpa)
-                domain_match = is_domain_match(student.domains, company.job_role)
-                
-                if dept_eligible and cgpa_eligible and domain_match:
-                    company.applicants.append(student)
-                    student.current_applications.append(company.get_unique_id())
-            
-            print(f"  {company.company_name} ({company.job_role}): {len(company.applicants)} applicants")
+            log.info("  %s (%s): %d applicants", company.company_name, company.job_role, len(rows))
+        self.stats['counters']['eligibility_checks'] += len(unplaced_rows) * len(companies)
     
     def step3_test_invitation(self, companies: List[Company]):
         """Step 3: All eligible students are invited for test (no pre-screening needed)"""
-        print(f"\n[STEP 3] Test Invitation Phase (All eligible students invited)")
-        print("-" * 80)
+        log = self.log
+        log.info("\n[STEP 3] Test Invitation Phase (All eligible students invited)\n%s", '-' * 80)
         
         for company in companies:
             # All applicants are invited to test (as per clarification)
-            company.test_invited = company.applicants.copy()
-            print(f"  {company.company_name}: {len(company.test_invited)} students invited for test")
+            rows = self.company_table.applicants[company.row].copy()
+            self.company_table.test_invited[company.row] = rows
+            log.info("  %s: %d students invited for test", company.company_name, len(rows))
     
     def step4_interview_shortlist(self, companies: List[Company]):
         """Step 4: Shortlist students for interview based on test performance"""
-        print(f"\n[STEP 4] Interview Shortlisting Phase (Post-Test)")
-        print("-" * 80)
+        log = self.log
+        log.info("\n[STEP 4] Interview Shortlisting Phase (Post-Test)\n%s", '-' * 80)
+        
+        table = self.company_table
+        counters = self.stats['counters']
+        cache_hits, cache_misses = self.skill_match.cache_hits, self.skill_match.cache_misses
+        
+        # Draw R1 for every (company, test-invited student) pair in one call
+        R1_all = self._uniform_draws('R1', companies, table.test_invited, 1, 10)
+        offset = 0
         
         for company in companies:
-            # Calculate profile scores for all test-invited students
-            student_scores = []
-            
-            for student in company.test_invited:
-                profile_score = calculate_profile_score(student, company)
-                student_scores.append((student, profile_score))
+            start = time.perf_counter()
+            rows = table.test_invited[company.row]
+            R1 = R1_all[offset:offset + len(rows)]
+            offset += len(rows)
             
-            # Sort by profile score (descending)
-            student_scores.sort(key=lambda x: x[1], reverse=True)
+            # Calculate profile scores for all test-invited students
+            cgpa = self.student_table.cgpa[rows].astype(np.float64)
+            skill_scores = self.skill_match.scores_for_rows(company.row, rows)
+            profile_scores = calculate_profile_scores(cgpa, skill_scores, self.dep_scores[rows], R1, self.config)
             
-            # Shortlist top N students where N = interview_slots
-            shortlist_count = min(company.interview_slots, len(student_scores))
-            company.shortlisted = [s[0] for s in student_scores[:shortlist_count]]
+            # Shortlist top N students by profile score where N = interview_slots
+            top = top_k_indices(profile_scores, company.interview_slots)
+            table.shortlisted[company.row] = rows[top]
             
             # Store profile scores for later use
-            company.profile_scores = {s[0].roll_no: s[1] for s in student_scores[:shortlist_count]}
+            table.profile_scores[company.row] = profile_scores[top]
+            counters['skill_match_evaluations'] += len(rows)
+            self._add_company_time(company, 'step4_interview_shortlist', time.perf_counter() - start)
             
-            print(f"  {company.company_name}: {len(company.shortlisted)} students shortlisted for interview")
+            log.info("  %s: %d students shortlisted for interview", company.company_name, len(top))
+        
+        counters['skill_cache_hits'] += self.skill_match.cache_hits - cache_hits
+        counters['skill_cache_misses'] += self.skill_match.cache_misses - cache_misses
     
     def step5_interview_hiring(self, companies: List[Company]):
         """Step 5: Conduct interviews and make offers"""
-        print(f"\n[STEP 5] Interview & Hiring Phase")
-        print("-" * 80)
+        log = self.log
+        log.info("\n[STEP 5] Interview & Hiring Phase\n%s", '-' * 80)
+        config = self.config
+        deferred = config.acceptance_mode == 'deferred'
         
-        for company in companies:
-            # Calculate interview scores
-            interview_scores = []
-            for student in company.shortlisted:
-                profile_score = company.profile_scores.get(student.roll_no, 0)
-                interview_score = calculate_interview_score(student, company, profile_score)
-                interview_scores.append((student, interview_score))
+        table = self.company_table
+        
+        # Draw R2 for every shortlisted student and the openings of every company in one call each
+        R2_all = self._uniform_draws('R2', companies, table.shortlisted, 0, 10)
+        if self.crn is not None:
+            low = np.array([c.min_hires for c in companies], dtype=np.int64)
+            span = np.array([c.max_hires for c in companies], dtype=np.int64) - low + 1
+            u = np.array([self.crn.uniforms('openings', (c.row,), 1)[0] for c in companies])
+            openings_all = low + (u * span).astype(np.int64)
+        else:
+            openings_all = self.rng.integers([c.min_hires for c in companies],
+                                             [c.max_hires for c in companies], endpoint=True) \
+                if companies else np.zeros(0, dtype=np.int64)
+        self.stats['counters']['rng_draws'] += len(companies)
+        offset = 0
+        
+        for company, openings in zip(companies, openings_all.tolist()):
+            start = time.perf_counter()
+            rows = table.shortlisted[company.row]
+            R2 = R2_all[offset:offset + len(rows)]
+            offset += len(rows)
             
-            # Sort by interview score (descending)
-            interview_scores.sort(key=lambda x: x[1], reverse=True)
+            # Calculate interview scores
+            cgpa = self.student_table.cgpa[rows].astype(np.float64)
+            interview_scores = calculate_interview_scores(table.profile_scores[company.row], cgpa, R2, self.config)
             
-            num_candidates = len(interview_scores)
+            num_candidates = len(rows)
             
             # CRITICAL FIX: Determine actual openings first
-            if num_candidates >= company.min_hires:
-                # Have enough candidates - determine openings (random between min and max)
-                actual_openings = random.randint(company.min_hires, company.max_hires)
+            if num_candidates >= company.min_hires or not config.enforce_min_hires:
+                # Have enough candidates (or no minimum enforced) - openings drawn between min and max
+                actual_openings = openings
                 
                 # OVER-OFFER to ensure we meet minimum after students choose other companies
-                # Offer to 1.5x the target to account for students who will reject
-                buffered_offers = min(int(actual_openings * 1.5), num_candidates)
-                offer_count = max(buffered_offers, company.min_hires)  # Never less than min
+                # Offer to over_offer_multiplier x the target to account for students who will reject
+                buffered_offers = min(int(actual_openings * config.over_offer_multiplier), num_candidates)
+                offer_count = max(buffered_offers, company.min_hires) if config.enforce_min_hires \
+                    else buffered_offers  # Never less than min
             else:
                 # Not enough candidates to meet minimum requirement
                 offer_count = num_candidates
                 actual_openings = company.min_hires  # Show what we needed
                 if num_candidates > 0:
-                    print(f"  ⚠️  WARNING: {company.company_name} couldn't meet min_hires ({company.min_hires}), only {num_candidates} candidates available!")
+                    log.warning("  ⚠️  WARNING: %s couldn't meet min_hires (%d), only %d candidates available!",
+                                company.company_name, company.min_hires, num_candidates)
                 else:
-                    print(f"  ⚠️  WARNING: {company.company_name} has 0 candidates (min_hires: {company.min_hires})!")
+                    log.warning("  ⚠️  WARNING: %s has 0 candidates (min_hires: %d)!",
+                                company.company_name, company.min_hires)
+            
+            if deferred:
+                # No over-offer: the whole shortlist is ranked and step 6 fills exactly the openings
+                ranked = rows[top_k_indices(interview_scores, num_candidates)]
+                table.offered[company.row] = ranked
+                table.target_hires[company.row] = min(actual_openings, num_candidates)
+                self._add_company_time(company, 'step5_interview_hiring', time.perf_counter() - start)
+                log.info("  %s: %d candidates ranked for %d openings (min_required: %d)",
+                         company.company_name, num_candidates, table.target_hires[company.row], company.min_hires)
+                continue
             
-            company.offered = [s[0] for s in interview_scores[:offer_count]]
-            company.target_hires = actual_openings  # Store target for tracking
+            # Offer to the top candidates by interview score
+            offered = rows[top_k_indices(interview_scores, offer_count)]
+            table.offered[company.row] = offered
+            table.target_hires[company.row] = actual_openings  # Store target for tracking
             
             # Update student status to Offered
-            for student in company.offered:
-                student.status = 'Offered'
+            self.student_table.set_status(offered, STATUS_OFFERED)
+            self._add_company_time(company, 'step5_interview_hiring', time.perf_counter() - start)
             
-            print(f"  {company.company_name}: {offer_count} offers made (target: {actual_openings}, min_required: {company.min_hires})")
+            log.info("  %s: %d offers made (target: %d, min_required: %d)",
+                     company.company_name, offer_count, actual_openings, company.min_hires)
     
     def step6_offer_acceptance(self, companies: List[Company]):
         """Step 6: Students accept offers and opt-out check"""
-        print(f"\n[STEP 6] Offer Acceptance & Day End")
-        print("-" * 80)
+        log = self.log
+        log.info("\n[STEP 6] Offer Acceptance & Day End\n%s", '-' * 80)
+        log_acceptances = log.isEnabledFor(logging.DEBUG)
+        
+        students = self.student_table
+        table = self.company_table
+        serial_key = (self.current_day, companies[0].row)
         
         # Collect all offers for students who got multiple offers
+        # (deferred acceptance places students directly, nobody holds an offer)
         student_offers = {}
-        for company in companies:
-            for student in company.offered:
-                if student.roll_no not in student_offers:
-                    student_offers[student.roll_no] = []
-                student_offers[student.roll_no].append(company)
+        if self.config.acceptance_mode == 'deferred':
+            hired = self._deferred_acceptance(companies)
+            choice_draws = np.zeros(0)
+        else:
+            hired = {company.row: [] for company in companies}
+            for company in companies:
+                for row in table.offered[company.row].tolist():
+                    if row not in student_offers:
+                        student_offers[row] = []
+                    student_offers[row].append(company)
+        
+            # One uniform draw per student with offers picks among their offers
+            if self.crn is not None:
+                offered_rows = np.fromiter(student_offers.keys(), dtype=np.intp, count=len(student_offers))
+                choice_draws = self.crn.uniforms('choice', serial_key)[offered_rows]
+            else:
+                choice_draws = self.rng.random(len(student_offers))
+            self.stats['counters']['rng_draws'] += len(student_offers)
         
         # Process offers
-        for roll_no, offers in student_offers.items():
-            student = self.students[roll_no]
-            
+        for (row, offers), u in zip(student_offers.items(), choice_draws.tolist()):
             # If student already placed (from earlier in same serial), skip
-            if student.status == 'Placed':
+            if students.status[row] == STATUS_PLACED:
                 continue
             
             # Randomly select one offer if multiple
-            selected_company = random.choice(offers)
+            selected_company = offers[int(u * len(offers))]
             
             # Accept offer
-            student.status = 'Placed'
-            student.placed_company = selected_company.get_unique_id()
-            selected_company.hired.append(student)
+            students.set_status(row, STATUS_PLACED)
+            students.placed_company[row] = students.company_code(selected_company.get_unique_id())
+            hired[selected_company.row].append(row)
             
-            print(f"  {student.roll_no} accepted offer from {selected_company.company_name}")
+            if log_acceptances:
+                log.debug("  %s accepted offer from %s", students.roll_no[row], selected_company.company_name)
+        
+        for company in companies:
+            table.hired[company.row] = np.concatenate([table.hired[company.row],
+                                                       np.array(hired[company.row], dtype=np.intp)])
         
         # Update statistics
-        total_placed = sum(len(c.hired) for c in companies)
-        print(f"\nTotal placements in this batch: {total_placed}")
+        total_placed = sum(len(table.hired[c.row]) for c in companies)
+        log.info("\nTotal placements in this batch: %d", total_placed)
         
         # Reset statuses for non-placed students
-        unplaced_count = 0
-        opted_out_count = 0
+        offered_rows = np.fromiter(student_offers.keys(), dtype=np.intp, count=len(student_offers))
+        students.set_status(offered_rows[students.status[offered_rows] == STATUS_OFFERED], STATUS_UNPLACED)
         
-        for student in self.students.values():
-            if student.status == 'Offered' and student not in [s for c in companies for s in c.hired]:
-                student.status = 'Unplaced'
-            
-            if student.status == 'Unplaced':
-                # Opt-out check
-                if random.random() < P_OPT_OUT:
-                    student.status = 'Opted_Out'
-                    opted_out_count += 1
-                else:
-                    unplaced_count += 1
-                    
-                # Clear current applications
-                student.current_applications = []
+        # Applications are only kept for students placed in this serial
+        placed_rows = [row for rows in hired.values() for row in rows]
+        students.clear_applications(placed_rows)
         
-        print(f"Remaining unplaced students: {unplaced_count}")
-        print(f"Students opted out: {opted_out_count}")
+        # Opt-out check for everyone still unplaced (one Bernoulli draw each)
+        remaining = students.unplaced_rows()
+        if self.crn is not None:
+            opt_out = self.crn.uniforms('opt_out', serial_key)[remaining] < self.config.p_opt_out
+        else:
+            opt_out = self.rng.random(len(remaining)) < self.config.p_opt_out
+        self.stats['counters']['rng_draws'] += len(remaining)
+        students.set_status(remaining[opt_out], STATUS_OPTED_OUT)
+        
+        opted_out_count = int(opt_out.sum())
+        unplaced_count = len(remaining) - opted_out_count
+        
+        log.info("Remaining unplaced students: %d", unplaced_count)
+        log.info("Students opted out: %d", opted_out_count)
         
         self.stats['unplaced_students'] = unplaced_count
         self.stats['opted_out_students'] += opted_out_count
@@ -240,42 +510,200 @@ class PlacementSimulation:
         # Update company-wise statistics
         for company in companies:
             company_id = company.get_unique_id()
-            self.stats['company_wise_hires'][company_id] = len(company.hired)
+            self.stats['company_wise_hires'][company_id] = len(table.hired[company.row])
     
     def simulate_day(self, day: int):
         """Simulate one complete day"""
-        print(f"\n{'#'*80}")
-        print(f"# SIMULATING DAY {day}")
-        print(f"{'#'*80}")
+        log = self.log
+        log.info("\n%s\n# SIMULATING DAY %d\n%s", DAY_RULE, day, DAY_RULE)
+        
+        self.current_day = day
+        day_start = time.perf_counter()
+        day_times = dict.fromkeys(STEP_NAMES, 0.0)
         
         # Process each serial number in order
-        for serial in sorted(self.company_order.keys()):
-            companies, unplaced_students = self.step1_initialization(day, serial)
+        for serial in self.schedule.serials:
+            step_times = {}
+            companies, unplaced_rows = self._run_step(step_times, 'step1_initialization', day, serial)
             
             if not companies:
-                print(f"\nNo companies for serial {serial}")
+                log.info("\nNo companies for serial %s", serial)
                 continue
             
-            if not unplaced_students:
-                print(f"\nNo unplaced students remaining!")
+            if not len(unplaced_rows):
+                log.info("\nNo unplaced students remaining!")
                 break
             
-            self.step2_application(companies, unplaced_students)
-            self.step3_test_invitation(companies)
-            self.step4_interview_shortlist(companies)
-            self.step5_interview_hiring(companies)
-            self.step6_offer_acceptance(companies)
+            self._run_step(step_times, 'step2_application', companies, unplaced_rows)
+            for step in STEP_NAMES[2:]:
+                self._run_step(step_times, step, companies)
+            
+            self.stats['timings']['serials'].append(dict(day=day, serial=serial, **step_times))
+            for step, seconds in step_times.items():
+                day_times[step] += seconds
+            
+            if self.summary_sink is not None:
+                self.summary_sink.write(dict(self.serial_summary(day, serial, companies), step_times=step_times))
         
         # Day summary
-        placed_students = [s for s in self.students.values() if s.status == 'Placed']
-        self.stats['day_wise_placements'][day] = len(placed_students)
+        placed_count = self.student_table.count(STATUS_PLACED)
+        self.stats['day_wise_placements'][day] = placed_count
+        day_times['total'] = time.perf_counter() - day_start
+        self.stats['timings']['days'][day] = day_times
+        
+        log.info("\n%s\nDAY %d SUMMARY\n%s", RULE, day, RULE)
+        log.info("Total placed students: %d", placed_count)
+        log.info("Unplaced students: %d", self.stats['unplaced_students'])
+        log.info("Opted out students: %d", self.stats['opted_out_students'])
+        
+        if self.summary_sink is not None:
+            self.summary_sink.write({
+                'event': 'day_summary', 'seed': seed_label(self.seed), 'day': day,
+                'placed': placed_count,
+                'unplaced': self.stats['unplaced_students'],
+                'opted_out': self.stats['opted_out_students'],
+                'step_times': day_times,
+                'counters': dict(self.stats['counters']),
+            })
+    
+    def serial_summary(self, day: int, serial, companies: List[Company]) -> Dict:
+        """Structured record of one day/serial: funnel sizes per company and student totals"""
+        table = self.company_table
+        return {
+            'event': 'serial_summary', 'seed': seed_label(self.seed), 'day': day, 'serial': serial,
+            'companies': [{
+                'company_id': c.get_unique_id(),
+                'applicants': len(table.applicants[c.row]),
+                'test_invited': len(table.test_invited[c.row]),
+                'shortlisted': len(table.shortlisted[c.row]),
+                'offered': len(table.offered[c.row]),
+                'target_hires': int(table.target_hires[c.row]),
+                'hired': len(table.hired[c.row]),
+            } for c in companies],
+            'placed': self.student_table.count(STATUS_PLACED),
+            'unplaced': self.stats['unplaced_students'],
+            'opted_out': self.stats['opted_out_students'],
+        }
+    
+    def _deferred_acceptance(self, companies: List[Company]) -> Dict[int, List[int]]:
+        """
+        Resolve the serial by student-proposing deferred acceptance: companies rank their
+        shortlist by interview score (table.offered, best first) and fill exactly
+        target_hires places; students rank companies by one random utility draw per
+        (student, company) pair. Placed students' offers are the only offers made.
+        """
+        students = self.student_table
+        table = self.company_table
+        candidates = [table.offered[c.row] for c in companies]
+        
+        if self.crn is not None:
+            preferences = [self.crn.uniforms('preference', (c.row,))[rows] for c, rows in zip(companies, candidates)]
+        else:
+            draws = self.rng.random(sum(len(rows) for rows in candidates))
+            preferences = np.split(draws, np.cumsum([len(rows) for rows in candidates])[:-1])
+        self.stats['counters']['rng_draws'] += sum(len(rows) for rows in candidates)
+        
+        accepted = deferred_acceptance(candidates, [table.target_hires[c.row] for c in companies], preferences)
+        
+        hired = {}
+        log_acceptances = self.log.isEnabledFor(logging.DEBUG)
+        for company, rows in zip(companies, accepted):
+            students.set_status(rows, STATUS_PLACED)
+            students.placed_company[rows] = students.company_code(company.get_unique_id())
+            table.offered[company.row] = rows
+            hired[company.row] = rows.tolist()
+            if log_acceptances:
+                for row in hired[company.row]:
+                    self.log.debug("  %s accepted offer from %s", students.roll_no[row], company.company_name)
+        return hired
+    
+    def season_days(self) -> List[int]:
+        """All arrival days present in the company list"""
+        return sorted(set(self.company_table.visit_day.tolist()))
+    
+    def simulate_season(self, days: List[int] = None, checkpoint_dir: str = None, resume_from=None) -> Dict[int, Dict]:
+        """
+        Simulate every arrival day in order, checkpointing at each day boundary.
+        resume_from (a checkpoint or a path to one) restores the state at the end of
+        that day and continues with the following days. Returns the checkpoints by day.
+        """
+        if days is None:
+            days = self.season_days()
+        
+        if resume_from is not None:
+            self.restore_checkpoint(resume_from)
+            days = [d for d in days if d > self.current_day]
+        
+        checkpoints = {}
+        for day in days:
+            self.simulate_day(day)
+            checkpoints[day] = self.checkpoint()
+            if checkpoint_dir is not None:
+                self.save_checkpoint(Path(checkpoint_dir) / f"day{day}_checkpoint.npz", checkpoints[day])
         
-        print(f"\n{'='*80}")
-        print(f"DAY {day} SUMMARY")
-        print(f"{'='*80}")
-        print(f"Total placed students: {len(placed_students)}")
-        print(f"Unplaced students: {self.stats['unplaced_students']}")
-        print(f"Opted out students: {self.stats['opted_out_students']}")
+        return checkpoints
+    
+    def checkpoint(self) -> Dict:
+        """Compact snapshot of student status, company hires, statistics and RNG state"""
+        students = self.student_table
+        hired_ids = [cid for cid in self.companies if len(self.company_table.hired[self.companies[cid].row])]
+        hired_rows = [self.company_table.hired[self.companies[cid].row] for cid in hired_ids]
+        
+        return {
+            'day': np.int16(self.current_day),
+            'roll_no': np.array(students.roll_no),
+            'status': students.status.copy(),
+            'placed_company': students.placed_company.copy(),
+            'company_ids': np.array(students.company_ids, dtype=str),
+            'hired_company_ids': np.array(hired_ids, dtype=str),
+            'hired_offsets': np.cumsum([0] + [len(r) for r in hired_rows]).astype(np.int32),
+            'hired_rows': np.concatenate(hired_rows).astype(np.int32) if hired_rows else np.zeros(0, dtype=np.int32),
+            'stats_json': np.array(json.dumps(self.stats)),
+            'rng_state_json': np.array(json.dumps(self.rng.bit_generator.state)),
+        }
+    
+    def save_checkpoint(self, path, checkpoint: Dict = None):
+        """Write a checkpoint to an .npz file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, **(checkpoint if checkpoint is not None else self.checkpoint()))
+        self.log.info("\nCheckpoint saved to: %s", path)
+    
+    def restore_checkpoint(self, checkpoint):
+        """Restore the state saved by checkpoint() (a dict or an .npz path)"""
+        if not isinstance(checkpoint, dict):
+            with np.load(checkpoint, allow_pickle=False) as data:
+                checkpoint = {key: data[key] for key in data.files}
+        
+        students = self.student_table
+        if checkpoint['roll_no'].tolist() != students.roll_no:
+            raise ValueError("Checkpoint was taken for a different student cohort")
+        
+        # Student state
+        company_codes = np.array([students.company_code(cid) for cid in checkpoint['company_ids'].tolist()] + [-1],
+                                 dtype=np.int32)
+        students.status[:] = checkpoint['status']
+        students.unplaced_mask = students.status == STATUS_UNPLACED
+        students.placed_company[:] = company_codes[checkpoint['placed_company']]
+        students.applications = []
+        students.kept_applications = {}
+        
+        # Company hires (companies not in this simulation are skipped)
+        offsets = checkpoint['hired_offsets']
+        for k, company_id in enumerate(checkpoint['hired_company_ids'].tolist()):
+            if company_id in self.companies:
+                rows = checkpoint['hired_rows'][offsets[k]:offsets[k + 1]].astype(np.intp)
+                self.company_table.hired[self.companies[company_id].row] = rows
+        
+        stats = json.loads(str(checkpoint['stats_json']))
+        stats['day_wise_placements'] = {int(d): n for d, n in stats['day_wise_placements'].items()}
+        # Checkpoints written before timings and counters were recorded start them empty
+        stats.setdefault('timings', empty_timings())
+        stats['timings']['days'] = {int(d): t for d, t in stats['timings']['days'].items()}
+        stats['counters'] = dict(dict.fromkeys(COUNTER_NAMES, 0), **stats.get('counters', {}))
+        self.stats = stats
+        self.rng.bit_generator.state = json.loads(str(checkpoint['rng_state_json']))
+        self.current_day = int(checkpoint['day'])
     
     def print_final_statistics(self):
         """Print final simulation statistics"""
@@ -283,38 +711,185 @@ class PlacementSimulation:
         print(f"# FINAL SIMULATION STATISTICS")
         print(f"{'#'*80}")
         
-        placed_students = [s for s in self.students.values() if s.status == 'Placed']
-        unplaced_students = [s for s in self.students.values() if s.status == 'Unplaced']
-        opted_out_students = [s for s in self.students.values() if s.status == 'Opted_Out']
+        total = len(self.student_table)
+        placed = self.student_table.count(STATUS_PLACED)
+        unplaced = self.student_table.count(STATUS_UNPLACED)
+        opted_out = self.student_table.count(STATUS_OPTED_OUT)
         
         print(f"\nOverall Placement Summary:")
-        print(f"  Total Students: {len(self.students)}")
-        print(f"  Placed: {len(placed_students)} ({len(placed_students)/len(self.students)*100:.1f}%)")
-        print(f"  Unplaced: {len(unplaced_students)} ({len(unplaced_students)/len(self.students)*100:.1f}%)")
-        print(f"  Opted Out: {len(opted_out_students)} ({len(opted_out_students)/len(self.students)*100:.1f}%)")
+        print(f"  Total Students: {total}")
+        print(f"  Placed: {placed} ({placed/total*100:.1f}%)")
+        print(f"  Unplaced: {unplaced} ({unplaced/total*100:.1f}%)")
+        print(f"  Opted Out: {opted_out} ({opted_out/total*100:.1f}%)")
         
         print(f"\nCompany-wise Hiring:")
         for company_id, count in sorted(self.stats['company_wise_hires'].items(), key=lambda x: x[1], reverse=True):
             print(f"  {company_id}: {count} students")
-    
-    def export_results(self, output_file: str):
-        """Export results to CSV"""
-        results = []
-        for student in self.students.values():
-            results.append({
-                'roll_no': student.roll_no,
-                'name': student.name,
-                'department': student.department,
-                'cgpa': student.cgpa,
-                'domain_1': student.domain_1,
-                'domain_2': student.domain_2,
-                'status': student.status,
-                'placed_company': student.placed_company if student.placed_company else 'Not Placed'
-            })
+
+        print(f"\nStep Timings:")
+        for day, times in self.stats['timings']['days'].items():
+            steps = ', '.join(f"{step.split('_', 1)[1]} {seconds * 1000:.1f}ms"
+                              for step, seconds in times.items() if step != 'total')
+            print(f"  Day {day}: {times['total'] * 1000:.1f}ms ({steps})")
+        for company_id, step, seconds in self.slowest(3):
+            print(f"  Slowest: {company_id} in {step} ({seconds * 1000:.1f}ms)")
+        print(f"  Counters: {self.stats['counters']}")
+
+    def results_frame(self) -> 'pd.DataFrame':
+        """Per-student results as a DataFrame (built from the columnar tables)"""
+        import pandas as pd
+        table = self.student_table
+        company_ids = np.array(table.company_ids + ['Not Placed'], dtype=object)
+        domains = np.array(table.domain_names + [None], dtype=object)
         
-        df = pd.DataFrame(results)
+        return pd.DataFrame({
+            'roll_no': table.roll_no,
+            'name': table.name,
+            'department': np.array(table.dept_names, dtype=object)[table.dept_code],
+            'cgpa': table.cgpa_values(),
+            'domain_1': domains[table.domain_codes[:, 0]],
+            'domain_2': domains[table.domain_codes[:, 1]],
+            'status': np.array(STATUS_NAMES, dtype=object)[table.status],
+            'placed_company': company_ids[table.placed_company]
+        })
+    
+    def export_results(self, output_file: str, stats_file: str = None):
+        """Export results to CSV (and stats, with step timings and counters, to JSON if stats_file is given)"""
+        df = self.results_frame()
         df.to_csv(output_file, index=False)
         print(f"\nResults exported to: {output_file}")
+        if stats_file is not None:
+            with open(stats_file, 'w') as f:
+                json.dump(self.stats, f, indent=2)
+            print(f"Statistics exported to: {stats_file}")
+    
+    def slowest(self, n: int = 5) -> List[Tuple[str, str, float]]:
+        """The n (company ID, step, seconds) entries of stats['timings']['companies'] with the most time"""
+        entries = [(company_id, step, seconds)
+                   for company_id, times in self.stats['timings']['companies'].items()
+                   for step, seconds in times.items()]
+        return sorted(entries, key=lambda entry: entry[2], reverse=True)[:n]
+
+
+SCENARIO_SNAPSHOT_VERSION = 1
+
+
+class Scenario:
+    """
+    Parsed, seed-independent simulation inputs shared by many runs.
+    Holds the student/company tables, company order, schedule and the eligibility
+    and skill-match matrices; new_simulation() only copies the mutable state.
+    """
+    
+    def __init__(self, students: List[Student], companies: List[Company], company_order: Dict[int, List[str]],
+                 dep_scores: Dict[str, float] = None):
+        self.dep_scores = default_dep_scores() if dep_scores is None else dep_scores
+        template = PlacementSimulation(students, companies, company_order, logger=SILENT_LOGGER,
+                                       dep_scores=self.dep_scores)
+        self.student_table = template.student_table
+        self.company_table = template.company_table
+        self.company_order = company_order
+        self.schedule = template.schedule
+        self.eligibility = template.eligibility
+        self.skill_match = template.skill_match
+        self.snapshot_path = None
+    
+    @classmethod
+    def load(cls, data_dir, cache_dir=None, use_cache: bool = True) -> 'Scenario':
+        """Load a scenario from a dataset directory (analysis_data.csv, companies.csv, ...)"""
+        return cls(*load_dataset(data_dir, cache_dir=cache_dir, use_cache=use_cache))
+    
+    @classmethod
+    def compile(cls, data_dir, path) -> 'Scenario':
+        """Load a dataset directory and write it to a snapshot file (see save)"""
+        scenario = cls.load(data_dir)
+        scenario.save(path, fingerprint=dataset_fingerprint(data_dir))
+        return scenario
+    
+    def save(self, path, fingerprint: str = ''):
+        """
+        Write the encoded tables, eligibility and skill-match arrays, company order
+        and department scores to one snapshot file (see open).
+        """
+        students, companies, skill_match = self.student_table, self.company_table, self.skill_match
+        arrays = {f'students.{key}': getattr(students, key)
+                  for key in ('cgpa', 'dept_code', 'domain_codes', 'skill_set_code')}
+        arrays.update({f'companies.{key}': getattr(companies, key)
+                       for key in ('min_cgpa', 'visit_day', 'min_hires', 'max_hires', 'interview_slots')})
+        layers = skill_match.company_layers
+        arrays.update({
+            'eligibility.matrix': self.eligibility.matrix,
+            'skill_match.profile_bits': skill_match.profile_bits,
+            'skill_match.student_profile_row': skill_match.student_profile_row,
+            'skill_match.required_counts': skill_match.required_counts,
+            'skill_match.layers': np.concatenate(layers) if layers else
+                np.zeros((0, skill_match.profile_bits.shape[1]), dtype=np.uint64),
+            'skill_match.layer_offsets': np.cumsum([0] + [len(layer) for layer in layers]),
+        })
+        meta = {
+            'version': SCENARIO_SNAPSHOT_VERSION,
+            'fingerprint': fingerprint,
+            'students': {key: getattr(students, key) for key in ('roll_no', 'name', 'dept_names', 'domain_names')},
+            'skill_sets': [sorted(skills) for skills in students.skill_sets],
+            'companies': {key: getattr(companies, key)
+                          for key in ('company_name', 'job_role', 'allowed_departments', 'required_skills')},
+            'company_order': [[serial, names] for serial, names in self.company_order.items()],
+            'dep_scores': {code: float(score) for code, score in self.dep_scores.items()},
+        }
+        write_snapshot(path, arrays, meta)
+    
+    @classmethod
+    def open(cls, path, data_dir=None) -> 'Scenario':
+        """
+        Attach to a snapshot written by save/compile. Its arrays are read-only memory
+        maps, so processes opening the same file share them. With data_dir, a
+        snapshot compiled from different data raises ValueError.
+        """
+        arrays, meta = read_snapshot(path)
+        if meta.get('version') != SCENARIO_SNAPSHOT_VERSION:
+            raise ValueError(f"{path} has snapshot version {meta.get('version')}, "
+                             f"expected {SCENARIO_SNAPSHOT_VERSION}; compile the scenario again")
+        if data_dir is not None and meta['fingerprint'] != dataset_fingerprint(data_dir):
+            raise ValueError(f"{path} is out of date with {data_dir}; compile the scenario again")
+        
+        scenario = cls.__new__(cls)
+        scenario.dep_scores = meta['dep_scores']
+        scenario.company_order = {int(serial): names for serial, names in meta['company_order']}
+        scenario.student_table = StudentTable.from_static(dict(
+            meta['students'], skill_sets=meta['skill_sets'],
+            **{key: arrays[f'students.{key}'] for key in ('cgpa', 'dept_code', 'domain_codes', 'skill_set_code')}))
+        scenario.company_table = CompanyTable.from_static(dict(
+            meta['companies'], **{key: arrays[f'companies.{key}'] for key in
+                                  ('min_cgpa', 'visit_day', 'min_hires', 'max_hires', 'interview_slots')}))
+        scenario.company_table.student_table = scenario.student_table
+        
+        companies = scenario.company_table.views()
+        company_ids = [c.get_unique_id() for c in companies]
+        scenario.schedule = CompanySchedule(scenario.company_order, companies)
+        scenario.eligibility = EligibilityMatrix.from_matrix(scenario.student_table.roll_no, company_ids,
+                                                             arrays['eligibility.matrix'])
+        offsets = arrays['skill_match.layer_offsets'].tolist()
+        layers = arrays['skill_match.layers']
+        scenario.skill_match = SkillMatchMatrix.from_arrays(
+            scenario.student_table.roll_no, company_ids, scenario.company_table.skill_profile.tolist(),
+            arrays['skill_match.profile_bits'], arrays['skill_match.student_profile_row'],
+            [layers[a:b] for a, b in zip(offsets[:-1], offsets[1:])], arrays['skill_match.required_counts'])
+        scenario.snapshot_path = str(path)
+        return scenario
+    
+    def __reduce_ex__(self, protocol):
+        # Snapshot-backed scenarios are sent to worker processes as their path
+        if self.snapshot_path is not None:
+            return Scenario.open, (self.snapshot_path,)
+        return super().__reduce_ex__(protocol)
+    
+    def new_simulation(self, seed=None, crn: CommonRandomNumbers = None,
+                       logger: logging.Logger = None, config: SimulationConfig = None) -> PlacementSimulation:
+        """Fresh simulation over this scenario"""
+        return PlacementSimulation(self.student_table.copy(), self.company_table.copy(), self.company_order,
+                                   seed=seed, schedule=self.schedule, eligibility=self.eligibility,
+                                   skill_match=self.skill_match, crn=crn, logger=logger, config=config,
+                                   dep_scores=self.dep_scores)
 
 
 # ============================================================================
@@ -322,8 +897,18 @@ class PlacementSimulation:
 # ============================================================================
 
 if __name__ == "__main__":
+    full_season = '--season' in sys.argv
+    # --deferred: resolve offers by deferred acceptance instead of over-offer + random choice
+    config = DEFAULT_CONFIG.replace(acceptance_mode='deferred') if '--deferred' in sys.argv else DEFAULT_CONFIG
+    seed = int(sys.argv[sys.argv.index('--seed') + 1]) if '--seed' in sys.argv else None
+    initialize(seed)
+    
+    # --quiet: warnings only; --verbose: also one line per accepted offer
+    configure_logging(logging.WARNING if '--quiet' in sys.argv else
+                      logging.DEBUG if '--verbose' in sys.argv else logging.INFO)
+    
     print("="*80)
-    print("PLACEMENT SIMULATION - DAY 1")
+    print("PLACEMENT SIMULATION - FULL SEASON" if full_season else "PLACEMENT SIMULATION - DAY 1")
     print("="*80)
     
     # File paths
@@ -339,29 +924,44 @@ if __name__ == "__main__":
     print(f"  Loaded {len(students)} students")
     
     print("\n[2/3] Loading companies...")
-    companies = load_companies(companies_file, shortlist_dir)
-    print(f"  Loaded {len(companies)} companies")
+    shortlists = load_shortlist_store(shortlist_dir)
+    companies = load_companies(companies_file, shortlists)
+    print(f"  Loaded {len(companies)} companies ({len(shortlists)} shortlists)")
+    for warning in shortlists.report(companies, students):
+        print(f"  Warning: {warning}")
     
     print("\n[3/3] Loading company order...")
     company_order = load_company_order(company_order_file)
     print(f"  Loaded {len(company_order)} serial batches")
+    for warning in CompanySchedule(company_order, companies).report(include_unscheduled=False):
+        print(f"  Warning: {warning}")
     
     # Initialize simulation
     print("\n" + "="*80)
     print("INITIALIZING SIMULATION")
     print("="*80)
     
-    simulation = PlacementSimulation(students, companies, company_order)
+    summary_sink = JsonLinesSink(base_dir / "simulation_summaries.jsonl") if '--summaries' in sys.argv else None
+    simulation = PlacementSimulation(students, companies, company_order, seed=seed, summary_sink=summary_sink,
+                                     config=config)
     
-    # Run Day 1 simulation
-    simulation.simulate_day(day=1)
+    if full_season:
+        # Run all days, checkpointing at each day boundary
+        simulation.simulate_season(checkpoint_dir=base_dir / "checkpoints")
+        output_file = base_dir / "season_placement_results.csv"
+    else:
+        # Run Day 1 simulation
+        simulation.simulate_day(day=1)
+        output_file = base_dir / "day1_placement_results.csv"
     
     # Print final statistics
     simulation.print_final_statistics()
     
-    # Export results
-    output_file = base_dir / "day1_placement_results.csv"
-    simulation.export_results(output_file)
+    # Export results (statistics with step timings next to them)
+    simulation.export_results(output_file, stats_file=output_file.with_name(output_file.stem + '_stats.json'))
+    if summary_sink is not None:
+        summary_sink.close()
+        print(f"Summaries written to: {summary_sink.path}")
     
     print("\n" + "="*80)
     print("SIMULATION COMPLETE!")
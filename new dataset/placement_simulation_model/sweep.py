@@ -0,0 +1,257 @@
+"""
+Parameter sweeps for the placement simulation.
+Runs a grid or random design over the model parameters x seeds on a process
+pool, sharing one parsed Scenario, and stores every run in one SQLite file
+indexed by (point_id, seed). A point is identified by a hash of its resolved
+config and simulated days, so resuming into an existing store only skips runs
+of exactly the same point and seed.
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+import dataclasses
+import argparse
+import itertools
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Iterable, Sequence, Set
+
+import numpy as np
+
+from run_simulation import Scenario
+from monte_carlo import PARAMETERS, CHOICE_PARAMETERS, SCALAR_METRICS, make_config, run_single
+
+
+# ============================================================================
+# DESIGNS
+# ============================================================================
+
+def grid_design(space: Dict[str, Sequence[float]]) -> List[Dict[str, float]]:
+    """Full factorial design: every combination of the listed values"""
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+
+def random_design(space: Dict[str, Tuple[float, float]], n_points: int, seed: int = 0) -> List[Dict[str, float]]:
+    """n_points parameter sets drawn uniformly from the (low, high) range of each field"""
+    rng = np.random.default_rng(seed)
+    names = list(space)
+    samples = {n: rng.uniform(space[n][0], space[n][1], size=n_points) for n in names}
+    return [{n: float(samples[n][i]) for n in names} for i in range(n_points)]
+
+
+# ============================================================================
+# RESULT STORE
+# ============================================================================
+
+def point_key(params: Dict[str, float], days: Sequence[int]) -> str:
+    """Identity of a design point: hash of the full resolved config and the simulated days"""
+    config = dataclasses.asdict(make_config(params))
+    return hashlib.sha256(json.dumps({'config': config, 'days': list(days)}, sort_keys=True).encode()).hexdigest()
+
+class SweepStore:
+    """SQLite store of sweep results: points, runs and per-company/department hires"""
+
+    def __init__(self, path=':memory:', commit_every: int = 500):
+        self.path = path
+        self.conn = sqlite3.connect(str(path))
+        self.commit_every = commit_every
+        self._pending = 0
+        metrics = ', '.join(f'{m} REAL' for m in SCALAR_METRICS)
+        point_columns = {'point_key': 'TEXT', 'days': 'TEXT'}
+        point_columns.update((p, 'TEXT' if p in CHOICE_PARAMETERS else 'REAL') for p in PARAMETERS)
+        params = ', '.join(f'{name} {kind}' for name, kind in point_columns.items())
+        self.conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS points (point_id INTEGER PRIMARY KEY, {params});
+            CREATE TABLE IF NOT EXISTS runs (point_id INTEGER, seed INTEGER, {metrics},
+                                             PRIMARY KEY (point_id, seed));
+            CREATE TABLE IF NOT EXISTS hires (point_id INTEGER, seed INTEGER, kind TEXT, name TEXT,
+                                              hires INTEGER, PRIMARY KEY (point_id, seed, kind, name));
+            CREATE INDEX IF NOT EXISTS hires_by_name ON hires (kind, name);
+        """)
+        # Stores written by older versions lack newer parameter and key columns (their points
+        # have no point_key, so they never match a new point)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(points)")}
+        for name, kind in point_columns.items():
+            if name not in columns:
+                self.conn.execute(f"ALTER TABLE points ADD COLUMN {name} {kind}")
+        self.conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS points_by_key ON points (point_key)")
+
+    def add_point(self, params: Dict[str, float], days: Sequence[int] = (1,)) -> int:
+        """
+        point_id of a design point, recorded on first use (parameters not set
+        keep their defaults, stored as NULL)
+        """
+        key = point_key(params, days)
+        row = self.conn.execute("SELECT point_id FROM points WHERE point_key = ?", (key,)).fetchone()
+        if row is not None:
+            return row[0]
+        point_id = self.conn.execute("SELECT COALESCE(MAX(point_id) + 1, 0) FROM points").fetchone()[0]
+        names = ['point_id', 'point_key', 'days'] + list(params)
+        self.conn.execute(f"INSERT INTO points ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+                          [point_id, key, ','.join(map(str, days))]
+                          + [v if isinstance(v, str) else float(v) for v in params.values()])
+        return point_id
+
+    def add_run(self, point_id: int, run: Dict):
+        """Record one run summary (see monte_carlo.summarize_run)"""
+        seed = run['seed']
+        self.conn.execute(f"INSERT OR REPLACE INTO runs VALUES ({', '.join('?' * (len(SCALAR_METRICS) + 2))})",
+                          [point_id, seed] + [run[m] for m in SCALAR_METRICS])
+        rows = [(point_id, seed, 'company', name, hires) for name, hires in run['company_counts'].items()]
+        rows += [(point_id, seed, 'dept', name, hires) for name, hires in run['dept_counts'].items()]
+        self.conn.executemany("INSERT OR REPLACE INTO hires VALUES (?, ?, ?, ?, ?)", rows)
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    def commit(self):
+        self.conn.commit()
+        self._pending = 0
+
+    def completed(self) -> Set[Tuple[int, int]]:
+        """(point_id, seed) pairs already stored"""
+        return set(self.conn.execute("SELECT point_id, seed FROM runs"))
+
+    def runs_frame(self) -> 'pd.DataFrame':
+        """One row per run with its parameters"""
+        import pandas as pd
+        return pd.read_sql_query("SELECT * FROM runs JOIN points USING (point_id) ORDER BY point_id, seed", self.conn)
+
+    def hires_frame(self, kind: str = 'company') -> 'pd.DataFrame':
+        """Hires per run for kind 'company' or 'dept' (zero-hire entries are not stored)"""
+        import pandas as pd
+        return pd.read_sql_query("SELECT point_id, seed, name, hires FROM hires WHERE kind = ? "
+                                 "ORDER BY point_id, seed, name", self.conn, params=(kind,))
+
+    def point_summary(self) -> 'pd.DataFrame':
+        """Mean and standard deviation of placements per design point"""
+        import pandas as pd
+        runs = self.runs_frame()
+        summary = runs.groupby('point_id').agg(runs=('seed', 'size'),
+                                               placed_mean=('total_placed', 'mean'),
+                                               placed_std=('total_placed', 'std'),
+                                               placement_rate=('placement_rate', 'mean'))
+        points = pd.read_sql_query("SELECT * FROM points", self.conn).set_index('point_id')
+        points = points.drop(columns='point_key').dropna(axis=1, how='all')
+        return points.join(summary)
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+
+# ============================================================================
+# SWEEP RUNNER
+# ============================================================================
+
+_WORKER_SCENARIO = None
+
+
+def _init_worker(scenario: Scenario):
+    """Install the scenario once per worker process"""
+    global _WORKER_SCENARIO
+    _WORKER_SCENARIO = scenario
+
+
+def _run_point(job):
+    point_id, params, seed, days = job
+    return point_id, run_single(_WORKER_SCENARIO, seed, days=days, params=params)
+
+
+def run_sweep(scenario: Scenario, design: List[Dict[str, float]], seeds: Iterable[int],
+              store: SweepStore = None, workers: int = None, days: Sequence[int] = (1,)) -> SweepStore:
+    """
+    Run every design point with every seed and write the results to store.
+    Runs of the same point (config and days) and seed already in the store are
+    skipped, so an interrupted sweep can be resumed.
+    """
+    store = SweepStore() if store is None else store
+    seeds = list(seeds)
+    days = tuple(days)
+    points = {}
+    for params in design:
+        make_config(params)  # validate before any run starts
+    for params in design:
+        points.setdefault(store.add_point(params, days), params)
+    store.commit()
+
+    done = store.completed()
+    jobs = [(point_id, params, seed, days) for point_id, params in points.items() for seed in seeds
+            if (point_id, seed) not in done]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+
+    if workers == 1:
+        _init_worker(scenario)
+        for point_id, run in map(_run_point, jobs):
+            store.add_run(point_id, run)
+    else:
+        chunksize = max(1, min(64, len(jobs) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(scenario,)) as pool:
+            for point_id, run in pool.map(_run_point, jobs, chunksize=chunksize):
+                store.add_run(point_id, run)
+    store.commit()
+    return store
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def parse_space(specs: List[str], random: bool) -> Dict:
+    """
+    Parse FIELD=v1,v2,... (grid) or FIELD=low:high (random) specifications.
+    Choice parameters (CHOICE_PARAMETERS) take names and can only be gridded.
+    """
+    space = {}
+    for spec in specs:
+        name, _, values = spec.partition('=')
+        if name not in PARAMETERS:
+            raise ValueError(f"Unknown parameter {name!r}; choose from {list(PARAMETERS)}")
+        if name in CHOICE_PARAMETERS:
+            if random:
+                raise ValueError(f"{name} takes one of {list(CHOICE_PARAMETERS[name])}; sweep it on a grid")
+            space[name] = values.split(',')
+            unknown = [v for v in space[name] if v not in CHOICE_PARAMETERS[name]]
+            if unknown:
+                raise ValueError(f"Unknown {name} {unknown}; choose from {list(CHOICE_PARAMETERS[name])}")
+        elif random:
+            low, high = values.split(':')
+            space[name] = (float(low), float(high))
+        else:
+            space[name] = [float(v) for v in values.split(',')]
+    return space
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Sweep placement simulation parameters")
+    parser.add_argument('specs', nargs='+', help="FIELD=v1,v2,... (grid) or FIELD=low:high (with --random)")
+    parser.add_argument('--random', type=int, default=None, metavar='N', help="draw N random points instead of a grid")
+    parser.add_argument('--seeds', type=int, default=5, help="seeds per point (101, 102, ...)")
+    parser.add_argument('--days', type=int, nargs='+', default=[1], help="days to simulate")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument('--out', default=str(Path(__file__).parent / 'sweep_results.sqlite'), help="result store")
+    parser.add_argument('--scenario', default=None, help="compiled scenario snapshot (see compile_scenario.py)")
+    args = parser.parse_args()
+
+    space = parse_space(args.specs, random=args.random is not None)
+    design = random_design(space, args.random) if args.random is not None else grid_design(space)
+
+    print("="*80)
+    print(f"PARAMETER SWEEP - {len(design)} points x {args.seeds} seeds")
+    print("="*80)
+
+    data_dir = Path(__file__).parent.parent
+    scenario = Scenario.open(args.scenario, data_dir=data_dir) if args.scenario else Scenario.load(data_dir)
+    store = run_sweep(scenario, design, [100 + i for i in range(1, args.seeds + 1)],
+                      store=SweepStore(args.out), workers=args.workers, days=args.days)
+
+    import pandas as pd
+    with pd.option_context('display.width', 160, 'display.max_columns', None):
+        print(store.point_summary().to_string())
+    store.close()
+    print(f"\nResults saved to: {args.out}")
@@ -0,0 +1,281 @@
+"""
+Synthetic placement datasets of any size.
+Fits a simple cohort model to an existing dataset (department mix, truncated
+normal CGPA per department, empirical domain pairs per department and CGPA
+band) and writes a dataset directory with the same files as the original:
+analysis_data.csv, companies.csv, company_order.csv, dep_score.csv, domain.csv
+and one shortlist CSV per mapped shortlist file. Students are generated in
+chunks by seeded worker processes and streamed to disk.
+"""
+
+import os
+import shutil
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple
+
+import numpy as np
+
+from placement_simulation import (COMPANY_SHORTLIST_MAPPING, SHORTLIST_DIR_NAME, STUDENTS_FILE_NAME,
+                                  COMPANIES_FILE_NAME, COMPANY_ORDER_FILE_NAME, DEP_SCORE_FILE_NAME,
+                                  parse_departments, parse_cgpa_requirement, is_domain_match,
+                                  load_shortlist_store, shortlist_key)
+
+STUDENT_COLUMNS = ['roll_no', 'name', 'cgpa', 'domain_1', 'skills_for_domain_1', 'domain_2', 'skills_for_domain_2']
+HIGH_CGPA = 9.0  # domain pairs are sampled separately below and above this CGPA (e.g. Quant)
+
+
+def roll_numbers(year: int, departments: List[str], dept: np.ndarray, index: np.ndarray) -> List[str]:
+    """Roll numbers <year><dept><5 digits>, unique by global student index (year advances every 100000)"""
+    return [f"{year + i // 100000:02d}{departments[d]}{i % 100000:05d}"
+            for i, d in zip(index.tolist(), dept.tolist())]
+
+
+# ============================================================================
+# COHORT MODEL
+# ============================================================================
+
+class CohortModel:
+    """
+    Generative model of a student cohort fitted to a dataset:
+    department shares, per-department truncated normal CGPA on [cgpa_low, cgpa_high],
+    and the empirical (domain_1, domain_2) pairs of each department and CGPA band.
+    """
+
+    def __init__(self, departments: List[str], dept_probs, cgpa_mean, cgpa_std, cgpa_low: float,
+                 cgpa_high: float, domains: List[str], cell_pairs: List[np.ndarray], skills: Dict[str, str],
+                 year: int, source_size: int):
+        self.departments = list(departments)
+        self.dept_probs = np.asarray(dept_probs, dtype=np.float64)
+        self.cgpa_mean = np.asarray(cgpa_mean, dtype=np.float64)
+        self.cgpa_std = np.asarray(cgpa_std, dtype=np.float64)
+        self.cgpa_low = cgpa_low
+        self.cgpa_high = cgpa_high
+        self.domains = list(domains)  # the last entry is '' (no domain_2)
+        self.cell_pairs = cell_pairs  # per (department, band): (k, 2) domain code pairs
+        self.skills = dict(skills)
+        self.year = year
+        self.source_size = source_size
+
+    @classmethod
+    def fit(cls, data_dir) -> 'CohortModel':
+        """Fit the model to analysis_data.csv in a dataset directory"""
+        import pandas as pd
+        df = pd.read_csv(Path(data_dir) / STUDENTS_FILE_NAME)
+        df = df.drop_duplicates('roll_no').reset_index(drop=True)
+        dept = df['roll_no'].map(str).str[2:4].str.upper()
+        departments = sorted(dept.unique())
+        dept_code = dept.map({d: i for i, d in enumerate(departments)}).to_numpy()
+        counts = np.bincount(dept_code, minlength=len(departments))
+
+        cgpa = df['cgpa'].to_numpy(dtype=np.float64)
+        grouped = pd.Series(cgpa).groupby(dept_code)
+        overall_std = float(cgpa.std(ddof=1))
+        cgpa_std = grouped.std(ddof=1).reindex(range(len(departments))).fillna(overall_std).to_numpy()
+
+        domain_2 = df['domain_2'].fillna('').map(str)
+        domains = sorted(set(df['domain_1'].map(str)) | set(domain_2) - {''}) + ['']
+        index = {d: i for i, d in enumerate(domains)}
+        pairs = np.stack([df['domain_1'].map(str).map(index).to_numpy(), domain_2.map(index).to_numpy()], axis=1)
+        band = (cgpa >= HIGH_CGPA).astype(np.int64)
+        cell = dept_code * 2 + band
+        cell_pairs = []
+        for c in range(len(departments) * 2):
+            rows = np.flatnonzero(cell == c)
+            if len(rows) == 0:  # no students of this department in this band: use the whole department
+                rows = np.flatnonzero(dept_code == c // 2)
+            cell_pairs.append(pairs[rows])
+
+        skills = {}
+        for domain_column, skills_column in (('domain_1', 'skills_for_domain_1'), ('domain_2', 'skills_for_domain_2')):
+            present = df[[domain_column, skills_column]].dropna()
+            for domain, values in present.groupby(domain_column)[skills_column]:
+                skills.setdefault(str(domain), values.mode().iloc[0])
+
+        return cls(departments, counts / counts.sum(), grouped.mean().to_numpy(), cgpa_std,
+                   float(np.floor(cgpa.min())), 10.0, domains, cell_pairs, skills,
+                   int(df['roll_no'].map(str).str[:2].mode().iloc[0]), len(df))
+
+    def truncated_normal(self, rng: np.random.Generator, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+        """One draw per entry of mean/std from N(mean, std) truncated to [cgpa_low, cgpa_high]"""
+        values = rng.normal(mean, std)
+        redraw = np.flatnonzero((values < self.cgpa_low) | (values > self.cgpa_high))
+        while len(redraw):
+            values[redraw] = rng.normal(mean[redraw], std[redraw])
+            redraw = redraw[(values[redraw] < self.cgpa_low) | (values[redraw] > self.cgpa_high)]
+        return values
+
+    def sample(self, start: int, n: int, seed) -> Tuple['pd.DataFrame', np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Students start .. start+n-1 as (frame with STUDENT_COLUMNS, department codes,
+        CGPA, domain code pairs). seed is anything np.random.default_rng accepts.
+        """
+        import pandas as pd
+        rng = np.random.default_rng(seed)
+        dept = rng.choice(len(self.departments), size=n, p=self.dept_probs)
+        cgpa = np.round(self.truncated_normal(rng, self.cgpa_mean[dept], self.cgpa_std[dept]), 2)
+
+        cell = dept * 2 + (cgpa >= HIGH_CGPA)
+        pairs = np.empty((n, 2), dtype=np.int64)
+        for c in np.unique(cell):
+            rows = np.flatnonzero(cell == c)
+            choices = self.cell_pairs[c]
+            pairs[rows] = choices[rng.integers(len(choices), size=len(rows))]
+
+        index = np.arange(start, start + n)
+        roll_no = roll_numbers(self.year, self.departments, dept, index)
+
+        domains = np.array(self.domains, dtype=object)
+        skills = np.array([self.skills.get(d, '') for d in self.domains], dtype=object)
+        frame = pd.DataFrame({
+            'roll_no': roll_no,
+            'name': [f"Synthetic Student {i}" for i in index.tolist()],
+            'cgpa': cgpa,
+            'domain_1': domains[pairs[:, 0]],
+            'skills_for_domain_1': skills[pairs[:, 0]],
+            'domain_2': domains[pairs[:, 1]],
+            'skills_for_domain_2': skills[pairs[:, 1]],
+        }, columns=STUDENT_COLUMNS)
+        return frame, dept, cgpa, pairs
+
+
+# ============================================================================
+# DATASET GENERATION
+# ============================================================================
+
+def _write_chunk(job) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Write one chunk of students to its part file; return its compact columns"""
+    model, start, n, seed, part_path = job
+    frame, dept, cgpa, pairs = model.sample(start, n, seed)
+    frame.to_csv(part_path, index=False, header=False)
+    return dept.astype(np.int16), cgpa.astype(np.float32), pairs.astype(np.int16)
+
+
+def scale_companies(source_dir, scale: float) -> 'pd.DataFrame':
+    """companies.csv with min/max offers scaled to the cohort size (at least 1)"""
+    import pandas as pd
+    companies = pd.read_csv(Path(source_dir) / COMPANIES_FILE_NAME)
+    for column in ('min_offers', 'max_offers'):
+        companies[column] = np.maximum(1, np.round(companies[column] * scale)).astype(np.int64)
+    return companies
+
+
+def shortlist_rows(model: CohortModel, companies, dept: np.ndarray, cgpa: np.ndarray, pairs: np.ndarray,
+                   source_sizes: Dict[str, int], scale: float, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """
+    Student rows for each mapped shortlist file: a sample, without replacement, of the
+    students eligible for any company mapped to it, sized like the source file x scale.
+    """
+    names = companies['company_name'].map(str).str.strip()
+    roles = companies['job_role'].map(str).str.strip()
+    by_file: Dict[str, List[int]] = {}
+    for j, company_id in enumerate((names + '_' + roles).tolist()):
+        shortlist_file = COMPANY_SHORTLIST_MAPPING.get(company_id)
+        if shortlist_file and shortlist_file in source_sizes:
+            by_file.setdefault(shortlist_file, []).append(j)
+
+    dept_index = {d: i for i, d in enumerate(model.departments)}
+    rows = {}
+    for shortlist_file, company_rows in sorted(by_file.items()):
+        eligible = np.zeros(len(dept), dtype=bool)
+        for j in company_rows:
+            allowed = parse_departments(companies['allowed_departments'].iloc[j])
+            dept_ok = np.ones(len(model.departments), dtype=bool) if 'ALL' in allowed else \
+                np.isin(np.arange(len(model.departments)), [dept_index[d] for d in allowed if d in dept_index])
+            domain_ok = np.array([bool(d) and is_domain_match([d], roles.iloc[j]) for d in model.domains])
+            eligible |= (dept_ok[dept] & (cgpa >= parse_cgpa_requirement(companies['min_cgpa'].iloc[j]))
+                         & (domain_ok[pairs[:, 0]] | domain_ok[pairs[:, 1]]))
+        candidates = np.flatnonzero(eligible)
+        size = min(len(candidates), int(round(source_sizes[shortlist_file] * scale)))
+        rows[shortlist_file] = np.sort(rng.choice(candidates, size=size, replace=False))
+    return rows
+
+
+def generate_dataset(source_dir, out_dir, n_students: int, seed: int = 0, chunk_size: int = 100_000,
+                     workers: int = None) -> Dict:
+    """
+    Write a synthetic dataset of n_students to out_dir, modelled on source_dir.
+    Output depends only on (source data, n_students, seed, chunk_size), not on workers.
+    """
+    source_dir, out_dir = Path(source_dir), Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    model = CohortModel.fit(source_dir)
+    scale = n_students / model.source_size
+
+    # Students: one seeded chunk per job, streamed into analysis_data.csv in order
+    student_seed, shortlist_seed = np.random.SeedSequence(seed).spawn(2)
+    starts = list(range(0, n_students, chunk_size))
+    jobs = [(model, start, min(chunk_size, n_students - start), chunk_seed,
+             out_dir / f"{STUDENTS_FILE_NAME}.part{k}")
+            for k, (start, chunk_seed) in enumerate(zip(starts, student_seed.spawn(len(starts))))]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+    if workers == 1:
+        columns = list(map(_write_chunk, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            columns = list(pool.map(_write_chunk, jobs))
+
+    with open(out_dir / STUDENTS_FILE_NAME, 'wb') as out:
+        out.write((','.join(STUDENT_COLUMNS) + '\n').encode())
+        for job in jobs:
+            with open(job[4], 'rb') as part:
+                shutil.copyfileobj(part, out)
+            os.remove(job[4])
+    dept = np.concatenate([c[0] for c in columns]) if columns else np.zeros(0, dtype=np.int16)
+    cgpa = np.concatenate([c[1] for c in columns]) if columns else np.zeros(0, dtype=np.float32)
+    pairs = np.concatenate([c[2] for c in columns]) if columns else np.zeros((0, 2), dtype=np.int16)
+
+    # Companies (offers scaled with the cohort), order, scores and domains as in the source
+    companies = scale_companies(source_dir, scale)
+    companies.to_csv(out_dir / COMPANIES_FILE_NAME, index=False)
+    for name in (COMPANY_ORDER_FILE_NAME, DEP_SCORE_FILE_NAME, 'domain.csv'):
+        if (source_dir / name).exists():
+            shutil.copy(source_dir / name, out_dir / name)
+
+    # Shortlists: eligible students, sized like the source shortlists x scale
+    store = load_shortlist_store(source_dir / SHORTLIST_DIR_NAME, use_cache=False)
+    source_sizes = {f: store.size(shortlist_key(f)) for f in store.files}
+    shortlist_dir = out_dir / SHORTLIST_DIR_NAME
+    shortlist_dir.mkdir(exist_ok=True)
+    rows = shortlist_rows(model, companies, dept, cgpa.astype(np.float64), pairs, source_sizes, scale,
+                          np.random.default_rng(shortlist_seed))
+    for shortlist_file, members in rows.items():
+        with open(shortlist_dir / shortlist_file, 'w') as f:
+            f.write('roll_no\n')
+            f.writelines(r + '\n' for r in roll_numbers(model.year, model.departments, dept[members], members))
+
+    return {
+        'students': n_students,
+        'chunks': len(jobs),
+        'scale': scale,
+        'companies': len(companies),
+        'shortlists': len(rows),
+        'shortlisted': int(sum(len(m) for m in rows.values())),
+    }
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate a synthetic placement dataset")
+    parser.add_argument('students', type=int, help="number of students")
+    parser.add_argument('--out', required=True, help="output dataset directory")
+    parser.add_argument('--source', default=str(Path(__file__).parent.parent), help="dataset to model")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-size', type=int, default=100_000, help="students per worker job")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all CPUs)")
+    args = parser.parse_args()
+
+    print("="*80)
+    print(f"SYNTHETIC DATASET - {args.students} students")
+    print("="*80)
+    summary = generate_dataset(args.source, args.out, args.students, seed=args.seed,
+                               chunk_size=args.chunk_size, workers=args.workers)
+    for key, value in summary.items():
+        print(f"  {key}: {value:.3f}" if isinstance(value, float) else f"  {key}: {value}")
+    print(f"\nDataset written to: {args.out}")
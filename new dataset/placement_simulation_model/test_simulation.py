@@ -229,6 +229,1027 @@ def test_scoring_functions():
     return True
 
 
+def test_eligibility_matrix():
+    """Test precomputed eligibility matrix against scalar checks"""
+    print("\n" + "="*80)
+    print("TEST 8: Eligibility Matrix")
+    print("="*80)
+    
+    students = [
+        Student('23CS10001', 'A', 8.5, 'CS', 'SDE', ['Python'], 'Data', ['SQL']),
+        Student('23ME10002', 'B', 7.2, 'ME', 'Core_ME', ['CAD']),
+        Student('23MA10003', 'C', 6.5, 'MA', 'Quant', ['Probability']),
+    ]
+    companies = [
+        Company('Alpha', 'SDE', ['ALL'], 7.0, ['python'], 1, 1, 2, 4),
+        Company('Beta', 'Quant', ['MA', 'CS'], 6.0, [], 1, 1, 2, 4),
+        Company('Gamma', 'Core', ['ME'], 7.0, [], 1, 1, 2, 4),
+        Company('Delta', 'Data Analyst', ['CS'], 9.0, [], 1, 1, 2, 4),
+    ]
+    
+    matrix = EligibilityMatrix(students, companies)
+    for i, student in enumerate(students):
+        for j, company in enumerate(companies):
+            expected = (is_department_eligible(student.department, company.allowed_departments) and
+                        is_cgpa_eligible(student.cgpa, company.min_cgpa) and
+                        is_domain_match(student.domains, company.job_role))
+            assert bool(matrix.matrix[i, j]) == expected, f"Mismatch for {student.roll_no} / {company}"
+    
+    # Slices preserve the order of the given student list
+    eligible = matrix.eligible_students(companies[0], list(reversed(students)))
+    assert [s.roll_no for s in eligible] == ['23CS10001'], "Alpha should only accept the CS student"
+    assert [s.roll_no for s in matrix.eligible_students(companies[1], students)] == ['23MA10003']
+    print("  ✓ Matrix agrees with scalar eligibility checks")
+    
+    print("\nResult: Eligibility matrix test passed")
+    return True
+
+
+def test_skill_profile_cache():
+    """Test skill profile hash-consing and cached match scores"""
+    print("\n" + "="*80)
+    print("TEST 9: Skill Profile Cache")
+    print("="*80)
+    
+    registry = SkillProfileRegistry()
+    a = registry.student_profile_id({'Python', 'Machine Learning'})
+    b = registry.student_profile_id(['Machine Learning', 'Python'])
+    c = registry.student_profile_id({'Java'})
+    assert a == b, "Identical skill sets should share a profile"
+    assert a != c, "Different skill sets should get different profiles"
+    
+    req = registry.company_profile_id(['python', 'ml'])
+    assert req == registry.company_profile_id(('python', 'ml')), "Identical requirements should share a profile"
+    
+    score = registry.match_score(a, req)
+    assert score == calculate_skill_match_score({'Python', 'Machine Learning'}, ['python', 'ml'])
+    assert (a, req) in registry.scores, "Score should be cached"
+    assert registry.match_score(a, req) == score
+    print(f"  ✓ Profiles deduplicated, cached score: {score:.2f}")
+    
+    print("\nResult: Skill profile cache test passed")
+    return True
+
+
+def test_skill_vocabulary():
+    """Test compiled skill vocabulary and multi-pattern matcher"""
+    print("\n" + "="*80)
+    print("TEST 10: Skill Vocabulary")
+    print("="*80)
+    
+    automaton = SkillAutomaton(['he', 'she', 'his', 'hers'])
+    assert automaton.find_all('ushers') == {0, 1, 3}, "Should find he, she and hers"
+    assert automaton.find_all('xyz') == set(), "Should find nothing"
+    
+    vocab = SkillVocabulary()
+    student = set(vocab.add_all(['Python', 'Data Structures', 'Operating Systems', 'ML']))
+    test_cases = [
+        (['python'], 10.0),                    # Direct match
+        (['py'], 10.0),                        # Required skill is a substring
+        (['dsa', 'os'], 10.0),                 # Abbreviations resolve to expansions
+        (['machine learning'], 10.0),          # Student holds the abbreviation
+        (['java', 'python'], 5.0),
+        ([], 10.0),
+    ]
+    for required, expected in test_cases:
+        result = vocab.match_score(student, vocab.add_all(required))
+        assert result == expected, f"{required} -> {result} (expected {expected})"
+        print(f"  ✓ Required: {required} -> Score: {result:.2f}")
+    
+    print("\nResult: Skill vocabulary test passed")
+    return True
+
+
+def test_skill_bitsets():
+    """Test packed skill bit vectors and popcount scoring"""
+    print("\n" + "="*80)
+    print("TEST 11: Skill Bitsets")
+    print("="*80)
+    
+    bits = np.array([0, 1, 3, 2**64 - 1], dtype=np.uint64)
+    assert popcount(bits).tolist() == [0, 1, 2, 64], "Popcount mismatch"
+    
+    students = [
+        Student('23CS10001', 'A', 8.5, 'CS', 'SDE', ['Python', 'Data Structures', 'Machine Learning']),
+        Student('23EE10002', 'B', 7.5, 'EE', 'SDE', ['Java', 'Operating Systems']),
+        Student('23ME10003', 'C', 7.0, 'ME', 'Core_ME', []),
+    ]
+    companies = [
+        Company('Alpha', 'SDE', ['ALL'], 7.0, ['python', 'dsa', 'os', 'ml'], 1, 1, 2, 4),
+        Company('Beta', 'SDE', ['ALL'], 7.0, ['java', 'java'], 1, 1, 2, 4),
+        Company('Gamma', 'Core', ['ALL'], 7.0, [], 1, 1, 2, 4),
+    ]
+    
+    matrix = SkillMatchMatrix(students, companies)
+    grid = matrix.score_matrix()
+    for i, student in enumerate(students):
+        for j, company in enumerate(companies):
+            expected = calculate_skill_match_score(student.skills, company.required_skills)
+            assert grid[i, j] == expected, f"Mismatch for {student.roll_no} / {company}"
+    assert matrix.company_scores(companies[0]).tolist() == [7.5, 2.5, 0.0]
+    assert matrix.scores_for(companies[1], students[1:2]).tolist() == [10.0]
+    print("  ✓ Bitset scores agree with scalar skill matching")
+    
+    print("\nResult: Skill bitset test passed")
+    return True
+
+
+def build_small_world(n_students=60):
+    """Small in-memory cohort, company list and order for engine tests"""
+    depts = ['CS', 'EE', 'MA', 'ME']
+    domains = [('SDE', ['Python', 'Data Structures']), ('Data', ['Machine Learning', 'SQL']),
+               ('Quant', ['Probability', 'C++']), ('Core_ME', ['CAD'])]
+    students = []
+    for i in range(n_students):
+        domain, skills = domains[i % len(domains)]
+        students.append(Student(f'23{depts[i % len(depts)]}1{i:04d}', f'Student {i}', 6.5 + (i % 7) * 0.5,
+                                depts[i % len(depts)], domain, skills))
+    companies = [
+        Company('Alpha', 'SDE', ['ALL'], 7.0, ['python', 'dsa'], 1, 2, 4, 10),
+        Company('Beta', 'Quant', ['MA', 'CS'], 7.5, ['probability'], 1, 1, 3, 6),
+        Company('Gamma', 'Data', ['ALL'], 0.0, ['ml', 'sql'], 1, 2, 5, 12),
+        Company('Delta', 'Core', ['ME'], 6.0, [], 2, 1, 2, 4),
+    ]
+    company_order = {1: ['Alpha', 'Beta'], 2: ['Gamma', 'Delta']}
+    return students, companies, company_order
+
+
+def run_quiet_day(students, companies, company_order, day=1, **kwargs):
+    """Run one simulated day without console output"""
+    import io
+    import contextlib
+    from run_simulation import PlacementSimulation
+    
+    sim = PlacementSimulation(students, companies, company_order, **kwargs)
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim.simulate_day(day=day)
+    return sim
+
+
+def test_simulation_rng_streams():
+    """Test per-simulation random generator streams"""
+    print("\n" + "="*80)
+    print("TEST 12: Simulation RNG Streams")
+    print("="*80)
+    
+    outcomes = []
+    for seed in [7, 7, 8]:
+        state = np.random.get_state()[1][:5].tolist()
+        sim = run_quiet_day(*build_small_world(), seed=seed)
+        assert np.random.get_state()[1][:5].tolist() == state, "Global RNG must not be used"
+        outcomes.append(sorted((s.roll_no, s.status, s.placed_company) for s in sim.students.values()))
+    
+    assert outcomes[0] == outcomes[1], "Same seed should reproduce the same run"
+    assert outcomes[2] != outcomes[0], "Another seed should change who is shortlisted, hired and placed"
+    print("  ✓ Same seed reproduces the run without touching the global RNG; another seed changes it")
+    
+    print("\nResult: RNG stream test passed")
+    return True
+
+
+def test_top_k_selection():
+    """Test partial top-k selection against a stable full sort"""
+    print("\n" + "="*80)
+    print("TEST 13: Top-k Selection")
+    print("="*80)
+    
+    assert top_k_indices([3.0, 5.0, 5.0, 1.0, 5.0], 2).tolist() == [1, 2], "Ties keep original order"
+    assert top_k_indices([1.0, 2.0], 5).tolist() == [1, 0], "k larger than n returns everything"
+    assert top_k_indices([], 3).tolist() == [], "Empty input"
+    
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        scores = rng.integers(0, 6, size=rng.integers(1, 40)).astype(float)
+        k = int(rng.integers(0, len(scores) + 2))
+        expected = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:k]
+        assert top_k_indices(scores, k).tolist() == expected, f"Mismatch for {scores}, k={k}"
+    print("  ✓ Matches stable descending sort including ties")
+    
+    print("\nResult: Top-k selection test passed")
+    return True
+
+
+def test_columnar_tables():
+    """Test StudentTable/CompanyTable storage and backward-compatible views"""
+    print("\n" + "="*80)
+    print("TEST 14: Columnar Tables")
+    print("="*80)
+    
+    students, companies, company_order = build_small_world()
+    table = StudentTable.bind(students)
+    assert table.cgpa.dtype == np.float32 and table.status.dtype == np.int8
+    assert all(table.view(i) is s for i, s in enumerate(students)), "Views should be reused"
+    assert students[1].cgpa == 7.0 and students[1].department == 'EE'
+    
+    # Status writes through the view keep the unplaced mask in sync
+    students[0].status = 'Placed'
+    students[0].placed_company = 'Alpha_SDE'
+    assert table.status[0] == STATUS_PLACED and not table.unplaced_mask[0]
+    assert students[0].placed_company == 'Alpha_SDE'
+    assert len(table.unplaced_rows()) == len(students) - 1
+    
+    # Copies share static columns but start with fresh state
+    fresh = table.copy()
+    assert fresh.roll_no is table.roll_no and fresh.count(STATUS_UNPLACED) == len(students)
+    
+    # A full run through the engine keeps the object API working
+    sim = run_quiet_day(students, companies, company_order, seed=3)
+    for company in sim.companies.values():
+        assert all(s.status == 'Placed' and s.placed_company == company.get_unique_id() for s in company.hired)
+    placed = [s for s in sim.students.values() if s.status == 'Placed']
+    assert len(placed) == sim.student_table.count(STATUS_PLACED)
+    print(f"  ✓ {len(placed)} placements visible through Student/Company views")
+    
+    print("\nResult: Columnar table test passed")
+    return True
+
+
+def test_company_schedule():
+    """Test precompiled company-order schedule"""
+    print("\n" + "="*80)
+    print("TEST 15: Company Schedule")
+    print("="*80)
+    
+    companies = [
+        Company('Samsung R&D Delhi', 'SDE', ['ALL'], 0.0, [], 1, 1, 2, 4),
+        Company('Samsung Bengaluru', 'SDE', ['ALL'], 0.0, [], 1, 1, 2, 4),
+        Company('Google', 'SWE', ['ALL'], 0.0, [], 1, 1, 2, 4),
+        Company('Google', 'Core', ['ALL'], 0.0, [], 2, 1, 2, 4),
+        Company('Optiver', 'Quant', ['ALL'], 0.0, [], 1, 1, 2, 4),
+    ]
+    order = {1: ['Samsung', 'Acme'], 2: ['Google']}
+    schedule = CompanySchedule(order, companies)
+    
+    assert schedule.companies_for(1, 1) == (0, 1), "Samsung matches both Samsung companies"
+    assert schedule.companies_for(1, 2) == (2,), "Only the day-1 Google role"
+    assert schedule.companies_for(2, 2) == (3,), "Only the day-2 Google role"
+    assert schedule.companies_for(3, 1) == (), "Unknown day"
+    assert schedule.unmatched == ('Acme',)
+    assert set(schedule.ambiguous) == {'Samsung'}
+    assert schedule.unscheduled == ('Optiver_Quant',)
+    try:
+        schedule._slots[(1, 1)] = ()
+        assert False, "Schedule should be immutable"
+    except TypeError:
+        pass
+    print("  ✓ Schedule resolved once with unmatched/ambiguous names reported")
+    
+    print("\nResult: Company schedule test passed")
+    return True
+
+
+def test_season_checkpoints():
+    """Test multi-day season simulation and resuming from a checkpoint"""
+    import io
+    import contextlib
+    import tempfile
+    from run_simulation import PlacementSimulation
+    
+    print("\n" + "="*80)
+    print("TEST 16: Season Checkpoints")
+    print("="*80)
+    
+    with contextlib.redirect_stdout(io.StringIO()), tempfile.TemporaryDirectory() as tmp:
+        full = PlacementSimulation(*build_small_world(), seed=11)
+        checkpoints = full.simulate_season(checkpoint_dir=tmp)
+        
+        resumed = PlacementSimulation(*build_small_world(), seed=11)
+        resumed.simulate_season(resume_from=Path(tmp) / 'day1_checkpoint.npz')
+    
+    assert sorted(checkpoints) == [1, 2], "Both arrival days simulated"
+    outcome = lambda stats: {k: v for k, v in stats.items() if k not in ('timings', 'counters')}
+    assert outcome(resumed.stats) == outcome(full.stats), "Resumed season should match the full season"
+    assert resumed.results_frame().equals(full.results_frame())
+    print(f"  ✓ Day-wise placements: {full.stats['day_wise_placements']}")
+    
+    print("\nResult: Season checkpoint test passed")
+    return True
+
+
+def test_monte_carlo_runner():
+    """Test the in-process Monte Carlo runner against direct simulations"""
+    import io
+    import contextlib
+    from run_simulation import Scenario
+    from monte_carlo import run_monte_carlo
+    
+    print("\n" + "="*80)
+    print("TEST 17: Monte Carlo Runner")
+    print("="*80)
+    
+    scenario = Scenario(*build_small_world())
+    seeds = [101, 102, 103, 104]
+    serial = run_monte_carlo(scenario, seeds, workers=1, days=(1, 2))
+    parallel = run_monte_carlo(scenario, seeds, workers=2, days=(1, 2))
+    
+    assert serial == parallel, "Results should not depend on the number of workers"
+    assert [r['seed'] for r in serial] == seeds, "Results should come back in seed order"
+    
+    students, companies, company_order = build_small_world()
+    sim = run_quiet_day(students, companies, company_order, day=1, seed=102)
+    with contextlib.redirect_stdout(io.StringIO()):
+        sim.simulate_day(2)
+    placed = sum(1 for s in sim.students.values() if s.status == 'Placed')
+    assert serial[1]['total_placed'] == placed, "Runner should match a direct simulation"
+    assert sum(serial[1]['company_counts'].values()) == placed
+    print(f"  ✓ Placed per run: {[r['total_placed'] for r in serial]}")
+    
+    print("\nResult: Monte Carlo runner test passed")
+    return True
+
+
+def test_streaming_aggregation():
+    """Test Welford aggregation against batch statistics"""
+    from run_simulation import Scenario
+    from monte_carlo import run_monte_carlo, MonteCarloAggregator
+    
+    print("\n" + "="*80)
+    print("TEST 18: Streaming Aggregation")
+    print("="*80)
+    
+    runs = run_monte_carlo(Scenario(*build_small_world()), range(200, 212), workers=1, days=(1, 2))
+    aggregator = MonteCarloAggregator()
+    for run in runs:
+        aggregator.add(run)
+    summary = aggregator.summary()
+    
+    placed = [r['total_placed'] for r in runs]
+    assert np.isclose(summary['overall']['total_placed']['mean'], np.mean(placed))
+    assert np.isclose(summary['overall']['total_placed']['std'], np.std(placed))
+    assert summary['overall']['total_placed']['max'] == max(placed)
+    
+    # Companies missing from a run count as zero hires in that run
+    for company, stats in summary['company_counts'].items():
+        counts = [r['company_counts'].get(company, 0) for r in runs]
+        assert np.isclose(stats['mean'], np.mean(counts)) and np.isclose(stats['std'], np.std(counts))
+        assert stats['min'] == min(counts), f"{company} min should include zero-hire runs"
+    print(f"  ✓ Placed: {summary['overall']['total_placed']['mean']:.2f} ± {summary['overall']['total_placed']['std']:.2f}")
+    
+    # Merging partial aggregates gives the same statistics
+    first, second = MonteCarloAggregator(), MonteCarloAggregator()
+    for i, run in enumerate(runs):
+        (first if i < 5 else second).add(run)
+    first.merge(second)
+    merged = first.summary()
+    for metric in ['overall', 'company_counts', 'dept_counts']:
+        for key, stats in summary[metric].items():
+            assert np.allclose(list(stats.values()), list(merged[metric][key].values())), f"{metric}/{key}"
+    print("  ✓ Merged partial aggregates match")
+    
+    print("\nResult: Streaming aggregation test passed")
+    return True
+
+
+def test_parameter_sweep():
+    """Test grid sweeps over model parameters and the indexed result store"""
+    from run_simulation import Scenario
+    from monte_carlo import run_monte_carlo
+    from sweep import grid_design, random_design, run_sweep
+    
+    print("\n" + "="*80)
+    print("TEST 19: Parameter Sweep")
+    print("="*80)
+    
+    design = grid_design({'p_opt_out': [0.0, 0.5], 'over_offer_multiplier': [1.0, 1.5]})
+    assert len(design) == 4 and design[0] == {'p_opt_out': 0.0, 'over_offer_multiplier': 1.0}
+    assert len(random_design({'w1_cgpa': (0.1, 0.5)}, 5)) == 5
+    
+    scenario = Scenario(*build_small_world())
+    store = run_sweep(scenario, design, [301, 302], workers=1, days=(1, 2))
+    runs = store.runs_frame()
+    assert len(runs) == 8 and not runs.duplicated(['point_id', 'seed']).any()
+    assert (runs.loc[runs['p_opt_out'] == 0.0, 'total_opted_out'] == 0).all(), "No opt-outs with p_opt_out=0"
+    
+    # Default parameters reproduce the plain runner
+    default = run_sweep(scenario, [{}], [301, 302], workers=1, days=(1, 2)).runs_frame()
+    plain = run_monte_carlo(scenario, [301, 302], workers=1, days=(1, 2))
+    assert default['total_placed'].tolist() == [r['total_placed'] for r in plain]
+    
+    # Re-running skips stored (point, seed) pairs, whatever the order of the design
+    assert len(run_sweep(scenario, design[::-1], [301, 302], store=store, workers=1, days=(1, 2)).runs_frame()) == 8
+    
+    # Other days or parameters are new points; earlier results keep their labels
+    run_sweep(scenario, design[:2] + [{'p_opt_out': 0.25}], [301, 302], store=store, workers=1, days=(1,))
+    rerun = store.runs_frame()
+    assert len(rerun) == 14 and rerun['point_id'].nunique() == 7
+    before = rerun[rerun['point_id'].isin(runs['point_id'])].reset_index(drop=True)
+    assert before[runs.columns].equals(runs), "Stored results should not be relabelled"
+    print(f"  ✓ Placed by point: {runs.groupby('point_id')['total_placed'].mean().tolist()}")
+    
+    print("\nResult: Parameter sweep test passed")
+    return True
+
+
+def test_variance_reduction():
+    """Test common random numbers, antithetic runs and sequential stopping"""
+    from run_simulation import Scenario, spawn_seeds
+    from monte_carlo import run_single, run_replicate, run_until_precise, run_monte_carlo
+    
+    print("\n" + "="*80)
+    print("TEST 20: Variance Reduction")
+    print("="*80)
+    
+    scenario = Scenario(*build_small_world())
+    
+    # Common random numbers: identical configs give a zero difference in every run
+    same = run_replicate(scenario, 401, days=(1, 2), params={'p_opt_out': 0.1}, compare_params={'p_opt_out': 0.1})
+    assert same['total_placed'] == 0 and all(v == 0 for v in same['company_counts'].values())
+    
+    # Keyed draws do not depend on how many draws other decisions consumed
+    a = run_single(scenario, 401, days=(1,), crn=True, params={'p_opt_out': 0.0})
+    b = run_single(scenario, 401, days=(1,), crn=True, params={'p_opt_out': 0.5})
+    assert a['company_counts'] == b['company_counts'], "Same hires on day 1 before opt-outs matter"
+    print(f"  ✓ Day-1 hires shared across opt-out rates: {a['total_placed']}")
+    
+    # Antithetic replicate is the mean of the run and its twin
+    plain = run_single(scenario, 402, days=(1, 2), crn=True)
+    twin = run_single(scenario, 402, days=(1, 2), antithetic=True)
+    pair = run_replicate(scenario, 402, days=(1, 2), antithetic=True)
+    assert pair['total_placed'] == (plain['total_placed'] + twin['total_placed']) / 2
+    
+    # Sequential stopping reaches the requested precision or the cap
+    result = run_until_precise(scenario, 'total_placed', ci_width=4.0, min_runs=5, max_runs=60,
+                               batch_size=5, workers=1, days=(1, 2))
+    assert result['converged'] == (2 * result['half_width'] <= 4.0)
+    assert result['converged'] or result['n_replicates'] == 60
+    assert result['ci'][0] <= result['estimate'] <= result['ci'][1]
+    print(f"  ✓ Placed {result['estimate']:.2f} ± {result['half_width']:.2f} after {result['n_replicates']} runs")
+
+    # Sobol openings draws: the mean of 16 runs varies far less than with independent draws
+    def mean_placed(root, **options):
+        runs = run_monte_carlo(scenario, spawn_seeds(root, 16), workers=1, days=(1, 2), **options)
+        return np.mean([r['total_placed'] for r in runs])
+    plain_var = np.var([mean_placed(500 + r, crn=True) for r in range(8)], ddof=1)
+    sobol_var = np.var([mean_placed(500 + r, sobol=True) for r in range(8)], ddof=1)
+    assert sobol_var < plain_var / 4, f"Sobol variance {sobol_var:.4f} vs plain {plain_var:.4f}"
+    print(f"  ✓ Variance of a 16-run mean: plain {plain_var:.4f}, Sobol {sobol_var:.4f}")
+
+    # With sobol the interval comes from independent scrambles (whole power-of-two batches)
+    result = run_until_precise(scenario, 'total_placed', ci_width=1.0, min_runs=5, max_runs=60,
+                               batch_size=5, workers=1, days=(1, 2), sobol=True)
+    assert result['n_replicates'] % 8 == 0 and result['n_scrambles'] == result['n_replicates'] // 8
+    assert result['n_scrambles'] >= 2 and result['ci'][0] <= result['estimate'] <= result['ci'][1]
+    print(f"  ✓ Sobol: placed {result['estimate']:.2f} ± {result['half_width']:.2f} "
+          f"from {result['n_scrambles']} scrambles")
+
+    print("\nResult: Variance reduction test passed")
+    return True
+
+
+def test_logging_and_summaries():
+    """Test leveled engine logging, the silent logger and the JSON-lines summary sink"""
+    import io
+    import json
+    import logging
+    import tempfile
+    import contextlib
+    import run_simulation
+    from run_simulation import PlacementSimulation, JsonLinesSink, SILENT_LOGGER, configure_logging
+    
+    print("\n" + "="*80)
+    print("TEST 21: Logging and Summaries")
+    print("="*80)
+    
+    def run_logged(level):
+        stream = io.StringIO()
+        configure_logging(level, stream)
+        try:
+            PlacementSimulation(*build_small_world(), seed=21).simulate_day(1)
+        finally:
+            run_simulation.LOG.handlers = []
+            run_simulation.LOG.setLevel(logging.NOTSET)
+            run_simulation.LOG.propagate = True
+        return stream.getvalue()
+    
+    info, debug = run_logged(logging.INFO), run_logged(logging.DEBUG)
+    assert "[STEP 6] Offer Acceptance" in info and "accepted offer" not in info
+    assert "accepted offer" in debug, "Per-student lines are DEBUG"
+    
+    # Silent runs write nothing anywhere
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        PlacementSimulation(*build_small_world(), seed=21, logger=SILENT_LOGGER).simulate_day(1)
+    assert out.getvalue() == "" and err.getvalue() == ""
+    print("  ✓ INFO/DEBUG levels and silent mode")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'summaries.jsonl'
+        with JsonLinesSink(path) as sink:
+            sim = PlacementSimulation(*build_small_world(), seed=21, logger=SILENT_LOGGER, summary_sink=sink)
+            sim.simulate_day(1)
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+    
+    serials = [r for r in records if r['event'] == 'serial_summary']
+    assert [r['serial'] for r in serials] == [1, 2] and records[-1]['event'] == 'day_summary'
+    assert records[-1]['placed'] == sim.stats['day_wise_placements'][1]
+    hired = sum(c['hired'] for r in serials for c in r['companies'])
+    assert hired == records[-1]['placed'], "Per-company hires add up to the day's placements"
+    print(f"  ✓ {len(records)} summary records, {hired} placements")
+    
+    print("\nResult: Logging test passed")
+    return True
+
+
+def test_simulation_config():
+    """Test that model parameters come from an immutable per-simulation config"""
+    import dataclasses
+    from concurrent.futures import ThreadPoolExecutor
+    import placement_simulation
+    from run_simulation import PlacementSimulation, SILENT_LOGGER
+    
+    print("\n" + "="*80)
+    print("TEST 22: Simulation Config")
+    print("="*80)
+    
+    config = SimulationConfig(w1_cgpa=0.6, p_opt_out=0.0)
+    try:
+        config.w1_cgpa = 0.1
+        assert False, "Config should be immutable"
+    except dataclasses.FrozenInstanceError:
+        pass
+    assert config.replace(w2_skill=0.5).w2_skill == 0.5 and config.w2_skill == DEFAULT_CONFIG.w2_skill
+    
+    # Scoring functions use the given weights
+    scores = calculate_profile_scores([8.0], [5.0], [6.0], [2.0], config)
+    assert np.isclose(scores[0], 0.6 * 5.0 + 0.2 * 5.0 + 0.2 * 2.0 + 0.3 * 6.0)
+    no_dep = calculate_profile_scores([8.0], [5.0], [6.0], [2.0], config.replace(use_dep_score=False))
+    assert np.isclose(scores[0] - no_dep[0], 0.3 * 6.0)
+    
+    def outcome(cfg):
+        sim = PlacementSimulation(*build_small_world(), seed=31, logger=SILENT_LOGGER, config=cfg)
+        sim.simulate_season()
+        return sim
+    
+    # Differently configured simulations running concurrently do not interfere
+    configs = [DEFAULT_CONFIG, config, DEFAULT_CONFIG.replace(over_offer_multiplier=1.0)] * 2
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        sims = list(pool.map(outcome, configs))
+    for cfg, sim in zip(configs, sims):
+        assert sim.results_frame().equals(outcome(cfg).results_frame())
+    assert sims[1].stats['opted_out_students'] == 0, "p_opt_out=0 means no opt-outs"
+    assert placement_simulation.W1_CGPA_PROFILE == 0.3, "Module defaults are never modified"
+    
+    # Without enforce_min_hires, offers follow the over-offer multiplier only
+    sim = PlacementSimulation(*build_small_world(), seed=31, logger=SILENT_LOGGER,
+                              config=DEFAULT_CONFIG.replace(over_offer_multiplier=1.0, enforce_min_hires=False))
+    sim.simulate_day(1)
+    for company in sim.companies.values():
+        if company.visit_day == 1:
+            assert len(company.offered) <= company.target_hires
+    print("  ✓ Configs are immutable, isolated and honored")
+    
+    print("\nResult: Simulation config test passed")
+    return True
+
+
+def test_parse_cache():
+    """Test that cached dataset columns match a fresh parse and follow file contents"""
+    import shutil
+    import pandas as pd
+    import tempfile
+    
+    print("\n" + "="*80)
+    print("TEST 23: Parse Cache")
+    print("="*80)
+    
+    student_fields = ('roll_no', 'name', 'cgpa', 'department', 'domains', 'skills')
+    company_fields = ('company_name', 'job_role', 'allowed_departments', 'min_cgpa', 'required_skills',
+                      'visit_day', 'min_hires', 'max_hires', 'interview_slots')
+    
+    def fields_of(objects, names):
+        return [tuple(getattr(obj, n) for n in names) for obj in objects]
+    
+    source = Path(__file__).parent.parent
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        for name in ('analysis_data.csv', 'companies.csv', 'dep_score.csv', 'company_order.csv'):
+            shutil.copy(source / name, data_dir / name)
+        shutil.copytree(source / 'company shortlists(csv)', data_dir / 'company shortlists(csv)')
+        
+        fresh = load_dataset(data_dir, use_cache=False)
+        assert not (data_dir / '.parse_cache').exists()
+        first = load_dataset(data_dir)
+        cache_files = list((data_dir / '.parse_cache').glob('dataset_*.npz'))
+        assert len(cache_files) == 1
+        cached = load_dataset(data_dir)
+        
+        for loaded in (first, cached):
+            students, companies, company_order, dep_scores = loaded
+            assert fields_of(students, student_fields) == fields_of(fresh[0], student_fields)
+            assert fields_of(companies, company_fields) == fields_of(fresh[1], company_fields)
+            assert company_order == fresh[2] and dep_scores == fresh[3]
+        print(f"  ✓ Cache hit matches a fresh parse ({len(fresh[0])} students, {len(fresh[1])} companies)")
+        
+        # Editing any input file changes the fingerprint and forces a re-parse
+        fingerprint = dataset_fingerprint(data_dir)
+        scores = pd.read_csv(data_dir / 'dep_score.csv')
+        scores.iloc[0, -1] = scores.iloc[0, -1] + 1
+        scores.to_csv(data_dir / 'dep_score.csv', index=False)
+        assert dataset_fingerprint(data_dir) != fingerprint
+        _, _, _, dep_scores = load_dataset(data_dir)
+        assert dep_scores != fresh[3]
+        assert len(list((data_dir / '.parse_cache').glob('dataset_*.npz'))) == 2
+        print("  ✓ Changed inputs invalidate the cache")
+    
+    print("\nResult: Parse cache test passed")
+    return True
+
+
+def test_shortlist_store():
+    """Test the consolidated shortlist membership store and its cache"""
+    import tempfile
+    
+    print("\n" + "="*80)
+    print("TEST 24: Shortlist Store")
+    print("="*80)
+    
+    assert shortlist_key('Adobe (Product).csv') == 'adobe_(product)'
+    assert shortlist_key('google(hardware).csv') != shortlist_key('google_hardware.csv')
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        shortlist_dir = Path(tmp) / 'shortlists'
+        shortlist_dir.mkdir()
+        (shortlist_dir / 'amex.csv').write_text("roll_no\n23CS10001\n23cs10001\n23EE10002\n")
+        (shortlist_dir / 'Google(SWE).csv').write_text("roll_no.\n23EE10002\n\n23MA10003\n")
+        (shortlist_dir / 'headerless.csv').write_text("23CS10001\n23ME10004\n")
+        (shortlist_dir / 'trailing.csv').write_text("roll_no\n21CS1\n\n21CS2\n\n\n")
+        
+        store = load_shortlist_store(shortlist_dir)
+        assert len(store) == 4 and 'google(swe)' in store
+        assert store.size('amex') == 3 and store.members('amex') == ['23CS10001', '23EE10002']
+        assert store.size('google(swe)') == 2 and store.members('google(swe)') == ['23EE10002', '23MA10003']
+        assert store.size('headerless') == 1 and store.members('headerless') == ['23CS10001', '23ME10004']
+        assert store.size('trailing') == 2, "Blank and trailing empty lines are not shortlist rows"
+        assert store.size('missing') == 0 and store.members('missing') == []
+        assert sorted(store.shortlists_of('23ee10002')) == ['amex', 'google(swe)']
+        matrix = store.membership_matrix(['23CS10001', '23MA10003', '99XX00000'], ['amex', 'google(swe)'])
+        assert matrix.tolist() == [[True, False], [False, True], [False, False]]
+        assert store.key_for('American Express_Analyst') == 'amex' and store.key_for('Adobe_Software (MDSR)') is None
+        print("  ✓ Sizes, members and joins match the shortlist files")
+        
+        cache_files = list((Path(tmp) / '.parse_cache').glob('shortlists_*.npz'))
+        assert len(cache_files) == 1
+        cached = load_shortlist_store(shortlist_dir)
+        assert cached.keys == store.keys and cached.members('amex') == store.members('amex')
+        (shortlist_dir / 'amex.csv').write_text("roll_no\n23CS10001\n")
+        assert load_shortlist_store(shortlist_dir).size('amex') == 1
+        print("  ✓ Store is cached and rebuilt when a file changes")
+        
+        (shortlist_dir / 'google(swe) .csv').write_text("roll_no\n")
+        try:
+            ShortlistStore.from_directory(shortlist_dir)
+            assert False, "Clashing keys should be rejected"
+        except ValueError:
+            pass
+        print("  ✓ Clashing shortlist keys are rejected")
+    
+    print("\nResult: Shortlist store test passed")
+    return True
+
+
+def test_scenario_snapshot():
+    """Test that a compiled scenario snapshot reproduces the scenario it was saved from"""
+    import pickle
+    import tempfile
+    from run_simulation import Scenario, SCENARIO_SNAPSHOT_VERSION
+    from monte_carlo import run_single
+    
+    print("\n" + "="*80)
+    print("TEST 25: Scenario Snapshot")
+    print("="*80)
+    
+    scenario = Scenario(*build_small_world())
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'world.snapshot'
+        scenario.save(path)
+        snapshot = Scenario.open(path)
+        
+        assert isinstance(snapshot.eligibility.matrix, np.memmap)
+        assert not snapshot.student_table.cgpa.flags.writeable
+        assert np.array_equal(snapshot.eligibility.matrix, scenario.eligibility.matrix)
+        assert np.array_equal(snapshot.skill_match.score_matrix(), scenario.skill_match.score_matrix())
+        assert snapshot.company_order == scenario.company_order
+        for seed in (3, 4):
+            assert run_single(snapshot, seed, days=(1, 2)) == run_single(scenario, seed, days=(1, 2))
+        print("  ✓ Snapshot runs match the original scenario")
+        
+        # Pickled (e.g. for worker processes) as its path only
+        payload = pickle.dumps(snapshot)
+        assert len(payload) < 500
+        assert run_single(pickle.loads(payload), 3, days=(1, 2)) == run_single(scenario, 3, days=(1, 2))
+        print(f"  ✓ Snapshot scenario pickles to {len(payload)} bytes")
+        
+        arrays, meta = read_snapshot(path)
+        write_snapshot(Path(tmp) / 'old.snapshot', arrays, dict(meta, version=SCENARIO_SNAPSHOT_VERSION + 1))
+        try:
+            Scenario.open(Path(tmp) / 'old.snapshot')
+            assert False, "Other snapshot versions should be rejected"
+        except ValueError:
+            pass
+        print("  ✓ Snapshots of another version are rejected")
+    
+    print("\nResult: Scenario snapshot test passed")
+    return True
+
+
+def test_side_effect_free_import():
+    """Test that importing the engine does no I/O, seeding or pandas import"""
+    import subprocess
+    
+    print("\n" + "="*80)
+    print("TEST 26: Side-Effect-Free Import")
+    print("="*80)
+    
+    script = (
+        "import sys, numpy as np\n"
+        "state = np.random.get_state()[1][:5].tolist()\n"
+        "import placement_simulation, run_simulation, monte_carlo\n"
+        "assert np.random.get_state()[1][:5].tolist() == state, 'import seeded np.random'\n"
+        "assert placement_simulation._DEP_SCORES is None, 'import read dep_score.csv'\n"
+        "assert 'pandas' not in sys.modules, 'import loaded pandas'\n"
+        "from placement_simulation import Student, Company\n"
+        "students = [Student('23CS10001', 'A', 8.0, 'CS', 'SDE', ['Python'])]\n"
+        "companies = [Company('Alpha', 'SDE', ['ALL'], 7.0, ['python'], 1, 1, 1, 2)]\n"
+        "sim = run_simulation.PlacementSimulation(students, companies, {1: ['Alpha']}, seed=1,\n"
+        "                                         logger=run_simulation.SILENT_LOGGER)\n"
+        "sim.simulate_day(1)\n"
+        "assert 'pandas' not in sys.modules, 'simulation loaded pandas'\n"
+        "assert placement_simulation.DEP_SCORES.get('CS') is not None\n"
+        "assert placement_simulation.DEP_SCORES.get('NA') == 3.0, 'NA is a department code'\n"
+    )
+    # '--seed' used to make run_simulation reload placement_simulation at import
+    result = subprocess.run([sys.executable, '-c', script, '--seed', '7'], cwd=str(Path(__file__).parent),
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    print("  ✓ Import leaves RNGs, files and pandas alone; a simulation runs without pandas")
+    
+    print("\nResult: Side-effect-free import test passed")
+    return True
+
+
+def test_synthetic_dataset():
+    """Test that generated datasets are reproducible, loadable and match the source mix"""
+    import hashlib
+    import tempfile
+    import pandas as pd
+    from synthetic_data import generate_dataset
+    
+    print("\n" + "="*80)
+    print("TEST 27: Synthetic Dataset")
+    print("="*80)
+    
+    source = Path(__file__).parent.parent
+    
+    def digest(directory):
+        files = sorted(p for p in Path(directory).rglob('*.csv'))
+        return hashlib.sha256(b''.join(p.name.encode() + p.read_bytes() for p in files)).hexdigest()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        serial, parallel = Path(tmp) / 'serial', Path(tmp) / 'parallel'
+        summary = generate_dataset(source, serial, 3000, seed=5, chunk_size=1000, workers=1)
+        generate_dataset(source, parallel, 3000, seed=5, chunk_size=1000, workers=2)
+        assert summary['chunks'] == 3 and summary['shortlists'] > 0
+        assert digest(serial) == digest(parallel), "Output must not depend on the number of workers"
+        print("  ✓ Same seed and chunking give identical files with 1 or 2 workers")
+        
+        students, companies, company_order, dep_scores = load_dataset(serial, use_cache=False)
+        assert len(students) == 3000 and len({s.roll_no for s in students}) == 3000
+        assert all(6.0 <= s.cgpa <= 10.0 for s in students)
+        assert any(c.interview_slots > 2 * c.max_hires for c in companies)
+        
+        real = pd.read_csv(source / 'analysis_data.csv').drop_duplicates('roll_no')
+        fake = pd.read_csv(serial / 'analysis_data.csv')
+        for column in (lambda df: df['roll_no'].str[2:4], lambda df: df['domain_1']):
+            shares = pd.concat([column(real).value_counts(normalize=True),
+                                column(fake).value_counts(normalize=True)], axis=1).fillna(0)
+            assert (shares.iloc[:, 0] - shares.iloc[:, 1]).abs().max() < 0.03
+        assert abs(real['cgpa'].mean() - fake['cgpa'].mean()) < 0.1
+        print("  ✓ Department, domain and CGPA distributions follow the source")
+    
+    print("\nResult: Synthetic dataset test passed")
+    return True
+
+
+def test_benchmark_suite():
+    """Test that the benchmark suite reports every stage as JSON on a fixture"""
+    import json
+    import tempfile
+    from benchmark import run_benchmarks, FIXTURES
+    from run_simulation import STEP_NAMES as STEPS
+    
+    print("\n" + "="*80)
+    print("TEST 28: Benchmark Suite")
+    print("="*80)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        report = run_benchmarks(['S'], tmp, repeat=1, mc_runs=2, dashboard=False, log=lambda message: None)
+        assert (Path(tmp) / f"S-{FIXTURES['S']}-seed0" / 'analysis_data.csv').exists()
+    
+    report = json.loads(json.dumps(report))
+    fixture = report['fixtures']['S']
+    assert fixture['students'] == FIXTURES['S'] and fixture['companies'] > 0
+    print(f"  ✓ S fixture: {fixture['students']} students, {fixture['companies']} companies")
+    
+    stages = dict(fixture['loaders'], **fixture['simulation'])
+    for stage in ['load_dataset.parse', 'load_dataset.cached', 'scenario.open', 'simulate_day'] + STEPS:
+        assert stages[stage]['repeat'] == 1 and stages[stage]['mean_s'] >= 0, stage
+    assert fixture['monte_carlo']['runs'] == 2 and fixture['monte_carlo']['runs_per_s'] > 0
+    assert 'skipped' in fixture['dashboard']
+    print(f"  ✓ Loaders, {len(STEPS)} steps, simulate_day and Monte Carlo throughput reported")
+    
+    print("\nResult: Benchmark suite test passed")
+    return True
+
+
+def test_step_timings_and_counters():
+    """Test per-step timings, per-company times and hot-path counters in stats and exports"""
+    import io
+    import json
+    import tempfile
+    import contextlib
+    from run_simulation import PlacementSimulation, JsonLinesSink, SILENT_LOGGER, STEP_NAMES, COUNTER_NAMES
+    
+    print("\n" + "="*80)
+    print("TEST 29: Step Timings and Counters")
+    print("="*80)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'summaries.jsonl'
+        with JsonLinesSink(path) as sink:
+            sim = PlacementSimulation(*build_small_world(), seed=21, logger=SILENT_LOGGER, summary_sink=sink)
+            sim.simulate_season()
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        with contextlib.redirect_stdout(io.StringIO()):
+            sim.export_results(Path(tmp) / 'results.csv', stats_file=Path(tmp) / 'stats.json')
+        exported = json.loads((Path(tmp) / 'stats.json').read_text())
+        checkpoint = sim.checkpoint()
+    
+    timings, counters = sim.stats['timings'], sim.stats['counters']
+    assert sorted(timings['days']) == [1, 2]
+    for times in timings['days'].values():
+        assert list(times) == STEP_NAMES + ['total'] and all(t >= 0 for t in times.values())
+        assert sum(times[step] for step in STEP_NAMES) <= times['total']
+    assert [(r['day'], r['serial']) for r in timings['serials']] == [(1, 1), (1, 2), (2, 2)]
+    assert set(timings['companies']) == set(sim.companies)
+    assert set(sim.slowest(1)[0][:2]) <= set(sim.companies) | set(STEP_NAMES)
+    print(f"  ✓ {len(timings['serials'])} serial and {len(timings['days'])} day timing records, "
+          f"{len(timings['companies'])} companies timed")
+    
+    assert list(counters) == COUNTER_NAMES and all(counters[name] > 0 for name in
+                                                    ('eligibility_checks', 'skill_match_evaluations', 'rng_draws'))
+    assert counters['skill_cache_hits'] + counters['skill_cache_misses'] == \
+        sum(len(sim.schedule.companies_for(day, serial)) for day in (1, 2) for serial in sim.schedule.serials)
+    print(f"  ✓ Counters: {counters}")
+    
+    serials = [r for r in records if r['event'] == 'serial_summary']
+    assert all(set(r['step_times']) == set(STEP_NAMES) for r in serials)
+    assert records[-1]['counters'] == counters and exported['counters'] == counters
+    assert len(exported['timings']['serials']) == 3
+    print("  ✓ Timings and counters in summary records and exported stats")
+    
+    resumed = PlacementSimulation(*build_small_world(), seed=21, logger=SILENT_LOGGER)
+    resumed.restore_checkpoint(checkpoint)
+    assert resumed.stats['counters'] == counters and sorted(resumed.stats['timings']['days']) == [1, 2]
+    print("  ✓ Restored from a checkpoint")
+    
+    print("\nResult: Step timings test passed")
+    return True
+
+
+def test_spawned_seeding():
+    """Test SeedSequence-spawned run streams and worker-count independent aggregates"""
+    from run_simulation import Scenario, CommonRandomNumbers, spawn_seeds, seed_label
+    from monte_carlo import aggregate_monte_carlo, run_monte_carlo, run_until_precise
+    
+    print("\n" + "="*80)
+    print("TEST 30: Spawned Seeding")
+    print("="*80)
+    
+    # Run k's stream is child k of the root, however the runs are split up
+    seeds = spawn_seeds(7, 12)
+    children = np.random.SeedSequence(7).spawn(12)
+    assert all((a.generate_state(4) == b.generate_state(4)).all() for a, b in zip(seeds, children))
+    assert [seed_label(s) for s in spawn_seeds(7, 2, start=10)] == ['7/10', '7/11']
+    assert seed_label(42) == 42
+    print("  ✓ spawn_seeds matches SeedSequence.spawn, labels '7/0', '7/1', ...")
+    
+    # Per-company CRN streams are children of the run stream
+    crn = CommonRandomNumbers(seeds[0], 5)
+    assert not np.array_equal(crn.uniforms('R1', (0,)), crn.uniforms('R1', (1,)))
+    assert np.array_equal(crn.uniforms('R1', (1,)), CommonRandomNumbers(spawn_seeds(7, 1)[0], 5).uniforms('R1', (1,)))
+    
+    scenario = Scenario(*build_small_world())
+    serial = aggregate_monte_carlo(scenario, seeds, workers=1, days=(1, 2)).summary()
+    parallel = aggregate_monte_carlo(scenario, seeds, workers=2, days=(1, 2)).summary()
+    assert serial == parallel, "Aggregates must be bit-identical for any number of workers"
+    runs = run_monte_carlo(scenario, seeds[:4], workers=2, days=(1, 2), crn=True)
+    assert runs == run_monte_carlo(scenario, seeds[:4], workers=1, days=(1, 2), crn=True)
+    assert [r['seed'] for r in runs] == ['7/0', '7/1', '7/2', '7/3']
+    print(f"  ✓ {serial['n_runs']} runs give identical aggregates with 1 and 2 workers")
+    
+    results = [run_until_precise(scenario, 'total_placed', ci_width=2.0, root_seed=7, min_runs=4, max_runs=24,
+                                 workers=w, days=(1, 2)) for w in (1, 2)]
+    assert results[0]['n_replicates'] == results[1]['n_replicates']
+    assert results[0]['aggregator'].summary() == results[1]['aggregator'].summary()
+    print(f"  ✓ Sequential stopping: {results[0]['n_replicates']} runs with 1 or 2 workers")
+    
+    print("\nResult: Spawned seeding test passed")
+    return True
+
+
+def test_deferred_acceptance():
+    """Test the stable-matching acceptance mode against brute-force stability checks"""
+    from placement_simulation import deferred_acceptance, SimulationConfig, STATUS_PLACED
+    from run_simulation import Scenario, SILENT_LOGGER
+    from monte_carlo import make_config
+    
+    print("\n" + "="*80)
+    print("TEST 31: Deferred Acceptance")
+    print("="*80)
+    
+    # Both companies want student 0 first; 0 prefers company 1, so company 0 takes its next choice
+    hired = deferred_acceptance([np.array([0, 1]), np.array([0, 2])], [1, 1],
+                                [np.array([0.2, 0.9]), np.array([0.8, 0.5])])
+    assert [h.tolist() for h in hired] == [[1], [0]]
+    
+    rng = np.random.default_rng(5)
+    for trial in range(30):
+        n_companies, n_students = 4, 25
+        candidates = [np.sort(rng.choice(n_students, size=rng.integers(0, 12), replace=False))
+                      for _ in range(n_companies)]
+        candidates = [rows[rng.permutation(len(rows))] for rows in candidates]  # company rankings
+        capacities = rng.integers(0, 5, size=n_companies)
+        utility = rng.random((n_students, n_companies))
+        preferences = [utility[rows, c] for c, rows in enumerate(candidates)]
+        hired = deferred_acceptance(candidates, capacities, preferences)
+        
+        match = {}
+        for c, rows in enumerate(hired):
+            assert len(rows) <= capacities[c]
+            for row in rows.tolist():
+                assert row not in match, "A student is hired at most once"
+                match[row] = c
+        for c, rows in enumerate(candidates):
+            rank = {row: i for i, row in enumerate(rows.tolist())}
+            worst = max((rank[r] for r in hired[c].tolist()), default=-1)
+            for row in rows.tolist():
+                prefers_c = row not in match or utility[row, c] > utility[row, match[row]]
+                wants_row = len(hired[c]) < capacities[c] or rank[row] < worst
+                assert not (prefers_c and wants_row), f"Blocking pair (student {row}, company {c})"
+        
+        # Processing companies in another order gives the same matching
+        flip = deferred_acceptance(candidates[::-1], capacities[::-1], preferences[::-1])[::-1]
+        assert all(np.array_equal(a, b) for a, b in zip(hired, flip))
+    print("  ✓ 30 random instances: capacities respected, no blocking pairs, order independent")
+    
+    try:
+        SimulationConfig(acceptance_mode='lottery')
+        assert False, "Unknown modes are rejected"
+    except ValueError:
+        pass
+    
+    scenario = Scenario(*build_small_world())
+    config = make_config({'acceptance_mode': 'deferred'})
+    runs = []
+    for _ in range(2):
+        sim = scenario.new_simulation(31, logger=SILENT_LOGGER, config=config)
+        sim.simulate_season()
+        runs.append(sim)
+    table = runs[0].company_table
+    for j in range(len(table.company_name)):
+        assert np.array_equal(table.offered[j], table.hired[j]), "Every offer made is accepted"
+        assert len(table.hired[j]) <= table.target_hires[j]
+    assert runs[0].results_frame().equals(runs[1].results_frame()), "Same seed, same matching"
+    placed = runs[0].student_table.count(STATUS_PLACED)
+    print(f"  ✓ Season with deferred acceptance: {placed} placed, no wasted offers, reproducible")
+
+    # The acceptance mode can be swept, also into a store created before the column existed
+    import sqlite3
+    import tempfile
+    from pathlib import Path
+    from sweep import SweepStore, parse_space, grid_design, run_sweep
+
+    space = parse_space(['acceptance_mode=random,deferred', 'p_opt_out=0.1'], random=False)
+    assert space == {'acceptance_mode': ['random', 'deferred'], 'p_opt_out': [0.1]}
+    for specs, random in [(['acceptance_mode=lottery'], False), (['acceptance_mode=random:deferred'], True)]:
+        try:
+            parse_space(specs, random)
+            assert False, f"{specs} should be rejected"
+        except ValueError:
+            pass
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'old.sqlite'
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE points (point_id INTEGER PRIMARY KEY, p_opt_out REAL)")
+        store = run_sweep(scenario, grid_design(space), [31], store=SweepStore(path), workers=1)
+        assert store.runs_frame()['acceptance_mode'].tolist() == ['random', 'deferred']
+        store.close()
+    print("  ✓ Sweep over acceptance modes, old store migrated")
+
+    print("\nResult: Deferred acceptance test passed")
+    return True
+
+
 def run_all_tests():
     """Run all unit tests"""
     print("\n" + "="*80)
@@ -242,7 +1263,31 @@ def run_all_tests():
         test_eligibility_checks,
         test_student_creation,
         test_company_creation,
-        test_scoring_functions
+        test_scoring_functions,
+        test_eligibility_matrix,
+        test_skill_profile_cache,
+        test_skill_vocabulary,
+        test_skill_bitsets,
+        test_simulation_rng_streams,
+        test_top_k_selection,
+        test_columnar_tables,
+        test_company_schedule,
+        test_season_checkpoints,
+        test_monte_carlo_runner,
+        test_streaming_aggregation,
+        test_parameter_sweep,
+        test_variance_reduction,
+        test_logging_and_summaries,
+        test_simulation_config,
+        test_parse_cache,
+        test_shortlist_store,
+        test_scenario_snapshot,
+        test_side_effect_free_import,
+        test_synthetic_dataset,
+        test_benchmark_suite,
+        test_step_timings_and_counters,
+        test_spawned_seeding,
+        test_deferred_acceptance
     ]
     
     results = []